@@ -0,0 +1,73 @@
+"""Add order archive tables
+
+Revision ID: 3f7c9a1e5d20
+Revises: 9d4b2f6e8a13
+Create Date: 2026-10-18 23:12:48.271930
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f7c9a1e5d20'
+down_revision: Union[str, Sequence[str], None] = '9d4b2f6e8a13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ORDER_STATUS = sa.Enum('PENDING', 'CONFIRMED', 'PREPARING', 'READY', 'COMPLETED', 'CANCELLED', name='orderstatus')
+
+
+def _table_exists(table: str) -> bool:
+    """앱 시작 시 create_all 로 이미 생성된 경우 건너뜀"""
+    return table in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if not _table_exists('orders_archive'):
+        op.create_table(
+            'orders_archive',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('user_id', sa.Integer(), nullable=True),
+            sa.Column('total_amount', sa.Integer(), nullable=True),
+            sa.Column('status', ORDER_STATUS, nullable=True),
+            sa.Column('customer_name', sa.String(length=50), nullable=True),
+            sa.Column('customer_phone', sa.String(length=20), nullable=True),
+            sa.Column('pickup_time', sa.DateTime(), nullable=True),
+            sa.Column('notes', sa.Text(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), nullable=True),
+            sa.Column('updated_at', sa.DateTime(), nullable=True),
+            sa.Column('archived_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_orders_archive_created_at_id', 'orders_archive', ['created_at', 'id'], unique=False)
+        op.create_index('ix_orders_archive_status_created_at_id', 'orders_archive', ['status', 'created_at', 'id'], unique=False)
+
+    if not _table_exists('order_items_archive'):
+        op.create_table(
+            'order_items_archive',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('order_id', sa.Integer(), nullable=True),
+            sa.Column('menu_id', sa.Integer(), nullable=True),
+            sa.Column('quantity', sa.Integer(), nullable=True),
+            sa.Column('price', sa.Integer(), nullable=True),
+            sa.Column('subtotal', sa.Integer(), nullable=True),
+            sa.Column('options', sa.String(length=200), nullable=True),
+            sa.ForeignKeyConstraint(['order_id'], ['orders_archive.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index('ix_order_items_archive_order_id', 'order_items_archive', ['order_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _table_exists('order_items_archive'):
+        op.drop_index('ix_order_items_archive_order_id', table_name='order_items_archive')
+        op.drop_table('order_items_archive')
+    if _table_exists('orders_archive'):
+        op.drop_index('ix_orders_archive_status_created_at_id', table_name='orders_archive')
+        op.drop_index('ix_orders_archive_created_at_id', table_name='orders_archive')
+        op.drop_table('orders_archive')
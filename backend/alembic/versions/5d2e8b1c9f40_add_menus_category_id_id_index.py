@@ -0,0 +1,28 @@
+"""Add menus (category_id, id) index for keyset pagination
+
+Revision ID: 5d2e8b1c9f40
+Revises: a8c17e2f6ca1
+Create Date: 2026-10-18 10:12:40.512331
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5d2e8b1c9f40'
+down_revision: Union[str, Sequence[str], None] = 'a8c17e2f6ca1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_menus_category_id_id', 'menus', ['category_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_menus_category_id_id', table_name='menus')
@@ -0,0 +1,45 @@
+"""Add orders version
+
+Revision ID: 6a1d8e4c7b92
+Revises: 3f7c9a1e5d20
+Create Date: 2026-10-19 09:14:52.730861
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a1d8e4c7b92'
+down_revision: Union[str, Sequence[str], None] = '3f7c9a1e5d20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TABLES = ('orders', 'orders_archive')
+
+
+def _existing_columns(table: str):
+    """테이블이 없으면 None (앱 시작 시 create_all 로 생성되며 그때 컬럼도 함께 생성됨)"""
+    inspector = sa.inspect(op.get_bind())
+    if table not in inspector.get_table_names():
+        return None
+    return {column['name'] for column in inspector.get_columns(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in TABLES:
+        columns = _existing_columns(table)
+        if columns is not None and 'version' not in columns:
+            op.add_column(table, sa.Column('version', sa.Integer(), server_default='1', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in TABLES:
+        columns = _existing_columns(table)
+        if columns and 'version' in columns:
+            with op.batch_alter_table(table) as batch_op:
+                batch_op.drop_column('version')
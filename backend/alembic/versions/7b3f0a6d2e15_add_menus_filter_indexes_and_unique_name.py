@@ -0,0 +1,41 @@
+"""Add menus filter indexes and (category_id, name) unique constraint
+
+Revision ID: 7b3f0a6d2e15
+Revises: 5d2e8b1c9f40
+Create Date: 2026-10-18 14:03:27.118902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b3f0a6d2e15'
+down_revision: Union[str, Sequence[str], None] = '5d2e8b1c9f40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 기존 데이터에 중복 메뉴명이 있으면 제약 조건 생성이 실패하므로 먼저 알림
+    duplicates = op.get_bind().execute(sa.text(
+        "SELECT category_id, name, COUNT(*) FROM menus "
+        "GROUP BY category_id, name HAVING COUNT(*) > 1"
+    )).fetchall()
+    if duplicates:
+        listed = ", ".join(f"({row[0]}, {row[1]!r})" for row in duplicates[:20])
+        raise RuntimeError(f"같은 카테고리에 중복된 메뉴명이 있어 마이그레이션을 진행할 수 없습니다: {listed}")
+
+    op.create_index('ix_menus_category_id_is_available_id', 'menus', ['category_id', 'is_available', 'id'], unique=False)
+    op.create_index('ix_menus_is_available_category_id_id', 'menus', ['is_available', 'category_id', 'id'], unique=False)
+    op.create_unique_constraint('uq_menus_category_id_name', 'menus', ['category_id', 'name'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('uq_menus_category_id_name', 'menus', type_='unique')
+    op.drop_index('ix_menus_is_available_category_id_id', table_name='menus')
+    op.drop_index('ix_menus_category_id_is_available_id', table_name='menus')
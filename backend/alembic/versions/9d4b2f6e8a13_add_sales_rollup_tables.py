@@ -0,0 +1,65 @@
+"""Add sales rollup tables
+
+Revision ID: 9d4b2f6e8a13
+Revises: e5a83c1f9b27
+Create Date: 2026-10-18 21:37:15.604219
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4b2f6e8a13'
+down_revision: Union[str, Sequence[str], None] = 'e5a83c1f9b27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table: str) -> bool:
+    """앱 시작 시 create_all 로 이미 생성된 경우 건너뜀"""
+    return table in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    """Upgrade schema.
+
+    기존 완료 주문은 scripts/backfill_sales_rollups.py 로 집계
+    """
+    if not _table_exists('sales_hourly'):
+        op.create_table(
+            'sales_hourly',
+            sa.Column('bucket_start', sa.DateTime(), nullable=False),
+            sa.Column('menu_id', sa.Integer(), nullable=False),
+            sa.Column('category_id', sa.Integer(), nullable=True),
+            sa.Column('quantity', sa.Integer(), nullable=False),
+            sa.Column('revenue', sa.Integer(), nullable=False),
+            sa.Column('order_count', sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint('bucket_start', 'menu_id')
+        )
+        op.create_index('ix_sales_hourly_category_id_bucket_start', 'sales_hourly', ['category_id', 'bucket_start'], unique=False)
+
+    if not _table_exists('sales_daily'):
+        op.create_table(
+            'sales_daily',
+            sa.Column('bucket_date', sa.Date(), nullable=False),
+            sa.Column('menu_id', sa.Integer(), nullable=False),
+            sa.Column('category_id', sa.Integer(), nullable=True),
+            sa.Column('quantity', sa.Integer(), nullable=False),
+            sa.Column('revenue', sa.Integer(), nullable=False),
+            sa.Column('order_count', sa.Integer(), nullable=False),
+            sa.PrimaryKeyConstraint('bucket_date', 'menu_id')
+        )
+        op.create_index('ix_sales_daily_category_id_bucket_date', 'sales_daily', ['category_id', 'bucket_date'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _table_exists('sales_daily'):
+        op.drop_index('ix_sales_daily_category_id_bucket_date', table_name='sales_daily')
+        op.drop_table('sales_daily')
+    if _table_exists('sales_hourly'):
+        op.drop_index('ix_sales_hourly_category_id_bucket_start', table_name='sales_hourly')
+        op.drop_table('sales_hourly')
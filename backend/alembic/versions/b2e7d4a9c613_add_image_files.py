@@ -0,0 +1,50 @@
+"""Add image files
+
+Revision ID: b2e7d4a9c613
+Revises: 6a1d8e4c7b92
+Create Date: 2026-10-20 10:31:08.402917
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b2e7d4a9c613'
+down_revision: Union[str, Sequence[str], None] = '6a1d8e4c7b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table: str) -> bool:
+    """앱 시작 시 create_all 로 이미 생성된 경우 건너뜀"""
+    return table in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _table_exists('image_files'):
+        return
+    op.create_table(
+        'image_files',
+        sa.Column('content_hash', sa.String(length=64), nullable=False),
+        sa.Column('size', sa.Integer(), nullable=False),
+        sa.Column('width', sa.Integer(), nullable=False),
+        sa.Column('height', sa.Integer(), nullable=False),
+        sa.Column('ref_count', sa.Integer(), nullable=False),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('content_hash')
+    )
+    op.create_index(
+        'ix_image_files_ref_count_updated_at', 'image_files', ['ref_count', 'updated_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _table_exists('image_files'):
+        op.drop_index('ix_image_files_ref_count_updated_at', table_name='image_files')
+        op.drop_table('image_files')
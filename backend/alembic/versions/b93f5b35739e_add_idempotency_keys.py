@@ -0,0 +1,49 @@
+"""Add idempotency keys
+
+Revision ID: b93f5b35739e
+Revises: b2e7d4a9c613
+Create Date: 2026-10-20 14:05:37.291846
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b93f5b35739e'
+down_revision: Union[str, Sequence[str], None] = 'b2e7d4a9c613'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table: str) -> bool:
+    """앱 시작 시 create_all 로 이미 생성된 경우 건너뜀"""
+    return table in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _table_exists('idempotency_keys'):
+        return
+    op.create_table(
+        'idempotency_keys',
+        sa.Column('key', sa.String(length=100), nullable=False),
+        sa.Column('fingerprint', sa.String(length=64), nullable=True),
+        sa.Column('status_code', sa.Integer(), nullable=True),
+        sa.Column('response_body', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.Column('expires_at', sa.DateTime(), nullable=True),
+        sa.PrimaryKeyConstraint('key')
+    )
+    op.create_index(
+        op.f('ix_idempotency_keys_expires_at'), 'idempotency_keys', ['expires_at'], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _table_exists('idempotency_keys'):
+        op.drop_index(op.f('ix_idempotency_keys_expires_at'), table_name='idempotency_keys')
+        op.drop_table('idempotency_keys')
@@ -0,0 +1,53 @@
+"""Add orders listing indexes
+
+Revision ID: c41e9d7a2b68
+Revises: 7b3f0a6d2e15
+Create Date: 2026-10-18 16:21:09.532417
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41e9d7a2b68'
+down_revision: Union[str, Sequence[str], None] = '7b3f0a6d2e15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _existing_indexes(table: str):
+    """테이블이 없으면 None (주문 테이블은 앱 시작 시 create_all 로 생성되며 그때 인덱스도 함께 생성됨)"""
+    inspector = sa.inspect(op.get_bind())
+    if table not in inspector.get_table_names():
+        return None
+    return {index['name'] for index in inspector.get_indexes(table)}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    orders = _existing_indexes('orders')
+    if orders is not None:
+        if 'ix_orders_created_at_id' not in orders:
+            op.create_index('ix_orders_created_at_id', 'orders', ['created_at', 'id'], unique=False)
+        if 'ix_orders_status_created_at_id' not in orders:
+            op.create_index('ix_orders_status_created_at_id', 'orders', ['status', 'created_at', 'id'], unique=False)
+
+    order_items = _existing_indexes('order_items')
+    if order_items is not None and 'ix_order_items_order_id' not in order_items:
+        op.create_index('ix_order_items_order_id', 'order_items', ['order_id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    order_items = _existing_indexes('order_items')
+    if order_items and 'ix_order_items_order_id' in order_items:
+        op.drop_index('ix_order_items_order_id', table_name='order_items')
+
+    orders = _existing_indexes('orders')
+    if orders and 'ix_orders_status_created_at_id' in orders:
+        op.drop_index('ix_orders_status_created_at_id', table_name='orders')
+    if orders and 'ix_orders_created_at_id' in orders:
+        op.drop_index('ix_orders_created_at_id', table_name='orders')
@@ -0,0 +1,43 @@
+"""Add pickup slots
+
+Revision ID: e5a83c1f9b27
+Revises: c41e9d7a2b68
+Create Date: 2026-10-18 19:02:44.118305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a83c1f9b27'
+down_revision: Union[str, Sequence[str], None] = 'c41e9d7a2b68'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _table_exists(table: str) -> bool:
+    """앱 시작 시 create_all 로 이미 생성된 경우 건너뜀"""
+    return table in sa.inspect(op.get_bind()).get_table_names()
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if _table_exists('pickup_slots'):
+        return
+    op.create_table(
+        'pickup_slots',
+        sa.Column('slot_start', sa.DateTime(), nullable=False),
+        sa.Column('capacity', sa.Integer(), nullable=False),
+        sa.Column('reserved', sa.Integer(), nullable=False),
+        sa.Column('updated_at', sa.DateTime(), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint('slot_start')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if _table_exists('pickup_slots'):
+        op.drop_table('pickup_slots')
@@ -0,0 +1,105 @@
+"""
+Authentication Dependencies
+
+Authorization: Bearer <토큰> 헤더로 요청 주체를 확인하는 의존성
+- get_current_principal: 로그인한 활성 사용자 (아니면 401)
+- require_admin: 관리자 (아니면 403), 관리자 라우터 전체와 메뉴/카테고리 변경, 주문 상태 변경에 적용
+
+요청 제한 의존성 (app/core/rate_limit.py 의 토큰 버킷)
+- rate_limit(정책, 키 함수): 한도를 넘으면 429 (Retry-After)
+- 라우트 데코레이터의 dependencies 로 지정해 get_async_db 보다 먼저 실행 (거절된 요청은 세션을 열지 않음)
+"""
+import math
+from typing import Awaitable, Callable, Optional
+
+from fastapi import Depends, HTTPException, Request
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.rate_limit import rate_limiters
+from app.core.security import InvalidToken, Principal, decode_access_token
+from app.db.base import get_async_db
+from app.services.user import resolve_principal
+
+bearer_scheme = HTTPBearer(auto_error=False)
+
+def _unauthorized(detail: str) -> HTTPException:
+    return HTTPException(status_code=401, detail=detail, headers={"WWW-Authenticate": "Bearer"})
+
+async def get_current_principal(
+    credentials: Optional[HTTPAuthorizationCredentials] = Depends(bearer_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> Principal:
+    """토큰의 사용자 (캐시 적중 시 DB 조회 없음)"""
+    if credentials is None:
+        raise _unauthorized("로그인이 필요합니다")
+    try:
+        principal = await resolve_principal(db, credentials.credentials)
+    except InvalidToken:
+        raise _unauthorized("유효하지 않거나 만료된 토큰입니다")
+    except Exception as e:
+        logger.error(f"인증 확인 실패: {e}")
+        raise HTTPException(status_code=500, detail="인증 확인 중 오류가 발생했습니다")
+    if principal is None or not principal.is_active:
+        raise _unauthorized("사용할 수 없는 계정입니다")
+    return principal
+
+async def require_admin(principal: Principal = Depends(get_current_principal)) -> Principal:
+    """관리자 전용 엔드포인트용"""
+    if not principal.is_admin:
+        raise HTTPException(status_code=403, detail="관리자 권한이 필요합니다")
+    return principal
+
+RateLimitKey = Callable[[Request], Awaitable[Optional[str]]]
+
+async def client_ip(request: Request) -> Optional[str]:
+    """클라이언트 IP (RATE_LIMIT_TRUST_FORWARDED 이면 X-Forwarded-For 첫 주소)"""
+    if settings.RATE_LIMIT_TRUST_FORWARDED:
+        forwarded = request.headers.get("x-forwarded-for")
+        if forwarded:
+            return forwarded.split(",")[0].strip()
+    return request.client.host if request.client else None
+
+async def token_user_id(request: Request) -> Optional[str]:
+    """토큰의 사용자 ID (서명만 검증, DB 조회 없음), 토큰이 없거나 잘못되면 None"""
+    credentials = await bearer_scheme(request)
+    if credentials is None:
+        return None
+    try:
+        return str(decode_access_token(credentials.credentials)[0])
+    except InvalidToken:
+        return None
+
+async def order_phone(request: Request) -> Optional[str]:
+    """주문 본문의 customer_phone (숫자만), 본문이 올바르지 않으면 None (검증 오류는 엔드포인트에서)"""
+    try:
+        body = await request.json()  # FastAPI 가 이미 읽은 본문 재사용
+    except ValueError:
+        return None
+    phone = body.get("customer_phone") if isinstance(body, dict) else None
+    if not isinstance(phone, str):
+        return None
+    return "".join(c for c in phone if c.isdigit()) or None
+
+def rate_limit(policy: str, key: RateLimitKey) -> Callable[[Request], Awaitable[None]]:
+    """정책의 토큰 버킷에서 키별로 토큰 1개 소비 (키가 없으면 제한하지 않음)"""
+    limiter = rate_limiters[policy]
+
+    async def dependency(request: Request) -> None:
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        value = await key(request)
+        if value is None:
+            return
+        retry_after = limiter.acquire(value)
+        if retry_after:
+            logger.warning(f"요청 제한 초과 ({policy}): {value}")
+            raise HTTPException(
+                status_code=429,
+                detail="요청이 너무 많습니다. 잠시 후 다시 시도해주세요",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
+
+    return dependency
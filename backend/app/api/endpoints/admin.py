@@ -0,0 +1,180 @@
+from datetime import date, datetime, timedelta
+from typing import List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import require_admin
+from app.api.pagination import decode_cursor, encode_cursor
+from app.core.config import settings
+from app.core.logger import logger
+from app.core.security import Principal, principal_cache
+from app.db.base import get_async_db
+from app.models.order import OrderStatus
+from app.schemas.order import OrderSummary
+from app.schemas.stats import CategorySales, DailySales, HourlySales, MenuSales
+from app.schemas.user import User as UserSchema, UserAccessUpdate
+from app.services.order import list_order_summaries
+from app.services.order_export import (
+    MEDIA_TYPES, ExportDataset, ExportFormat, export_chunks, export_filename, export_range
+)
+from app.services.sales_stats import category_sales, daily_sales, hourly_sales, menu_sales
+from app.services.user import UserNotFound, update_access
+
+# 모든 관리자 엔드포인트는 관리자 토큰 필요 (권한은 캐시에서 확인하므로 보통 추가 쿼리 없음)
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+@router.get("/admin/orders", response_model=List[OrderSummary])
+async def get_order_list(
+    response: Response,
+    status: Optional[List[OrderStatus]] = Query(None, description="주문 상태로 필터링 (여러 개 가능)"),
+    created_from: Optional[datetime] = Query(None, description="이 시각 이후 주문 (포함)"),
+    created_to: Optional[datetime] = Query(None, description="이 시각 이전 주문 (미포함)"),
+    cursor: Optional[str] = Query(None, description="이전 응답의 X-Next-Cursor 값"),
+    limit: int = Query(
+        settings.DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=settings.MAX_PAGE_SIZE,
+        description="조회할 최대 개수"
+    ),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    관리자 주문 목록 조회 (최신순)
+
+    주문 항목은 로딩하지 않고 item_count 만 집계하며,
+    다음 페이지가 있으면 X-Next-Cursor 헤더로 커서를 반환
+    """
+    before = decode_cursor(cursor, (datetime.fromisoformat, int)) if cursor else None
+    try:
+        orders, next_key = await list_order_summaries(
+            db, limit, status, created_from, created_to, before
+        )
+        if next_key:
+            response.headers["X-Next-Cursor"] = encode_cursor(next_key)
+
+        logger.info(f"관리자 주문 목록 조회: 상태={status}, 개수={len(orders)}")
+        return orders
+    except Exception as e:
+        logger.error(f"관리자 주문 목록 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail="주문 목록 조회 중 오류가 발생했습니다")
+
+def stats_range(date_from: Optional[date], date_to: Optional[date]) -> Tuple[date, date]:
+    """통계 조회 기간 (기본: 오늘까지 STATS_DEFAULT_RANGE_DAYS 일, 양 끝 포함)"""
+    date_to = date_to or date.today()
+    date_from = date_from or date_to - timedelta(days=settings.STATS_DEFAULT_RANGE_DAYS - 1)
+    if date_from > date_to:
+        raise HTTPException(status_code=400, detail="시작일이 종료일보다 늦습니다")
+    if (date_to - date_from).days >= settings.STATS_MAX_RANGE_DAYS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"조회 기간은 최대 {settings.STATS_MAX_RANGE_DAYS}일입니다"
+        )
+    return date_from, date_to
+
+@router.get("/admin/stats/daily", response_model=List[DailySales])
+async def get_daily_sales(
+    date_from: Optional[date] = Query(None, description="시작일 (포함)"),
+    date_to: Optional[date] = Query(None, description="종료일 (포함, 기본: 오늘)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """일별 판매 수량/매출 (완료된 주문, 주문 일자 기준)"""
+    date_from, date_to = stats_range(date_from, date_to)
+    try:
+        return await daily_sales(db, date_from, date_to)
+    except Exception as e:
+        logger.error(f"일별 판매 통계 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail="통계 조회 중 오류가 발생했습니다")
+
+@router.get("/admin/stats/hourly", response_model=List[HourlySales])
+async def get_hourly_sales(
+    day: Optional[date] = Query(None, description="조회할 날짜 (기본: 오늘)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """하루의 시간별 판매 수량/매출"""
+    try:
+        return await hourly_sales(db, day or date.today())
+    except Exception as e:
+        logger.error(f"시간별 판매 통계 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail="통계 조회 중 오류가 발생했습니다")
+
+@router.get("/admin/stats/menus", response_model=List[MenuSales])
+async def get_menu_sales(
+    date_from: Optional[date] = Query(None, description="시작일 (포함)"),
+    date_to: Optional[date] = Query(None, description="종료일 (포함, 기본: 오늘)"),
+    category_id: Optional[int] = Query(None, description="카테고리로 필터링"),
+    limit: int = Query(20, ge=1, le=settings.MAX_PAGE_SIZE, description="조회할 메뉴 수"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """메뉴별 판매 순위 (매출 내림차순)"""
+    date_from, date_to = stats_range(date_from, date_to)
+    try:
+        return await menu_sales(db, date_from, date_to, category_id, limit)
+    except Exception as e:
+        logger.error(f"메뉴별 판매 통계 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail="통계 조회 중 오류가 발생했습니다")
+
+@router.get("/admin/stats/categories", response_model=List[CategorySales])
+async def get_category_sales(
+    date_from: Optional[date] = Query(None, description="시작일 (포함)"),
+    date_to: Optional[date] = Query(None, description="종료일 (포함, 기본: 오늘)"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """카테고리별 판매 (매출 내림차순)"""
+    date_from, date_to = stats_range(date_from, date_to)
+    try:
+        return await category_sales(db, date_from, date_to)
+    except Exception as e:
+        logger.error(f"카테고리별 판매 통계 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail="통계 조회 중 오류가 발생했습니다")
+
+@router.get("/admin/exports/{dataset}")
+async def export_dataset(
+    dataset: ExportDataset,
+    fmt: ExportFormat = Query(ExportFormat.CSV, alias="format", description="csv 또는 ndjson"),
+    date_from: Optional[date] = Query(None, description="시작일 (포함, 기본: 지난달 1일 또는 종료일이 속한 달의 1일)"),
+    date_to: Optional[date] = Query(None, description="종료일 (포함, 기본: 지난달 말일 또는 오늘)"),
+):
+    """
+    회계용 내보내기 (orders, order_items, sales_daily)
+
+    행을 청크 단위로 조회/직렬화해 바로 전송하므로 기간 내 행 수와 관계없이 메모리 사용량이 일정
+    (기간은 주문 일자 기준, 보관된 주문 포함)
+    """
+    try:
+        date_from, date_to = export_range(date_from, date_to)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    filename = export_filename(dataset, fmt, date_from, date_to)
+    logger.info(f"내보내기 시작: {filename}")
+    return StreamingResponse(
+        export_chunks(dataset, fmt, date_from, date_to),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+@router.patch("/admin/users/{user_id}", response_model=UserSchema)
+async def update_user_access(
+    user_id: int,
+    update: UserAccessUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    principal: Principal = Depends(require_admin)
+):
+    """사용자 비활성화/관리자 권한 변경 (해당 사용자의 캐시된 권한은 즉시 무효화)"""
+    if user_id == principal.user_id and (update.is_active is False or update.is_admin is False):
+        raise HTTPException(status_code=400, detail="자신의 계정은 비활성화하거나 관리자 권한을 해제할 수 없습니다")
+    try:
+        user = await update_access(db, user_id, update.is_active, update.is_admin)
+        await db.commit()
+    except UserNotFound:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+    except Exception as e:
+        logger.error(f"사용자 권한 변경 실패 (ID: {user_id}): {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="사용자 권한 변경 중 오류가 발생했습니다")
+    # 커밋 후 무효화해야 다른 요청이 변경 전 값을 다시 캐시하지 않음
+    principal_cache.invalidate_user(user_id)
+
+    logger.info(f"사용자 권한 변경: ID {user_id}, 활성={user.is_active}, 관리자={user.is_admin}")
+    return user
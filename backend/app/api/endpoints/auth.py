@@ -0,0 +1,74 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import client_ip, get_current_principal, rate_limit, token_user_id
+from app.core.logger import logger
+from app.core.security import PasswordHasherBusy, Principal, create_access_token
+from app.db.base import get_async_db
+from app.schemas.user import Token, UserLogin, UserUpdatePassword
+from app.services.user import InvalidPassword, UserNotFound, authenticate, change_password
+
+router = APIRouter()
+
+def _busy() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도해주세요",
+        headers={"Retry-After": "1"},
+    )
+
+@router.post(
+    "/auth/token", response_model=Token, dependencies=[Depends(rate_limit("login", client_ip))]
+)
+async def login(credentials: UserLogin, db: AsyncSession = Depends(get_async_db)):
+    """
+    로그인 후 액세스 토큰 발급
+
+    이후 요청에 Authorization: Bearer <access_token> 헤더로 전달
+    (토큰에는 사용자 ID만 담기며 권한은 요청 시 확인)
+    비밀번호 확인 대기열이 가득 차면 503, 클라이언트 IP별 요청 한도를 넘으면 429 (Retry-After)
+    """
+    try:
+        user = await authenticate(db, credentials.username, credentials.password)
+        if user is not None:
+            await db.commit()  # 재해싱된 비밀번호 저장
+    except PasswordHasherBusy:
+        raise _busy()
+    except Exception as e:
+        logger.error(f"로그인 처리 실패 ({credentials.username}): {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="로그인 처리 중 오류가 발생했습니다")
+    if user is None or not user.is_active:
+        logger.warning(f"로그인 실패: {credentials.username}")
+        raise HTTPException(
+            status_code=401,
+            detail="아이디 또는 비밀번호가 올바르지 않습니다",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+    logger.info(f"로그인: {user.username} (ID: {user.id})")
+    return Token(access_token=create_access_token(user.id))
+
+@router.put("/auth/password", dependencies=[Depends(rate_limit("password", token_user_id))])
+async def update_password(
+    passwords: UserUpdatePassword,
+    principal: Principal = Depends(get_current_principal),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """로그인한 사용자의 비밀번호 변경 (현재 비밀번호 확인, 사용자별 요청 한도를 넘으면 429)"""
+    try:
+        await change_password(db, principal.user_id, passwords.current_password, passwords.new_password)
+        await db.commit()
+    except InvalidPassword as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except UserNotFound:
+        raise HTTPException(status_code=404, detail="사용자를 찾을 수 없습니다")
+    except PasswordHasherBusy:
+        raise _busy()
+    except Exception as e:
+        logger.error(f"비밀번호 변경 실패 (ID: {principal.user_id}): {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="비밀번호 변경 중 오류가 발생했습니다")
+
+    logger.info(f"비밀번호 변경: {principal.username} (ID: {principal.user_id})")
+    return {"message": "비밀번호가 변경되었습니다"}
@@ -1,208 +1,627 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from fastapi import APIRouter, Depends, File, Header, HTTPException, Query, Request, Response, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from sqlalchemy import and_, or_, select
+from sqlalchemy.exc import IntegrityError
 
+from app.api.deps import require_admin
+from app.api.pagination import decode_cursor, encode_cursor
+from app.core.cache import catalog_cache
 from app.core.config import settings
+from app.core.images import IMAGE_FORMATS, ImageProcessorBusy, InvalidImage
+from app.core.http_cache import (
+    catalog_etag, encoded_response, etag_matches, not_modified_response, set_cache_headers
+)
 from app.core.logger import logger
-from app.db.base import get_db
+from app.db.base import get_async_db
 from app.models.menu import Menu, Category
-from app.schemas.menu import Menu as MenuSchema, MenuCreate, MenuUpdate
-from app.schemas.menu import Category as CategorySchema, CategoryCreate
+from app.schemas.menu import Menu as MenuSchema, MenuCreate, MenuUpdate, MenuImage, MenuImportResult
+from app.schemas.menu import Category as CategorySchema, CategoryCreate, CategoryReorder
+from app.schemas.menu import BulkUpdateResult, MenuBulkAvailability, MenuBulkPrice
+from app.services.catalog import catalog_snapshot
+from app.services.menu_bulk import BulkUpdateError, change_prices, reorder_categories, set_availability
+from app.services.image_store import (
+    ImageTooLarge, ImageUploadError, UnsupportedImageType, acquire_upload, apply_ref_changes, ref_changes,
+    store_image
+)
+from app.services.menu_import import ImportFileError, import_menus
+from app.services.search import menu_search_index
 
+# 조회는 공개, 카테고리/메뉴를 바꾸는 엔드포인트는 관리자 토큰 필요 (dependencies=[Depends(require_admin)])
 router = APIRouter()
 
+async def _get_menu_with_category(db: AsyncSession, menu_id: int) -> Optional[Menu]:
+    """카테고리를 JOIN으로 함께 로딩한 메뉴 조회 (단일 쿼리)"""
+    result = await db.execute(
+        select(Menu).options(joinedload(Menu.category)).where(Menu.id == menu_id)
+    )
+    return result.scalar_one_or_none()
+
 # 카테고리 관련 엔드포인트
 @router.get("/categories", response_model=List[CategorySchema])
 async def get_categories(
-    db: Session = Depends(get_db)
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """모든 카테고리 조회 (display_order 순서로 정렬)"""
+    etag = catalog_etag(request)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
+    if settings.CATALOG_SNAPSHOT_ENABLED:
+        try:
+            snapshot = await catalog_snapshot.get(db)
+            return encoded_response(request, snapshot.categories, etag)
+        except Exception as e:
+            logger.error(f"카테고리 조회 실패: {e}")
+            raise HTTPException(status_code=500, detail="카테고리 조회 중 오류가 발생했습니다")
+
+    set_cache_headers(response, etag)
+    cache_key = catalog_cache.make_key("categories")
+    cached = catalog_cache.get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
-        categories = db.query(Category).order_by(Category.display_order, Category.id).all()
+        result = await db.execute(
+            select(Category).order_by(Category.display_order, Category.id)
+        )
+        categories = [CategorySchema.model_validate(c) for c in result.scalars()]
+        catalog_cache.set(cache_key, categories)
         logger.info(f"카테고리 {len(categories)}개 조회 완료")
         return categories
     except Exception as e:
         logger.error(f"카테고리 조회 실패: {e}")
         raise HTTPException(status_code=500, detail="카테고리 조회 중 오류가 발생했습니다")
 
-@router.post("/categories", response_model=CategorySchema)
+@router.post("/categories", response_model=CategorySchema, dependencies=[Depends(require_admin)])
 async def create_category(
-    category: CategoryCreate, 
-    db: Session = Depends(get_db)
+    category: CategoryCreate,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """새 카테고리 생성"""
     try:
         # 중복 확인
-        existing = db.query(Category).filter(Category.name == category.name).first()
+        existing = await db.scalar(select(Category).where(Category.name == category.name))
         if existing:
             raise HTTPException(status_code=400, detail="이미 존재하는 카테고리명입니다")
-        
+
         db_category = Category(**category.dict())
         db.add(db_category)
-        db.commit()
-        db.refresh(db_category)
-        
+        await db.commit()
+        catalog_cache.invalidate()
+        await db.refresh(db_category)
+        if settings.CATALOG_SNAPSHOT_ENABLED:
+            await catalog_snapshot.refresh(db)
+
         logger.info(f"새 카테고리 생성: {db_category.name} (ID: {db_category.id})")
         return db_category
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"카테고리 생성 실패: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="카테고리 생성 중 오류가 발생했습니다")
 
+@router.put("/categories/order", response_model=BulkUpdateResult, dependencies=[Depends(require_admin)])
+async def reorder_category_list(
+    order: CategoryReorder,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """카테고리 표시 순서 일괄 변경 (목록 순서대로 display_order 0, 1, 2...)"""
+    try:
+        updated = await reorder_categories(db, order)
+        await db.commit()
+        catalog_cache.invalidate()
+        if settings.CATALOG_SNAPSHOT_ENABLED:
+            await catalog_snapshot.refresh(db)
+
+        logger.info(f"카테고리 순서 변경: {order.category_ids}")
+        return BulkUpdateResult(updated=updated)
+
+    except BulkUpdateError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"카테고리 순서 변경 실패: {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="카테고리 순서 변경 중 오류가 발생했습니다")
+
 # 메뉴 관련 엔드포인트
 @router.get("/menus", response_model=List[MenuSchema])
 async def get_menus(
+    request: Request,
+    response: Response,
     category_id: Optional[int] = Query(None, description="카테고리 ID로 필터링"),
     available_only: bool = Query(True, description="판매 가능한 메뉴만 조회"),
-    skip: int = Query(0, ge=0, description="건너뛸 개수"),
+    skip: int = Query(0, ge=0, description="건너뛸 개수 (커서 미사용 시)"),
+    cursor: Optional[str] = Query(None, description="다음 페이지 커서 (X-Next-Cursor 헤더 값)"),
     limit: int = Query(
-        settings.DEFAULT_PAGE_SIZE, 
-        ge=1, 
-        le=settings.MAX_PAGE_SIZE, 
+        settings.DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=settings.MAX_PAGE_SIZE,
         description="조회할 개수"
     ),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
-    """메뉴 목록 조회 (카테고리별 필터링, 페이지네이션 지원)"""
+    """
+    메뉴 목록 조회 (카테고리별 필터링, 페이지네이션 지원)
+
+    (category_id, id) 순으로 정렬되며, 다음 페이지가 있으면 X-Next-Cursor 헤더로
+    커서를 반환. cursor 파라미터를 사용하면 OFFSET 대신 키셋 탐색으로 조회
+    """
+    if cursor and skip:
+        raise HTTPException(status_code=400, detail="cursor와 skip은 함께 사용할 수 없습니다")
+    after = decode_cursor(cursor, (int, int)) if cursor else None
+
+    etag = catalog_etag(request)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
+    if settings.CATALOG_SNAPSHOT_ENABLED:
+        try:
+            snapshot = await catalog_snapshot.get(db)
+            # 같은 페이지의 본문/압축 결과는 버전 내에서 재사용
+            page_key = catalog_cache.make_key(
+                "menus_snapshot",
+                (category_id, available_only, skip, after, limit),
+                version=snapshot.version,
+            )
+            page = catalog_cache.get(page_key)
+            if page is None:
+                page = snapshot.menu_page(category_id, available_only, skip, after, limit)
+                catalog_cache.set(page_key, page)
+            body, last_key = page
+            headers = {"X-Next-Cursor": encode_cursor(last_key)} if last_key else None
+            return encoded_response(request, body, etag, headers)
+        except Exception as e:
+            logger.error(f"메뉴 목록 조회 실패: {e}")
+            raise HTTPException(status_code=500, detail="메뉴 조회 중 오류가 발생했습니다")
+
+    set_cache_headers(response, etag)
+    cache_key = catalog_cache.make_key(
+        "menus", (category_id, available_only, skip, after, limit)
+    )
+    cached = catalog_cache.get(cache_key)
+    if cached is not None:
+        menus, next_cursor = cached
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return menus
+
     try:
-        query = db.query(Menu)
-        
+        # 카테고리는 JOIN으로 함께 로딩 (메뉴별 추가 SELECT 방지)
+        query = select(Menu).options(joinedload(Menu.category))
+
         # 카테고리 필터링
         if category_id:
-            query = query.filter(Menu.category_id == category_id)
-        
+            query = query.where(Menu.category_id == category_id)
+
         # 판매 가능 여부 필터링
         if available_only:
-            query = query.filter(Menu.is_available == True)
-        
-        # 페이지네이션 적용
-        menus = query.offset(skip).limit(limit).all()
-        
+            query = query.where(Menu.is_available == True)
+
+        # 페이지네이션 적용: 커서가 있으면 (category_id, id) 키셋 탐색, 없으면 OFFSET
+        query = query.order_by(Menu.category_id, Menu.id)
+        if after:
+            after_category_id, after_id = after
+            query = query.where(or_(
+                Menu.category_id > after_category_id,
+                and_(Menu.category_id == after_category_id, Menu.id > after_id),
+            ))
+        else:
+            query = query.offset(skip)
+
+        # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+        result = await db.execute(query.limit(limit + 1))
+        rows = result.scalars().all()
+        next_cursor = None
+        if len(rows) > limit:
+            next_cursor = encode_cursor((rows[limit - 1].category_id, rows[limit - 1].id))
+        menus = [MenuSchema.model_validate(m) for m in rows[:limit]]
+        catalog_cache.set(cache_key, (menus, next_cursor))
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+
         logger.info(f"메뉴 조회: 카테고리={category_id}, 개수={len(menus)}")
         return menus
-        
+
     except Exception as e:
         logger.error(f"메뉴 목록 조회 실패: {e}")
         raise HTTPException(status_code=500, detail="메뉴 조회 중 오류가 발생했습니다")
 
+@router.get("/menus/search", response_model=List[MenuSchema])
+async def search_menus(
+    request: Request,
+    response: Response,
+    q: str = Query(..., min_length=1, max_length=50, description="검색어 (이름/설명 부분 일치)"),
+    category_id: Optional[int] = Query(None, description="카테고리 ID로 필터링"),
+    available_only: bool = Query(True, description="판매 가능한 메뉴만 조회"),
+    limit: int = Query(
+        settings.DEFAULT_PAGE_SIZE,
+        ge=1,
+        le=settings.MAX_PAGE_SIZE,
+        description="조회할 개수"
+    ),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """메뉴 검색 (바이그램 색인 기반, 관련도순 정렬)"""
+    etag = catalog_etag(request)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
+    try:
+        # 같은 검색어의 결과는 카탈로그 버전 내에서 재사용
+        cache_key = catalog_cache.make_key(
+            "menus_search", (q.strip(), category_id, available_only, limit)
+        )
+        menu_ids = catalog_cache.get(cache_key)
+        if menu_ids is None:
+            await menu_search_index.ensure_built(db)
+            menu_ids = menu_search_index.search(q, limit, category_id, available_only)
+            catalog_cache.set(cache_key, menu_ids)
+
+        if settings.CATALOG_SNAPSHOT_ENABLED:
+            snapshot = await catalog_snapshot.get(db)
+            return encoded_response(request, snapshot.menus_by_ids(menu_ids), etag)
+
+        set_cache_headers(response, etag)
+        if not menu_ids:
+            return []
+        result = await db.execute(
+            select(Menu).options(joinedload(Menu.category)).where(Menu.id.in_(menu_ids))
+        )
+        menus = {menu.id: menu for menu in result.scalars()}
+        logger.info(f"메뉴 검색: '{q}', 결과={len(menus)}")
+        return [menus[menu_id] for menu_id in menu_ids if menu_id in menus]
+
+    except Exception as e:
+        logger.error(f"메뉴 검색 실패 ('{q}'): {e}")
+        raise HTTPException(status_code=500, detail="메뉴 검색 중 오류가 발생했습니다")
+
 @router.get("/menus/{menu_id}", response_model=MenuSchema)
 async def get_menu(
-    menu_id: int, 
-    db: Session = Depends(get_db)
+    menu_id: int,
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """특정 메뉴 조회"""
+    etag = catalog_etag(request)
+    if etag_matches(request, etag):
+        return not_modified_response(etag)
+
     try:
-        menu = db.query(Menu).filter(Menu.id == menu_id).first()
+        if settings.CATALOG_SNAPSHOT_ENABLED:
+            snapshot = await catalog_snapshot.get(db)
+            body = snapshot.menu(menu_id)
+            if body is None:
+                logger.warning(f"존재하지 않는 메뉴 ID 요청: {menu_id}")
+                raise HTTPException(status_code=404, detail="메뉴를 찾을 수 없습니다")
+            return encoded_response(request, body, etag)
+
+        menu = await _get_menu_with_category(db, menu_id)
         if not menu:
             logger.warning(f"존재하지 않는 메뉴 ID 요청: {menu_id}")
             raise HTTPException(status_code=404, detail="메뉴를 찾을 수 없습니다")
-        
+
+        set_cache_headers(response, etag)
         logger.info(f"메뉴 조회: {menu.name} (ID: {menu_id})")
         return menu
-        
+
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"메뉴 조회 실패 (ID: {menu_id}): {e}")
         raise HTTPException(status_code=500, detail="메뉴 조회 중 오류가 발생했습니다")
 
-@router.post("/menus", response_model=MenuSchema)
+@router.post("/menus", response_model=MenuSchema, dependencies=[Depends(require_admin)])
 async def create_menu(
-    menu: MenuCreate, 
-    db: Session = Depends(get_db)
+    menu: MenuCreate,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """새 메뉴 생성"""
     try:
         # 카테고리 존재 확인
-        category = db.query(Category).filter(Category.id == menu.category_id).first()
+        category = await db.get(Category, menu.category_id)
         if not category:
             raise HTTPException(status_code=400, detail="유효하지 않은 카테고리 ID입니다")
-        
+
         # 메뉴명 중복 확인 (같은 카테고리 내에서)
-        existing = db.query(Menu).filter(
-            Menu.name == menu.name, 
-            Menu.category_id == menu.category_id
-        ).first()
+        existing = await db.scalar(
+            select(Menu.id).where(
+                Menu.name == menu.name,
+                Menu.category_id == menu.category_id
+            )
+        )
         if existing:
             raise HTTPException(status_code=400, detail="같은 카테고리에 동일한 메뉴명이 존재합니다")
-        
+
         db_menu = Menu(**menu.dict())
         db.add(db_menu)
-        db.commit()
-        db.refresh(db_menu)
-        
+        await apply_ref_changes(db, ref_changes(None, db_menu.image_url))
+        await db.commit()
+        catalog_cache.invalidate()
+        db_menu = await _get_menu_with_category(db, db_menu.id)
+        menu_search_index.upsert(db_menu)
+        if settings.CATALOG_SNAPSHOT_ENABLED:
+            await catalog_snapshot.refresh(db)
+
         logger.info(f"새 메뉴 생성: {db_menu.name} (ID: {db_menu.id}, 카테고리: {category.name})")
         return db_menu
-        
+
     except HTTPException:
         raise
+    except IntegrityError:
+        # 중복 확인 이후 동시에 같은 메뉴가 생성된 경우 (uq_menus_category_id_name)
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="같은 카테고리에 동일한 메뉴명이 존재합니다")
     except Exception as e:
         logger.error(f"메뉴 생성 실패: {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="메뉴 생성 중 오류가 발생했습니다")
 
-@router.put("/menus/{menu_id}", response_model=MenuSchema)
+@router.patch("/menus/availability", response_model=BulkUpdateResult, dependencies=[Depends(require_admin)])
+async def bulk_update_availability(
+    change: MenuBulkAvailability,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """메뉴 판매 여부 일괄 변경 (메뉴 ID 목록 또는 카테고리 단위)"""
+    try:
+        updated = await set_availability(db, change)
+        await db.commit()
+        if updated:
+            catalog_cache.invalidate()
+            menu_search_index.invalidate()
+            if settings.CATALOG_SNAPSHOT_ENABLED:
+                await catalog_snapshot.refresh(db)
+
+        logger.info(f"메뉴 판매 여부 일괄 변경: {updated}개 → {change.is_available}")
+        return BulkUpdateResult(updated=updated)
+
+    except Exception as e:
+        logger.error(f"메뉴 판매 여부 일괄 변경 실패: {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="메뉴 판매 여부 변경 중 오류가 발생했습니다")
+
+@router.patch("/menus/price", response_model=BulkUpdateResult, dependencies=[Depends(require_admin)])
+async def bulk_update_price(
+    change: MenuBulkPrice,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """메뉴 가격 일괄 변경 (percent: 비율, amount: 금액)"""
+    try:
+        updated = await change_prices(db, change)
+        await db.commit()
+        if updated:
+            # 가격은 검색 색인에 포함되지 않으므로 색인은 유지
+            catalog_cache.invalidate()
+            if settings.CATALOG_SNAPSHOT_ENABLED:
+                await catalog_snapshot.refresh(db)
+
+        logger.info(f"메뉴 가격 일괄 변경: {updated}개 (percent={change.percent}, amount={change.amount})")
+        return BulkUpdateResult(updated=updated)
+
+    except BulkUpdateError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"메뉴 가격 일괄 변경 실패: {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="메뉴 가격 변경 중 오류가 발생했습니다")
+
+@router.post("/menus/import", response_model=MenuImportResult, dependencies=[Depends(require_admin)])
+async def import_menus_file(
+    file: UploadFile = File(..., description="CSV(헤더 포함) 또는 NDJSON 파일"),
+    format: Optional[str] = Query(None, pattern="^(csv|ndjson)$", description="생략 시 확장자로 판단"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    메뉴 일괄 등록 (CSV / NDJSON)
+
+    - 열/키: name, category_id 또는 category(이름), price, description, image_url, is_available
+    - 같은 카테고리에 같은 이름의 메뉴가 있으면 수정, 없으면 생성
+    - 수정 시 파일에 없는(또는 빈) 열은 기존 값 유지
+    - 잘못된 행은 건너뛰고 줄 번호와 사유를 errors에 반환
+    """
+    file_format = format
+    if file_format is None:
+        filename = (file.filename or "").lower()
+        if filename.endswith(".csv"):
+            file_format = "csv"
+        elif filename.endswith((".ndjson", ".jsonl")):
+            file_format = "ndjson"
+        else:
+            raise HTTPException(status_code=400, detail="CSV 또는 NDJSON 파일만 지원합니다")
+
+    try:
+        result = await import_menus(db, file, file_format)
+        await db.commit()
+        if result.created or result.updated:
+            catalog_cache.invalidate()
+            menu_search_index.invalidate()
+            if settings.CATALOG_SNAPSHOT_ENABLED:
+                await catalog_snapshot.refresh(db)
+
+        logger.info(
+            f"메뉴 일괄 등록: {file.filename} (전체 {result.total_rows}, 생성 {result.created}, "
+            f"수정 {result.updated}, 실패 {result.failed})"
+        )
+        return result
+
+    except ImportFileError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except IntegrityError:
+        # 사전 조회 이후 다른 요청이 같은 메뉴를 생성한 경우 전체 롤백
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="일괄 등록 중 다른 요청과 메뉴명이 충돌했습니다. 다시 시도해주세요")
+    except Exception as e:
+        logger.error(f"메뉴 일괄 등록 실패: {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="메뉴 일괄 등록 중 오류가 발생했습니다")
+
+@router.put(
+    "/menus/{menu_id}/image",
+    response_model=MenuImage,
+    dependencies=[Depends(require_admin)],
+    openapi_extra={"requestBody": {"required": True, "content": {
+        media_type: {"schema": {"type": "string", "format": "binary"}} for media_type in IMAGE_FORMATS
+    }}},
+)
+async def upload_menu_image(
+    menu_id: int,
+    request: Request,
+    content_type: Optional[str] = Header(None),
+    content_length: Optional[int] = Header(None),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    메뉴 이미지 업로드 (요청 본문 = 이미지 파일, Content-Type: image/jpeg|png|gif|webp)
+
+    - 본문을 받는 대로 디스크에 기록하며 MAX_FILE_SIZE 를 넘으면 그 즉시 413
+    - IMAGE_VARIANT_WIDTHS 너비별 WebP 변형을 프로세스 풀에서 생성 (대기열이 차면 503)
+      (같은 내용이 이미 저장되어 있으면 변환 없이 재사용, reused=true)
+    - image_url 은 메뉴 카드용 IMAGE_CARD_WIDTH 변형(내용 해시 경로)으로 교체, 이전 이미지는 참조 해제
+    - 본문을 받기 전에 메뉴 존재 여부만 확인하고 트랜잭션을 끝냄 (없는 메뉴면 변환 없이 404,
+      업로드/변환하는 동안 DB 연결을 잡지 않음)
+    """
+    if content_length is not None and content_length > settings.MAX_FILE_SIZE:
+        raise HTTPException(
+            status_code=413, detail=f"파일 크기가 제한({settings.MAX_FILE_SIZE} bytes)을 초과했습니다"
+        )
+
+    try:
+        menu_exists = await db.scalar(select(Menu.id).where(Menu.id == menu_id)) is not None
+        await db.commit()  # 읽기 트랜잭션 종료 (연결 반환)
+    except Exception as e:
+        logger.error(f"메뉴 조회 실패 (ID: {menu_id}): {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="메뉴 조회 중 오류가 발생했습니다")
+    if not menu_exists:
+        raise HTTPException(status_code=404, detail="메뉴를 찾을 수 없습니다")
+
+    try:
+        stored = await store_image(content_type, request.stream())
+    except ImageTooLarge as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UnsupportedImageType as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except (ImageUploadError, InvalidImage) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except ImageProcessorBusy:
+        raise HTTPException(
+            status_code=503,
+            detail="이미지 처리 요청이 많습니다. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": "5"},
+        )
+    except Exception as e:
+        logger.error(f"메뉴 이미지 처리 실패 (ID: {menu_id}): {e}")
+        raise HTTPException(status_code=500, detail="이미지 처리 중 오류가 발생했습니다")
+
+    try:
+        db_menu = await _get_menu_with_category(db, menu_id)
+        if not db_menu:
+            # 변환하는 동안 삭제된 경우: 저장된 변형은 참조가 없으므로 scripts/gc_images.py 가 유예 기간 후 정리
+            raise HTTPException(status_code=404, detail="메뉴를 찾을 수 없습니다")
+
+        await acquire_upload(db, stored, db_menu.image_url)
+        db_menu.image_url = stored.image_url
+        await db.commit()
+        catalog_cache.invalidate()
+        menu_search_index.upsert(db_menu)
+        if settings.CATALOG_SNAPSHOT_ENABLED:
+            await catalog_snapshot.refresh(db)
+
+        logger.info(
+            f"메뉴 이미지 변경: {db_menu.name} (ID: {menu_id}, {stored.width}x{stored.height}, "
+            f"{stored.size} bytes, {'기존 이미지 재사용' if stored.reused else f'{len(stored.variants)}개 변형 생성'})"
+        )
+        return MenuImage(menu_id=menu_id, **vars(stored))
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"메뉴 이미지 변경 실패 (ID: {menu_id}): {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="메뉴 이미지 변경 중 오류가 발생했습니다")
+
+@router.put("/menus/{menu_id}", response_model=MenuSchema, dependencies=[Depends(require_admin)])
 async def update_menu(
-    menu_id: int, 
-    menu: MenuUpdate, 
-    db: Session = Depends(get_db)
+    menu_id: int,
+    menu: MenuUpdate,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """메뉴 수정"""
     try:
-        db_menu = db.query(Menu).filter(Menu.id == menu_id).first()
+        db_menu = await _get_menu_with_category(db, menu_id)
         if not db_menu:
             logger.warning(f"수정할 메뉴를 찾을 수 없음: ID {menu_id}")
             raise HTTPException(status_code=404, detail="메뉴를 찾을 수 없습니다")
-        
+
         # 카테고리 변경 시 유효성 확인
         if menu.category_id and menu.category_id != db_menu.category_id:
-            category = db.query(Category).filter(Category.id == menu.category_id).first()
+            category = await db.get(Category, menu.category_id)
             if not category:
                 raise HTTPException(status_code=400, detail="유효하지 않은 카테고리 ID입니다")
-        
+
         # 수정사항 적용
         update_data = menu.dict(exclude_unset=True)
+        if "image_url" in update_data:
+            await apply_ref_changes(db, ref_changes(db_menu.image_url, update_data["image_url"]))
         for key, value in update_data.items():
             setattr(db_menu, key, value)
-        
-        db.commit()
-        db.refresh(db_menu)
-        
+
+        await db.commit()
+        catalog_cache.invalidate()
+        # 카테고리가 바뀐 경우 관계를 다시 로딩
+        await db.refresh(db_menu, attribute_names=["category"])
+        menu_search_index.upsert(db_menu)
+        if settings.CATALOG_SNAPSHOT_ENABLED:
+            await catalog_snapshot.refresh(db)
+
         logger.info(f"메뉴 수정 완료: {db_menu.name} (ID: {menu_id})")
         return db_menu
-        
+
     except HTTPException:
         raise
+    except IntegrityError:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="같은 카테고리에 동일한 메뉴명이 존재합니다")
     except Exception as e:
         logger.error(f"메뉴 수정 실패 (ID: {menu_id}): {e}")
-        db.rollback()
+        await db.rollback()
         raise HTTPException(status_code=500, detail="메뉴 수정 중 오류가 발생했습니다")
 
-@router.delete("/menus/{menu_id}")
+@router.delete("/menus/{menu_id}", dependencies=[Depends(require_admin)])
 async def delete_menu(
     menu_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """메뉴 삭제"""
     try:
-        db_menu = db.query(Menu).filter(Menu.id == menu_id).first()
+        db_menu = await db.get(Menu, menu_id)
         if not db_menu:
             logger.warning(f"삭제할 메뉴를 찾을 수 없음: ID {menu_id}")
             raise HTTPException(status_code=404, detail="메뉴를 찾을 수 없습니다")
-        
+
         menu_name = db_menu.name
-        db.delete(db_menu)
-        db.commit()
-        
+        await db.delete(db_menu)
+        await apply_ref_changes(db, ref_changes(db_menu.image_url, None))
+        await db.commit()
+        catalog_cache.invalidate()
+        menu_search_index.remove(menu_id)
+        if settings.CATALOG_SNAPSHOT_ENABLED:
+            await catalog_snapshot.refresh(db)
+
         logger.info(f"메뉴 삭제 완료: {menu_name} (ID: {menu_id})")
         return {"message": f"메뉴 '{menu_name}'가 성공적으로 삭제되었습니다"}
-        
+
     except HTTPException:
         raise
     except Exception as e:
         logger.error(f"메뉴 삭제 실패 (ID: {menu_id}): {e}")
-        db.rollback()
-        raise HTTPException(status_code=500, detail="메뉴 삭제 중 오류가 발생했습니다") 
\ No newline at end of file
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="메뉴 삭제 중 오류가 발생했습니다")
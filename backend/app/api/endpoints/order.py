@@ -0,0 +1,216 @@
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import client_ip, order_phone, rate_limit, require_admin
+from app.core.config import settings
+from app.core.logger import logger
+from app.db.base import get_async_db
+from app.schemas.order import (
+    Order as OrderSchema, OrderCreate, OrderCreateResponse, OrderStatusUpdate, PickupSlotAvailability
+)
+from app.services.idempotency import (
+    IdempotencyInProgress, IdempotencyKeyReused, idempotency_store, request_fingerprint
+)
+from app.services.order import (
+    OrderConflict, OrderError, OrderNotFound, change_status, create_order, status_event
+)
+from app.services.order_archive import get_order_any
+from app.services.order_batcher import order_group_committer
+from app.services.order_events import OrderStreamFull, order_event_hub
+from app.services.pickup_slots import PickupSlotError, PickupSlotFull, pickup_scheduler
+
+router = APIRouter()
+
+@router.post(
+    "/orders",
+    response_model=OrderCreateResponse,
+    dependencies=[Depends(rate_limit("order", client_ip)), Depends(rate_limit("order_phone", order_phone))],
+)
+async def submit_order(
+    request: Request,
+    order: OrderCreate,
+    idempotency_key: Optional[str] = Header(
+        None,
+        alias="Idempotency-Key",
+        min_length=1,
+        max_length=100,
+        description="재시도 시 같은 값을 보내면 주문을 다시 만들지 않고 첫 응답을 반환",
+    ),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    주문 생성
+
+    - 메뉴 가격은 주문 시점 가격으로 고정되어 항목별로 저장
+    - 존재하지 않거나 품절된 메뉴가 있으면 주문 전체를 거부
+    - pickup_time 을 지정하면 해당 픽업 시간대를 예약 (마감된 시간대면 409)
+    - Idempotency-Key 재시도 응답에는 Idempotent-Replayed: true 헤더 포함
+    - ORDER_GROUP_COMMIT_ENABLED 이면 동시에 들어온 주문과 함께 한 트랜잭션으로 커밋
+    - 클라이언트 IP별/전화번호별 요청 한도를 넘으면 DB 세션을 열기 전에 429 (Retry-After)
+    """
+    created = []
+
+    def track_created(db_order):
+        created.append(db_order)
+        logger.info(
+            f"주문 생성: ID {db_order.id}, 항목 {len(db_order.order_items)}개, "
+            f"총액 {db_order.total_amount}원"
+        )
+
+    async def write_order():
+        db_order = await create_order(db, order)
+        track_created(db_order)
+        return 200, OrderCreateResponse(order=db_order).model_dump_json().encode()
+
+    async def submit_to_group(record_factory=None):
+        committed = await order_group_committer.submit(order, record_factory)
+        track_created(committed.order)
+        return committed
+
+    async def submit_to_group_with_record(record_factory):
+        return (await submit_to_group(record_factory)).stored
+
+    try:
+        if idempotency_key is None:
+            if settings.ORDER_GROUP_COMMIT_ENABLED:
+                body = (await submit_to_group()).body
+            else:
+                _, body = await write_order()
+                await db.commit()
+            order_event_hub.publish(status_event(created[0]))
+            return Response(content=body, media_type="application/json")
+
+        fingerprint = request_fingerprint(request.url.path, order.model_dump(mode="json"))
+        if settings.ORDER_GROUP_COMMIT_ENABLED:
+            stored, replayed = await idempotency_store.execute_committed(
+                db, idempotency_key, fingerprint, submit_to_group_with_record
+            )
+        else:
+            stored, replayed = await idempotency_store.execute(
+                db, idempotency_key, fingerprint, write_order
+            )
+        response = Response(
+            content=stored.body, status_code=stored.status_code, media_type="application/json"
+        )
+        if replayed:
+            response.headers["Idempotent-Replayed"] = "true"
+            logger.info(f"주문 재시도 응답 재전송 (Idempotency-Key: {idempotency_key})")
+        else:
+            order_event_hub.publish(status_event(created[0]))
+        return response
+
+    except OrderError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except PickupSlotFull as e:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail=str(e))
+    except PickupSlotError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except IdempotencyKeyReused as e:
+        raise HTTPException(status_code=422, detail=str(e))
+    except IdempotencyInProgress:
+        raise HTTPException(status_code=409, detail="같은 Idempotency-Key의 주문이 아직 처리 중입니다")
+    except Exception as e:
+        logger.error(f"주문 생성 실패: {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="주문 생성 중 오류가 발생했습니다")
+
+@router.get("/pickup-slots", response_model=List[PickupSlotAvailability])
+async def get_pickup_slots(
+    include_full: bool = Query(False, description="마감된 시간대도 포함"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    예약 가능한 픽업 시간대 목록
+
+    준비 시간(PICKUP_SLOT_LEAD_MINUTES) 이후부터 PICKUP_SLOT_HORIZON_MINUTES 이내의 시간대를
+    남은 수용량과 함께 반환 (예약 수는 메모리에서 조회하며 주기적으로 DB와 동기화)
+    """
+    try:
+        return await pickup_scheduler.available_slots(db, include_full)
+    except Exception as e:
+        logger.error(f"픽업 시간대 조회 실패: {e}")
+        raise HTTPException(status_code=500, detail="픽업 시간대 조회 중 오류가 발생했습니다")
+
+@router.get("/orders/stream", dependencies=[Depends(require_admin)])
+async def stream_order_status(
+    last_event_id: Optional[str] = Header(None, alias="Last-Event-ID"),
+    last_event_id_query: Optional[str] = Query(
+        None, alias="last_event_id", description="Last-Event-ID 헤더를 보낼 수 없는 클라이언트용"
+    ),
+):
+    """
+    주문 상태 실시간 스트림 (Server-Sent Events)
+
+    - event: order_status → 주문 생성/상태 변경 (data: OrderStatusEvent)
+    - event: reset → 놓친 이벤트를 이어받을 수 없으므로 주문 목록을 다시 조회해야 함
+    - 재연결 시 마지막으로 받은 id 이후 이벤트부터 전송 (DB 조회 없음)
+    - 고객 이름/픽업 시간이 포함되므로 관리자 전용, 동시 구독자가 한도에 도달하면 503
+    """
+    try:
+        subscription = order_event_hub.subscribe(last_event_id or last_event_id_query)
+    except OrderStreamFull as e:
+        logger.warning(str(e))
+        raise HTTPException(
+            status_code=503,
+            detail="주문 상태 스트림 연결이 너무 많습니다. 잠시 후 다시 시도해주세요",
+            headers={"Retry-After": str(settings.ORDER_STREAM_RETRY_MS // 1000 or 1)},
+        )
+    return StreamingResponse(
+        order_event_hub.stream(subscription),
+        media_type="text/event-stream",
+        headers={
+            "Cache-Control": "no-cache",
+            "X-Accel-Buffering": "no",  # 프록시(nginx) 응답 버퍼링 비활성화
+        },
+    )
+
+@router.patch("/orders/{order_id}/status", response_model=OrderSchema, dependencies=[Depends(require_admin)])
+async def update_order_status(
+    order_id: int,
+    update: OrderStatusUpdate,
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    주문 상태 변경 (변경 내용은 주문 상태 스트림으로 전달)
+
+    - 허용되지 않는 상태 전이는 400
+    - 다른 요청이 먼저 변경했거나 expected_version 이 현재 버전과 다르면 409
+      (최신 주문을 다시 조회해 version 을 확인한 뒤 재시도)
+    """
+    try:
+        db_order, previous = await change_status(db, order_id, update.status, update.expected_version)
+        await db.commit()
+        order_event_hub.publish(status_event(db_order, previous))
+
+        logger.info(f"주문 상태 변경: ID {order_id}, {previous.value} → {db_order.status.value}")
+        return db_order
+
+    except OrderNotFound:
+        raise HTTPException(status_code=404, detail="주문을 찾을 수 없습니다")
+    except OrderConflict:
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="다른 요청이 먼저 주문 상태를 변경했습니다. 다시 조회 후 시도해주세요")
+    except OrderError as e:
+        await db.rollback()
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        logger.error(f"주문 상태 변경 실패 (ID: {order_id}): {e}")
+        await db.rollback()
+        raise HTTPException(status_code=500, detail="주문 상태 변경 중 오류가 발생했습니다")
+
+@router.get("/orders/{order_id}", response_model=OrderSchema, dependencies=[Depends(require_admin)])
+async def get_order(order_id: int, db: AsyncSession = Depends(get_async_db)):
+    """주문 상세 조회 (보관된 주문 포함, 고객 연락처가 포함되므로 관리자 전용)"""
+    try:
+        db_order = await get_order_any(db, order_id)
+    except Exception as e:
+        logger.error(f"주문 조회 실패 (ID: {order_id}): {e}")
+        raise HTTPException(status_code=500, detail="주문 조회 중 오류가 발생했습니다")
+    if db_order is None:
+        raise HTTPException(status_code=404, detail="주문을 찾을 수 없습니다")
+    return db_order
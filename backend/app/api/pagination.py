@@ -0,0 +1,33 @@
+"""
+Keyset Pagination Helpers
+
+목록 엔드포인트의 키셋(커서) 페이지네이션 공통 처리
+마지막 행의 정렬 키를 불투명한 URL-safe 문자열로 인코딩해 X-Next-Cursor 헤더로 전달
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Sequence, Tuple
+
+from fastapi import HTTPException
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """정렬 키를 커서 문자열로 인코딩 (datetime 은 ISO 형식 문자열로 변환)"""
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in key]
+    raw = json.dumps(values, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_cursor(cursor: str, types: Sequence[Callable[[Any], Any]]) -> Tuple[Any, ...]:
+    """
+    커서 문자열을 정렬 키로 디코딩 (잘못된 커서는 400)
+
+    types: 키 항목별 변환 함수 (예: (int, int), (datetime.fromisoformat, int))
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError(cursor)
+        return tuple(convert(value) for convert, value in zip(types, values))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다")
@@ -5,5 +5,6 @@ Core Module
 """
 from app.core.config import settings
 from app.core.logger import logger, setup_logger
+from app.core.cache import catalog_cache
 
-__all__ = ["settings", "logger", "setup_logger"] 
\ No newline at end of file
+__all__ = ["settings", "logger", "setup_logger", "catalog_cache"] 
\ No newline at end of file
@@ -0,0 +1,66 @@
+"""
+Catalog Cache Module
+
+카탈로그(카테고리/메뉴) 조회 결과를 위한 프로세스 내 캐시
+카탈로그 버전과 조회 파라미터를 키로 사용하며, 쓰기 발생 시 버전을 올려 무효화
+"""
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Tuple
+
+from app.core.config import settings
+
+CacheKey = Tuple[int, str, Hashable]
+
+class CatalogCache:
+    """카탈로그 버전 기반 LRU 캐시"""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._version = 0
+        self._entries: "OrderedDict[CacheKey, Any]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def version(self) -> int:
+        """현재 카탈로그 버전"""
+        return self._version
+
+    def make_key(
+        self, namespace: str, params: Hashable = None, version: Optional[int] = None
+    ) -> CacheKey:
+        """
+        캐시 키 생성
+
+        조회 시작 시점의 버전(또는 결과가 만들어진 버전)이 키에 포함되므로,
+        조회 도중 무효화가 일어나면 그 결과는 이전 버전 키로 저장되어 다시 제공되지 않음
+        """
+        return (self._version if version is None else version, namespace, params)
+
+    def get(self, key: CacheKey) -> Optional[Any]:
+        """캐시 조회 (없으면 None)"""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: CacheKey, value: Any) -> None:
+        """캐시 저장 (이미 무효화된 버전의 키는 저장하지 않음)"""
+        if key[0] != self._version:
+            return
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> int:
+        """카탈로그 변경 시 호출: 버전 증가 및 전체 항목 제거"""
+        self._version += 1
+        self._entries.clear()
+        return self._version
+
+# 카탈로그 캐시 인스턴스
+catalog_cache = CatalogCache(max_entries=settings.CATALOG_CACHE_MAX_ENTRIES)
@@ -26,6 +26,11 @@ class Settings(BaseSettings):
     SECRET_KEY: str = secrets.token_urlsafe(32)
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 7  # 7 days
     ALGORITHM: str = "HS256"
+    AUTH_PRINCIPAL_CACHE_MAX_ENTRIES: int = 1024  # 검증된 토큰 → 권한 캐시 최대 항목 수
+    AUTH_PRINCIPAL_CACHE_TTL: float = 60.0  # 권한 캐시 유지 시간 (초, 다른 워커의 권한 변경 반영 지연 상한)
+    PASSWORD_BCRYPT_ROUNDS: int = 12  # bcrypt cost (바꾸면 기존 해시는 다음 로그인 시 재해싱)
+    PASSWORD_HASH_WORKERS: int = 2  # 비밀번호 해싱/검증 스레드 수
+    PASSWORD_HASH_MAX_QUEUE: int = 32  # 스레드를 기다리는 최대 작업 수 (초과 시 503)
     
     # === MySQL 데이터베이스 설정 (필수) ===
     MYSQL_HOST: str
@@ -34,6 +39,9 @@ class Settings(BaseSettings):
     MYSQL_PASSWORD: str
     MYSQL_DATABASE: str
     
+    # 데이터베이스 URL 직접 지정 (테스트용 SQLite 등, 설정 시 MySQL 설정보다 우선)
+    DATABASE_URL: Optional[str] = None
+    
     # 데이터베이스 풀 설정
     DB_POOL_SIZE: int = 5
     DB_POOL_RECYCLE: int = 300  # 5분
@@ -51,6 +59,79 @@ class Settings(BaseSettings):
     UPLOAD_DIRECTORY: str = "./uploads"
     MAX_FILE_SIZE: int = 5 * 1024 * 1024  # 5MB
     ALLOWED_EXTENSIONS: List[str] = [".jpg", ".jpeg", ".png", ".gif", ".webp"]
+    UPLOAD_URL_PREFIX: str = "/uploads"  # 업로드 파일 제공 경로
+    
+    # === 메뉴 이미지 변형 ===
+    IMAGE_VARIANT_WIDTHS: List[int] = [200, 400, 800]  # 업로드마다 만드는 WebP 너비 (px)
+    IMAGE_CARD_WIDTH: int = 400  # Menu.image_url 로 쓰는 변형 너비 (200px 카드의 2배 해상도)
+    IMAGE_WEBP_QUALITY: int = 80
+    IMAGE_MAX_PIXELS: int = 40_000_000  # 이보다 해상도가 큰 이미지는 거부 (압축 폭탄 방지)
+    IMAGE_PROCESS_WORKERS: int = 1  # 리사이즈/인코딩 프로세스 수
+    IMAGE_PROCESS_MAX_QUEUE: int = 4  # 프로세스를 기다리는 최대 작업 수 (초과 시 503)
+    IMAGE_GC_GRACE_HOURS: float = 24  # 참조가 0 이 된 이미지를 삭제하기 전 유예 시간 (scripts/gc_images.py)
+    
+    # === 캐시 설정 ===
+    CATALOG_CACHE_MAX_ENTRIES: int = 512  # 카탈로그 조회 캐시 최대 항목 수
+    CATALOG_CACHE_MAX_AGE: int = 0  # 카탈로그 응답 Cache-Control max-age (초)
+    CATALOG_STALE_WHILE_REVALIDATE: int = 60  # stale-while-revalidate (초, 0이면 미사용)
+    CATALOG_SNAPSHOT_ENABLED: bool = True  # 직렬화된 카탈로그 스냅샷으로 조회 응답
+    CATALOG_COMPRESS_MIN_SIZE: int = 1024  # 이 크기(바이트) 이상 본문만 gzip/brotli 압축
+    
+    # === 메뉴 일괄 등록 ===
+    BULK_IMPORT_MAX_SIZE: int = 20 * 1024 * 1024  # 20MB
+    BULK_IMPORT_BATCH_SIZE: int = 500  # 한 번에 INSERT/UPDATE 할 행 수
+    BULK_IMPORT_MAX_ERRORS: int = 100  # 결과에 포함할 최대 오류 수
+    
+    # === 주문 멱등성 (Idempotency-Key) ===
+    IDEMPOTENCY_TTL_SECONDS: int = 24 * 60 * 60  # 완료된 응답 보관 기간 (24시간)
+    IDEMPOTENCY_CACHE_MAX_ENTRIES: int = 10000  # 메모리 캐시 최대 항목 수
+    IDEMPOTENCY_WAIT_TIMEOUT: int = 30  # 처리 중인 같은 키 요청을 기다리는 최대 시간 (초)
+    IDEMPOTENCY_PURGE_INTERVAL: int = 300  # 만료 항목 삭제 주기 (초)
+    
+    # === 주문 상태 스트림 (SSE) ===
+    ORDER_EVENT_BUFFER_SIZE: int = 1000  # Last-Event-ID 재개용으로 보관할 최근 이벤트 수
+    ORDER_STREAM_QUEUE_SIZE: int = 100  # 구독자별 미전송 이벤트 한도 (초과 시 연결 종료)
+    ORDER_STREAM_HEARTBEAT: float = 15.0  # 이벤트가 없을 때 keep-alive 전송 간격 (초)
+    ORDER_STREAM_RETRY_MS: int = 3000  # 클라이언트 재연결 대기 시간 (밀리초)
+    ORDER_STREAM_MAX_SUBSCRIBERS: int = 50  # 동시 구독자 한도 (초과 시 503)
+    
+    # === 주문 그룹 커밋 ===
+    ORDER_GROUP_COMMIT_ENABLED: bool = False  # 동시 주문을 모아 한 트랜잭션으로 커밋
+    ORDER_GROUP_COMMIT_WINDOW_MS: float = 5.0  # 첫 주문 이후 배치를 모으는 시간 (밀리초)
+    ORDER_GROUP_COMMIT_MAX_BATCH: int = 100  # 배치당 최대 주문 수 (도달 시 즉시 커밋)
+    
+    # === 픽업 시간대 ===
+    PICKUP_SLOT_MINUTES: int = 5  # 시간대 길이 (분)
+    PICKUP_SLOT_CAPACITY: int = 10  # 시간대별 최대 주문 수
+    PICKUP_SLOT_LEAD_MINUTES: int = 10  # 주문 후 준비에 필요한 최소 시간 (분)
+    PICKUP_SLOT_HORIZON_MINUTES: int = 120  # 예약 가능한 최대 시간 (분)
+    PICKUP_SLOT_CACHE_TTL: float = 5.0  # 메모리 예약 수를 DB와 다시 맞추는 주기 (초)
+    
+    # === 통계 대시보드 ===
+    STATS_DEFAULT_RANGE_DAYS: int = 7  # 기간 미지정 시 조회 일수 (오늘 포함)
+    STATS_MAX_RANGE_DAYS: int = 366  # 한 번에 조회할 수 있는 최대 일수
+    
+    # === 주문 보관 ===
+    ORDER_ARCHIVE_AFTER_DAYS: int = 90  # 생성 후 이 기간이 지난 완료/취소 주문을 보관 테이블로 이동
+    ORDER_ARCHIVE_BATCH_SIZE: int = 500  # 한 트랜잭션에서 이동할 주문 수
+    ORDER_ARCHIVE_BATCH_PAUSE: float = 0.1  # 배치 사이 대기 시간 (초)
+    
+    # === 회계 내보내기 ===
+    EXPORT_CHUNK_SIZE: int = 5000  # 서버 측 커서에서 한 번에 받아 직렬화할 행 수
+    
+    # === 요청 제한 (토큰 버킷, 키별로 CAPACITY 개까지 연속 허용 후 분당 PER_MINUTE 개) ===
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_TRUST_FORWARDED: bool = False  # 프록시 뒤에서 X-Forwarded-For 첫 주소를 클라이언트 IP로 사용
+    RATE_LIMIT_MAX_BUCKETS: int = 10000  # 정책별 최대 버킷 수 (초과 시 가장 오래 쓰지 않은 버킷 제거)
+    RATE_LIMIT_SWEEP_INTERVAL: float = 60.0  # 쉬고 있는 버킷 제거 주기 (초)
+    RATE_LIMIT_LOGIN_CAPACITY: int = 5  # 로그인 (클라이언트 IP별)
+    RATE_LIMIT_LOGIN_PER_MINUTE: float = 10
+    RATE_LIMIT_PASSWORD_CAPACITY: int = 3  # 비밀번호 변경 (사용자 ID별)
+    RATE_LIMIT_PASSWORD_PER_MINUTE: float = 5
+    RATE_LIMIT_ORDER_CAPACITY: int = 10  # 주문 생성 (클라이언트 IP별)
+    RATE_LIMIT_ORDER_PER_MINUTE: float = 30
+    RATE_LIMIT_ORDER_PHONE_CAPACITY: int = 3  # 주문 생성 (전화번호별)
+    RATE_LIMIT_ORDER_PHONE_PER_MINUTE: float = 6
     
     # === 로깅 설정 ===
     LOG_LEVEL: str = "INFO"
@@ -70,12 +151,28 @@ class Settings(BaseSettings):
     
     @property
     def database_url(self) -> str:
-        """MySQL 데이터베이스 URL 생성"""
+        """MySQL 데이터베이스 URL 생성 (동기 드라이버: PyMySQL)"""
+        if self.DATABASE_URL:
+            return self.DATABASE_URL
         return (
             f"mysql+pymysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@"
             f"{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}?charset=utf8mb4"
         )
     
+    @property
+    def async_database_url(self) -> str:
+        """비동기 드라이버 URL 생성 (MySQL: aiomysql, SQLite: aiosqlite)"""
+        url = self.database_url
+        if url.startswith("mysql+pymysql://"):
+            return url.replace("mysql+pymysql://", "mysql+aiomysql://", 1)
+        if url.startswith("sqlite://"):
+            return url.replace("sqlite://", "sqlite+aiosqlite://", 1)
+        return url
+    
+    @property
+    def is_sqlite(self) -> bool:
+        return self.database_url.startswith("sqlite")
+    
     @property
     def is_development(self) -> bool:
         return self.ENVIRONMENT == "development"
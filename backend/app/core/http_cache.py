@@ -0,0 +1,144 @@
+"""
+HTTP Cache Module
+
+카탈로그 엔드포인트용 ETag / If-None-Match / Cache-Control 처리
+ETag는 카탈로그 버전에서 파생되므로 조회·직렬화 없이 304 응답 가능
+미리 직렬화된 JSON 본문의 gzip/brotli 압축 및 Accept-Encoding 협상 제공
+내용 주소(해시) 경로의 정적 파일은 재검증 없이 캐시하도록 Cache-Control: immutable 제공
+"""
+import gzip
+import hashlib
+import secrets
+from typing import Dict, Optional, Tuple
+
+from fastapi import Request, Response
+from fastapi.staticfiles import StaticFiles
+
+from app.core.cache import catalog_cache
+from app.core.config import settings
+
+try:
+    import brotli
+except ImportError:  # 선택적 의존성: 설치된 경우에만 br 인코딩 지원
+    brotli = None
+
+# 프로세스별 식별자: 워커마다 카탈로그 버전이 독립적이므로 ETag 충돌 방지
+_instance_id = secrets.token_hex(4)
+
+# 선호 순서대로 나열한 지원 인코딩
+SUPPORTED_ENCODINGS = ("br", "gzip") if brotli else ("gzip",)
+
+# 경로가 바뀌지 않는 한 내용도 바뀌지 않는 파일용 (1년, 브라우저/프록시 재검증 없음)
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+def catalog_etag(request: Request) -> str:
+    """현재 카탈로그 버전과 요청 URL(경로+쿼리)로 강한 ETag 생성"""
+    resource = f"{request.url.path}?{request.url.query}".encode()
+    digest = hashlib.blake2b(resource, digest_size=6).hexdigest()
+    return f'"{_instance_id}-{catalog_cache.version}-{digest}"'
+
+def cache_control_value() -> str:
+    """설정 기반 Cache-Control 헤더 값"""
+    value = f"public, max-age={settings.CATALOG_CACHE_MAX_AGE}"
+    if settings.CATALOG_STALE_WHILE_REVALIDATE > 0:
+        value += f", stale-while-revalidate={settings.CATALOG_STALE_WHILE_REVALIDATE}"
+    return value
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """If-None-Match 헤더가 ETag와 일치하는지 확인 (약한 비교)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    accepted = {etag} | {encoded_etag(etag, encoding) for encoding in SUPPORTED_ENCODINGS}
+    candidates = (tag.strip() for tag in header.split(","))
+    return any(tag.removeprefix("W/") in accepted for tag in candidates)
+
+def encoded_etag(etag: str, encoding: Optional[str]) -> str:
+    """압축된 표현용 ETag (강한 ETag는 인코딩별로 달라야 함)"""
+    if not encoding:
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+def set_cache_headers(response: Response, etag: str) -> None:
+    """응답에 ETag, Cache-Control 헤더 설정"""
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control_value()
+
+def not_modified_response(etag: str) -> Response:
+    """본문 없는 304 Not Modified 응답 생성"""
+    response = Response(status_code=304)
+    set_cache_headers(response, etag)
+    return response
+
+def negotiate_encoding(request: Request) -> Optional[str]:
+    """Accept-Encoding 헤더에서 사용할 압축 방식 선택 (q=0은 거부로 처리)"""
+    header = request.headers.get("accept-encoding")
+    if not header:
+        return None
+    accepted = set()
+    for part in header.split(","):
+        name, _, params = part.partition(";")
+        params = params.replace(" ", "")
+        if params.startswith("q="):
+            try:
+                if float(params[2:]) <= 0:
+                    continue
+            except ValueError:
+                continue
+        accepted.add(name.strip().lower())
+    for encoding in SUPPORTED_ENCODINGS:
+        if encoding in accepted:
+            return encoding
+    return None
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """본문 압축"""
+    if encoding == "br":
+        return brotli.compress(body, quality=5)
+    return gzip.compress(body, compresslevel=6)
+
+class EncodedBody:
+    """
+    미리 직렬화된 JSON 본문
+
+    인코딩별 압축 결과를 처음 요청될 때 한 번만 만들어 보관
+    CATALOG_COMPRESS_MIN_SIZE 미만의 작은 본문은 압축하지 않음
+    """
+    __slots__ = ("body", "_encoded")
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self._encoded: Dict[str, bytes] = {}
+
+    def encode(self, encoding: Optional[str]) -> Tuple[bytes, Optional[str]]:
+        if not encoding or len(self.body) < settings.CATALOG_COMPRESS_MIN_SIZE:
+            return self.body, None
+        encoded = self._encoded.get(encoding)
+        if encoded is None:
+            encoded = self._encoded[encoding] = compress(self.body, encoding)
+        return encoded, encoding
+
+def encoded_response(
+    request: Request,
+    body: EncodedBody,
+    etag: str,
+    headers: Optional[Dict[str, str]] = None
+) -> Response:
+    """미리 직렬화된 본문을 검증/재직렬화 없이 그대로 반환하는 JSON 응답 생성"""
+    content, encoding = body.encode(negotiate_encoding(request))
+    response = Response(content=content, media_type="application/json", headers=headers)
+    set_cache_headers(response, encoded_etag(etag, encoding))
+    response.headers["Vary"] = "Accept-Encoding"
+    if encoding:
+        response.headers["Content-Encoding"] = encoding
+    return response
+
+class ImmutableStaticFiles(StaticFiles):
+    """내용 해시가 경로에 포함된 정적 파일 (업로드 이미지 변형)"""
+
+    def file_response(self, *args, **kwargs) -> Response:
+        response = super().file_response(*args, **kwargs)
+        response.headers["Cache-Control"] = IMMUTABLE_CACHE_CONTROL
+        return response
@@ -0,0 +1,140 @@
+"""
+Image Processing Module
+
+업로드 이미지 → 너비별 WebP 변형 생성 (Pillow)
+- 디코딩/리사이즈/인코딩은 CPU 작업이므로 이벤트 루프가 아닌 전용 프로세스 풀(ImageProcessor)에서 실행
+  → 동시 작업 수는 IMAGE_PROCESS_WORKERS, 대기 작업은 IMAGE_PROCESS_MAX_QUEUE 로 제한 (초과 시 ImageProcessorBusy)
+  → 작업 프로세스는 spawn 으로 시작 (이벤트 루프/DB 연결/스레드를 물려받지 않음)
+- 원본보다 큰 너비로는 확대하지 않음, EXIF 회전 정보는 픽셀에 반영, 움직이는 GIF 는 첫 프레임만 사용
+- IMAGE_MAX_PIXELS 를 넘는 이미지는 디코딩 전에 거부 (압축 폭탄 방지)
+
+render_variants 는 작업 프로세스에서 실행되므로 설정 대신 인자로 값을 받음
+"""
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from pathlib import Path
+from typing import Dict, Optional, Sequence
+
+from PIL import Image, ImageOps
+
+from app.core.config import settings
+
+# 허용하는 Content-Type → Pillow 포맷
+IMAGE_FORMATS = {
+    "image/jpeg": "JPEG",
+    "image/png": "PNG",
+    "image/gif": "GIF",
+    "image/webp": "WEBP",
+}
+
+# 포맷별 확장자 (ALLOWED_EXTENSIONS 와 대조)
+FORMAT_EXTENSIONS = {"JPEG": (".jpg", ".jpeg"), "PNG": (".png",), "GIF": (".gif",), "WEBP": (".webp",)}
+
+# 시그니처 확인에 필요한 앞부분 바이트 수
+SIGNATURE_SIZE = 12
+
+class InvalidImage(ValueError):
+    """이미지가 아니거나 허용하지 않는 포맷/크기인 경우"""
+
+class ImageProcessorBusy(RuntimeError):
+    """처리 중/대기 중인 이미지 작업이 한도를 넘은 경우"""
+
+def sniff_format(head: bytes) -> Optional[str]:
+    """파일 앞부분 시그니처로 포맷 판별 (모르면 None)"""
+    if head.startswith(b"\xff\xd8\xff"):
+        return "JPEG"
+    if head.startswith(b"\x89PNG\r\n\x1a\n"):
+        return "PNG"
+    if head[:6] in (b"GIF87a", b"GIF89a"):
+        return "GIF"
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "WEBP"
+    return None
+
+def render_variants(
+    source: str, target_dir: str, widths: Sequence[int], quality: int, max_pixels: int
+) -> Dict[str, object]:
+    """
+    source 이미지를 너비별 WebP({너비}.webp)로 target_dir 에 저장 (작업 프로세스에서 실행)
+
+    반환: {"width": 원본 너비, "height": 원본 높이, "variants": {요청 너비: 파일명}}
+    """
+    Image.MAX_IMAGE_PIXELS = max_pixels
+    try:
+        with Image.open(source) as image:
+            if image.format not in FORMAT_EXTENSIONS:
+                raise InvalidImage(f"지원하지 않는 이미지 포맷입니다 ({image.format})")
+            original_size = image.size
+            if image.width * image.height > max_pixels:
+                raise InvalidImage("이미지 해상도가 너무 큽니다")
+            largest = max(widths)
+            # JPEG 는 필요한 크기에 가깝게 축소 디코딩 (전체 해상도 디코딩 생략)
+            image.draft("RGB", (largest, largest))
+            image = ImageOps.exif_transpose(image)
+            has_alpha = image.mode in ("RGBA", "LA", "PA") or "transparency" in image.info
+            image = image.convert("RGBA" if has_alpha else "RGB")
+    except InvalidImage:
+        raise
+    except Image.DecompressionBombError:
+        raise InvalidImage("이미지 해상도가 너무 큽니다")
+    except (OSError, SyntaxError, ValueError):
+        raise InvalidImage("이미지를 읽을 수 없습니다")
+
+    os.makedirs(target_dir, exist_ok=True)
+    variants = {}
+    # 큰 너비부터 만들고 직전 결과를 다시 축소 (매번 원본에서 줄이는 것보다 빠름)
+    for width in sorted(set(widths), reverse=True):
+        if width < image.width:
+            image = image.resize(
+                (width, max(1, round(image.height * width / image.width))), Image.Resampling.LANCZOS
+            )
+        filename = f"{width}.webp"
+        image.save(os.path.join(target_dir, filename), "WEBP", quality=quality, method=4)
+        variants[width] = filename
+    return {"width": original_size[0], "height": original_size[1], "variants": variants}
+
+class ImageProcessor:
+    """이미지 변형 생성 전용 프로세스 풀"""
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._in_flight = 0
+        self.rejected = 0
+
+    async def render(self, source: Path, target_dir: Path) -> Dict[str, object]:
+        """render_variants 를 작업 프로세스에서 실행 (IMAGE_VARIANT_WIDTHS, IMAGE_WEBP_QUALITY 사용)"""
+        if self._in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise ImageProcessorBusy(f"이미지 처리 대기열이 가득 찼습니다 ({self._in_flight}건)")
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, render_variants, str(source), str(target_dir),
+                tuple(settings.IMAGE_VARIANT_WIDTHS), settings.IMAGE_WEBP_QUALITY, settings.IMAGE_MAX_PIXELS,
+            )
+        except BrokenProcessPool:
+            # 작업 프로세스가 비정상 종료(메모리 부족 등)하면 풀을 버리고 다음 요청에서 새로 만듦
+            self.shutdown()
+            raise
+        finally:
+            self._in_flight -= 1
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+# 이미지 처리 풀 인스턴스
+image_processor = ImageProcessor(
+    workers=settings.IMAGE_PROCESS_WORKERS,
+    max_queue=settings.IMAGE_PROCESS_MAX_QUEUE,
+)
@@ -0,0 +1,81 @@
+"""
+Rate Limit Module
+
+프로세스 내 토큰 버킷 요청 제한
+- 정책(로그인, 주문 등)마다 키(클라이언트 IP, 사용자 ID, 전화번호)별 버킷을 둠
+  → 버킷은 capacity 개까지 토큰을 모으고 분당 per_minute 개씩 채워짐, 요청마다 1개 소비
+- 확인은 O(1): 키로 버킷을 찾고 경과 시간만큼 채운 뒤 차감
+- 버킷은 마지막 사용 순서로 보관, 가득 찰 만큼 쉰 버킷은 RATE_LIMIT_SWEEP_INTERVAL 마다 앞에서부터 제거
+  (가득 찬 버킷은 새 버킷과 같으므로 제거해도 제한이 풀리지 않음)
+  → 전화번호처럼 요청자가 마음대로 바꿀 수 있는 키에 대비해 RATE_LIMIT_MAX_BUCKETS 로 개수 상한
+
+버킷은 프로세스별이므로 여러 워커로 실행하면 실제 한도는 워커 수만큼 늘어남
+"""
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional
+
+from app.core.config import settings
+
+class TokenBucketLimiter:
+    """키별 토큰 버킷 (한 정책)"""
+
+    def __init__(self, capacity: int, per_minute: float, max_buckets: int):
+        self.capacity = capacity
+        self.rate = per_minute / 60  # 초당 채워지는 토큰 수
+        self.max_buckets = max_buckets
+        # 빈 버킷이 가득 차는 데 걸리는 시간 (이만큼 쉰 버킷은 제거 가능)
+        self.idle_after = capacity / self.rate
+        # 키 → [남은 토큰, 마지막 갱신 시각], 마지막 사용 순
+        self._buckets: "OrderedDict[str, List[float]]" = OrderedDict()
+        self._last_sweep = time.monotonic()
+        self.rejected = 0
+
+    def acquire(self, key: str, now: Optional[float] = None) -> float:
+        """토큰 1개 소비, 허용이면 0 아니면 다음 토큰까지 남은 시간(초)"""
+        now = time.monotonic() if now is None else now
+        self._sweep(now)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = [float(self.capacity), now]
+            while len(self._buckets) > self.max_buckets:
+                self._buckets.popitem(last=False)
+        else:
+            bucket[0] = min(self.capacity, bucket[0] + (now - bucket[1]) * self.rate)
+            bucket[1] = now
+            self._buckets.move_to_end(key)
+        if bucket[0] >= 1:
+            bucket[0] -= 1
+            return 0.0
+        self.rejected += 1
+        return (1 - bucket[0]) / self.rate
+
+    def _sweep(self, now: float) -> None:
+        """RATE_LIMIT_SWEEP_INTERVAL 마다 한 번 가득 찰 만큼 쉰 버킷 제거"""
+        if now - self._last_sweep < settings.RATE_LIMIT_SWEEP_INTERVAL:
+            return
+        self._last_sweep = now
+        while self._buckets:
+            key, (_, updated) = next(iter(self._buckets.items()))
+            if now - updated < self.idle_after:
+                break
+            del self._buckets[key]
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def clear(self) -> None:
+        self._buckets.clear()
+
+def _limiter(capacity: int, per_minute: float) -> TokenBucketLimiter:
+    return TokenBucketLimiter(capacity, per_minute, settings.RATE_LIMIT_MAX_BUCKETS)
+
+# 정책별 제한기 인스턴스 (app/api/deps.py 의 rate_limit 의존성에서 사용)
+rate_limiters: Dict[str, TokenBucketLimiter] = {
+    "login": _limiter(settings.RATE_LIMIT_LOGIN_CAPACITY, settings.RATE_LIMIT_LOGIN_PER_MINUTE),
+    "password": _limiter(settings.RATE_LIMIT_PASSWORD_CAPACITY, settings.RATE_LIMIT_PASSWORD_PER_MINUTE),
+    "order": _limiter(settings.RATE_LIMIT_ORDER_CAPACITY, settings.RATE_LIMIT_ORDER_PER_MINUTE),
+    "order_phone": _limiter(
+        settings.RATE_LIMIT_ORDER_PHONE_CAPACITY, settings.RATE_LIMIT_ORDER_PHONE_PER_MINUTE
+    ),
+}
@@ -0,0 +1,191 @@
+"""
+Security Module
+
+JWT 액세스 토큰 발급/검증, 비밀번호 해싱, 인증 주체(Principal) 캐시
+- 토큰에는 사용자 ID(sub)와 만료 시각(exp)만 담고 권한(is_admin/is_active)은 담지 않음
+  → 비활성화/권한 변경이 토큰 만료를 기다리지 않고 반영됨
+- 검증된 토큰 → Principal(사용자 ID, 권한 플래그)을 크기/TTL 제한 LRU 에 보관
+  → 캐시가 유효한 동안은 서명 검증과 users 조회 없이 인증 (관리자 대시보드 폴링 대비)
+  → 항목 수명은 AUTH_PRINCIPAL_CACHE_TTL 과 토큰 만료 중 짧은 쪽
+- 사용자 비활성화/권한 변경 시 invalidate_user 로 해당 사용자 항목 제거
+- bcrypt 해싱/검증(수백 ms)은 이벤트 루프가 아닌 전용 스레드 풀(PasswordHasher)에서 실행
+  → 동시 작업 수는 PASSWORD_HASH_WORKERS, 대기 작업은 PASSWORD_HASH_MAX_QUEUE 로 제한
+    (한도를 넘으면 PasswordHasherBusy, 로그인 폭주가 다른 요청의 지연으로 번지지 않게 함)
+  → 저장된 해시의 cost 가 PASSWORD_BCRYPT_ROUNDS 와 다르면 로그인 시 새 해시 반환 (재해싱)
+  → 없는 사용자 로그인도 verify_dummy 로 같은 검증 시간을 소비 (응답 시간으로 아이디 존재 여부 노출 방지)
+
+캐시는 프로세스별이므로 여러 워커로 실행하면 다른 워커에는 최대 TTL 만큼 늦게 반영됨
+"""
+import asyncio
+import secrets
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Optional, Tuple, TypeVar
+
+from jose import JWTError, jwt
+from passlib.context import CryptContext
+
+from app.core.config import settings
+
+# 비밀번호 해싱 컨텍스트
+# min/max_rounds 를 기본값과 같게 두어 cost 가 다른 기존 해시는 verify_and_update 에서 재해싱 대상이 됨
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.PASSWORD_BCRYPT_ROUNDS,
+)
+
+T = TypeVar("T")
+
+class InvalidToken(ValueError):
+    """서명/만료/형식이 올바르지 않은 토큰"""
+
+@dataclass(frozen=True)
+class Principal:
+    """인증된 요청 주체 (토큰 검증 + users 조회 결과)"""
+    user_id: int
+    username: str
+    is_admin: bool
+    is_active: bool
+
+class PasswordHasherBusy(RuntimeError):
+    """처리 중/대기 중인 해싱 작업이 한도를 넘은 경우"""
+
+def hash_password(password: str) -> str:
+    """동기 해싱 (초기화 스크립트용, API 에서는 password_hasher 사용)"""
+    return pwd_context.hash(password)
+
+class PasswordHasher:
+    """
+    bcrypt 해싱/검증 전용 스레드 풀
+
+    bcrypt 는 해싱 중 GIL 을 놓으므로 프로세스 풀 없이도 이벤트 루프가 멈추지 않음
+    """
+
+    def __init__(self, workers: int, max_queue: int):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+        self._dummy_hash: Optional[str] = None
+        self.rejected = 0
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self._in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise PasswordHasherBusy(f"비밀번호 처리 대기열이 가득 찼습니다 ({self._in_flight}건)")
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="password")
+        self._in_flight += 1
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self._in_flight -= 1
+
+    async def hash(self, password: str) -> str:
+        return await self._run(pwd_context.hash, password)
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        """(일치 여부, cost 가 바뀌었으면 새 해시 아니면 None)"""
+        return await self._run(pwd_context.verify_and_update, password, hashed_password)
+
+    async def verify_dummy(self, password: str) -> None:
+        """
+        고정 해시로 검증만 하고 결과는 버림 (없는 사용자도 실제 검증과 같은 시간이 걸리도록)
+
+        해시는 처음 쓸 때 현재 cost 로 한 번 생성
+        """
+        if self._dummy_hash is None:
+            self._dummy_hash = await self.hash(secrets.token_urlsafe(16))
+        await self._run(pwd_context.verify, password, self._dummy_hash)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+def create_access_token(user_id: int, expires_delta: Optional[timedelta] = None) -> str:
+    """사용자 ID 로 액세스 토큰 발급 (기본 만료: ACCESS_TOKEN_EXPIRE_MINUTES)"""
+    now = datetime.now(timezone.utc)
+    expire = now + (expires_delta or timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES))
+    claims = {"sub": str(user_id), "iat": now, "exp": expire}
+    return jwt.encode(claims, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+
+def decode_access_token(token: str) -> Tuple[int, float]:
+    """토큰 검증 후 (사용자 ID, 만료 시각 epoch 초) 반환"""
+    try:
+        claims = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+        return int(claims["sub"]), float(claims["exp"])
+    except (JWTError, KeyError, TypeError, ValueError) as e:
+        raise InvalidToken(str(e)) from e
+
+class PrincipalCache:
+    """검증된 토큰 → Principal LRU (크기/TTL 제한)"""
+
+    def __init__(self, max_entries: int, ttl: float):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        # 토큰 → (만료 시각 epoch 초, Principal)
+        self._entries: "OrderedDict[str, Tuple[float, Principal]]" = OrderedDict()
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def generation(self) -> int:
+        """무효화 세대 (users 조회 전에 읽어 두었다가 set 에 전달)"""
+        return self._generation
+
+    def get(self, token: str) -> Optional[Principal]:
+        """캐시 조회 (없거나 만료되면 None)"""
+        entry = self._entries.get(token)
+        if entry is None or entry[0] <= time.time():
+            if entry is not None:
+                del self._entries[token]
+            self.misses += 1
+            return None
+        self._entries.move_to_end(token)
+        self.hits += 1
+        return entry[1]
+
+    def set(self, token: str, principal: Principal, token_expires_at: float, generation: int) -> None:
+        """
+        캐시 저장 (TTL 과 토큰 만료 중 이른 시각까지 유효)
+
+        조회하는 동안 무효화가 일어났으면 (세대가 바뀌었으면) 변경 전 권한일 수 있으므로 저장하지 않음
+        """
+        if generation != self._generation:
+            return
+        self._entries[token] = (min(time.time() + self.ttl, token_expires_at), principal)
+        self._entries.move_to_end(token)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate_user(self, user_id: int) -> int:
+        """사용자의 모든 토큰 항목 제거 (비활성화/권한 변경 시), 제거한 수 반환"""
+        self._generation += 1
+        tokens = [token for token, (_, principal) in self._entries.items() if principal.user_id == user_id]
+        for token in tokens:
+            del self._entries[token]
+        return len(tokens)
+
+    def clear(self) -> None:
+        self._generation += 1
+        self._entries.clear()
+
+# 인증 주체 캐시 인스턴스
+principal_cache = PrincipalCache(
+    max_entries=settings.AUTH_PRINCIPAL_CACHE_MAX_ENTRIES,
+    ttl=settings.AUTH_PRINCIPAL_CACHE_TTL,
+)
+
+# 비밀번호 해싱 풀 인스턴스
+password_hasher = PasswordHasher(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+)
@@ -2,30 +2,54 @@
 Database Connection Module
 
 SQLAlchemy 엔진, 세션, Base 클래스 설정
-OCI MySQL 인스턴스 연결 전용
+OCI MySQL 인스턴스 연결 전용 (테스트 시 SQLite 대체 가능)
+
+- 동기 엔진/세션: 초기화 스크립트, Alembic 마이그레이션용 (PyMySQL)
+- 비동기 엔진/세션: API 엔드포인트용 (aiomysql, 이벤트 루프 블로킹 방지)
 """
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-# MySQL 전용 엔진 생성
-engine = create_engine(
-    settings.database_url,
-    pool_size=settings.DB_POOL_SIZE,
-    pool_recycle=settings.DB_POOL_RECYCLE,
-    pool_pre_ping=settings.DB_POOL_PRE_PING,
-    echo=settings.DEBUG  # 개발 환경에서 SQL 로그 출력
-)
+def _engine_options() -> dict:
+    """엔진 공통 옵션 (SQLite는 풀 설정 미지원)"""
+    options = {"echo": settings.DEBUG}  # 개발 환경에서 SQL 로그 출력
+    if not settings.is_sqlite:
+        options.update(
+            pool_size=settings.DB_POOL_SIZE,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
+    return options
+
+# MySQL 전용 엔진 생성 (동기)
+engine = create_engine(settings.database_url, **_engine_options())
+
+# 비동기 엔진 생성
+async_engine = create_async_engine(settings.async_database_url, **_engine_options())
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: 커밋 후 속성 접근 시 암묵적 I/O(지연 로딩) 방지
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
 Base = declarative_base()
 
 # 데이터베이스 세션 의존성
 def get_db():
-    """데이터베이스 세션 생성 및 관리"""
+    """데이터베이스 세션 생성 및 관리 (동기)"""
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close() 
\ No newline at end of file
+        db.close()
+
+async def get_async_db():
+    """비동기 데이터베이스 세션 생성 및 관리"""
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,57 @@
+"""
+Query Counter Module
+
+엔진에서 실행되는 SQL 문을 세어 N+1 쿼리 회귀를 검출하기 위한 도구
+동기/비동기 엔진 모두 지원
+
+사용 예:
+    with assert_query_count(async_engine, 1):
+        await client.get("/api/v1/menus")
+"""
+from contextlib import contextmanager
+from typing import Any, Iterator, List, Tuple, Union
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+class QueryCounter:
+    """before_cursor_execute 이벤트로 실행된 SQL 문 기록"""
+
+    def __init__(self, engine: Union[Engine, AsyncEngine]):
+        self.engine = getattr(engine, "sync_engine", engine)
+        self.statements: List[str] = []
+        # (SQL, 파라미터) 목록 - 실행 계획(EXPLAIN) 점검용
+        self.executions: List[Tuple[str, Any]] = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+        self.executions.append((statement, parameters))
+
+    def __enter__(self) -> "QueryCounter":
+        event.listen(self.engine, "before_cursor_execute", self._on_execute)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        event.remove(self.engine, "before_cursor_execute", self._on_execute)
+
+@contextmanager
+def count_queries(engine: Union[Engine, AsyncEngine]) -> Iterator[QueryCounter]:
+    """블록 안에서 실행된 SQL 문 수 측정"""
+    with QueryCounter(engine) as counter:
+        yield counter
+
+@contextmanager
+def assert_query_count(engine: Union[Engine, AsyncEngine], expected: int) -> Iterator[QueryCounter]:
+    """블록 안에서 정확히 expected개의 SQL 문이 실행되었는지 검증"""
+    with QueryCounter(engine) as counter:
+        yield counter
+    if counter.count != expected:
+        executed = "\n".join(f"  {i + 1}. {sql}" for i, sql in enumerate(counter.statements))
+        raise AssertionError(
+            f"예상 쿼리 수 {expected}개, 실제 {counter.count}개 실행:\n{executed}"
+        )
@@ -4,9 +4,16 @@ from contextlib import asynccontextmanager
 
 from app.core.config import settings
 from app.core.logger import logger
-from app.db.base import engine, Base
-from app.api.endpoints import menu
-from app.models import Category, Menu, User, Order, OrderItem  # 모든 모델 import
+from app.core.http_cache import ImmutableStaticFiles
+from app.core.images import image_processor
+from app.core.security import password_hasher
+from app.db.base import async_engine, Base
+from app.services.image_store import images_dir
+from app.api.endpoints import admin, auth, menu, order
+from app.models import (  # 모든 모델 import
+    Category, Menu, User, Order, OrderItem, IdempotencyKey, PickupSlot, SalesHourly, SalesDaily,
+    ArchivedOrder, ArchivedOrderItem, ImageFile
+)
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -18,7 +25,8 @@ async def lifespan(app: FastAPI):
     
     # 데이터베이스 테이블 생성
     try:
-        Base.metadata.create_all(bind=engine)
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
         logger.info("데이터베이스 테이블 생성 완료")
     except Exception as e:
         logger.error(f"데이터베이스 테이블 생성 실패: {e}")
@@ -27,6 +35,9 @@ async def lifespan(app: FastAPI):
     yield
     
     # 종료 시 실행
+    password_hasher.shutdown()
+    image_processor.shutdown()
+    await async_engine.dispose()
     logger.info("=== 카페 API 서버 종료 ===")
 
 # FastAPI 앱 생성
@@ -43,8 +54,9 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.BACKEND_CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"],
+    expose_headers=["ETag", "X-Next-Cursor", "Idempotent-Replayed", "Retry-After"],
 )
 
 # 라우터 등록
@@ -53,6 +65,28 @@ app.include_router(
     prefix=settings.API_V1_STR, 
     tags=["메뉴"]
 )
+app.include_router(
+    order.router,
+    prefix=settings.API_V1_STR,
+    tags=["주문"]
+)
+app.include_router(
+    auth.router,
+    prefix=settings.API_V1_STR,
+    tags=["인증"]
+)
+app.include_router(
+    admin.router,
+    prefix=settings.API_V1_STR,
+    tags=["관리자"]
+)
+
+# 업로드 이미지 변형 (내용 해시 경로, Cache-Control: immutable)
+app.mount(
+    f"{settings.UPLOAD_URL_PREFIX.rstrip('/')}/images",
+    ImmutableStaticFiles(directory=images_dir()),
+    name="images",
+)
 
 # 루트 엔드포인트
 @app.get("/")
@@ -2,6 +2,11 @@
 from .menu import Category, Menu
 from .user import User
 from .order import Order, OrderItem, OrderStatus
+from .idempotency import IdempotencyKey
+from .pickup import PickupSlot
+from .stats import SalesHourly, SalesDaily
+from .archive import ArchivedOrder, ArchivedOrderItem
+from .image import ImageFile
 
 __all__ = [
     "Category",
@@ -9,5 +14,12 @@ __all__ = [
     "User",
     "Order",
     "OrderItem",
-    "OrderStatus"
+    "OrderStatus",
+    "IdempotencyKey",
+    "PickupSlot",
+    "SalesHourly",
+    "SalesDaily",
+    "ArchivedOrder",
+    "ArchivedOrderItem",
+    "ImageFile"
 ] 
@@ -0,0 +1,44 @@
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func, Enum, Text, Index
+from sqlalchemy.orm import relationship
+from app.db.base import Base
+from app.models.order import OrderStatus
+
+class ArchivedOrder(Base):
+    """보관 기간이 지난 완료/취소 주문 (orders 와 같은 컬럼, ID 유지)"""
+    __tablename__ = "orders_archive"
+    __table_args__ = (
+        Index("ix_orders_archive_created_at_id", "created_at", "id"),
+        Index("ix_orders_archive_status_created_at_id", "status", "created_at", "id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, nullable=True)  # 사용자 삭제와 무관하게 보관 (FK 없음)
+    total_amount = Column(Integer)
+    status = Column(Enum(OrderStatus))
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+    customer_name = Column(String(50))
+    customer_phone = Column(String(20))
+    pickup_time = Column(DateTime)
+    notes = Column(Text)
+    created_at = Column(DateTime)
+    updated_at = Column(DateTime)
+    archived_at = Column(DateTime, server_default=func.now())  # 보관 테이블로 옮긴 시각
+    
+    order_items = relationship("ArchivedOrderItem", back_populates="order")
+
+class ArchivedOrderItem(Base):
+    """보관된 주문의 항목 (order_items 와 같은 컬럼, ID 유지)"""
+    __tablename__ = "order_items_archive"
+    __table_args__ = (
+        Index("ix_order_items_archive_order_id", "order_id"),
+    )
+    
+    id = Column(Integer, primary_key=True)
+    order_id = Column(Integer, ForeignKey("orders_archive.id"))
+    menu_id = Column(Integer)  # 메뉴가 삭제되어도 보관 (FK 없음)
+    quantity = Column(Integer)
+    price = Column(Integer)
+    subtotal = Column(Integer)
+    options = Column(String(200))
+    
+    order = relationship("ArchivedOrder", back_populates="order_items")
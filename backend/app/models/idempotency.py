@@ -0,0 +1,13 @@
+from sqlalchemy import Column, Integer, String, Text, DateTime, func
+from app.db.base import Base
+
+class IdempotencyKey(Base):
+    """Idempotency-Key 헤더별로 완료된 응답 저장 (재시도 시 그대로 재전송)"""
+    __tablename__ = "idempotency_keys"
+    
+    key = Column(String(100), primary_key=True)  # 클라이언트가 보낸 Idempotency-Key
+    fingerprint = Column(String(64))  # 요청 경로+본문 해시 (같은 키로 다른 요청 방지)
+    status_code = Column(Integer)
+    response_body = Column(Text)  # 직렬화된 JSON 응답
+    created_at = Column(DateTime, server_default=func.now())
+    expires_at = Column(DateTime, index=True)  # 만료 후 정리 대상
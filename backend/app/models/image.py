@@ -0,0 +1,18 @@
+from sqlalchemy import Column, DateTime, Index, Integer, String, func
+from app.db.base import Base
+
+class ImageFile(Base):
+    """내용 해시로 저장된 업로드 이미지 (같은 바이트는 한 번만 저장, 메뉴가 image_url 로 참조)"""
+    __tablename__ = "image_files"
+    __table_args__ = (
+        # 정리 대상(참조 0, 유예 기간 경과) 조회용
+        Index("ix_image_files_ref_count_updated_at", "ref_count", "updated_at"),
+    )
+    
+    content_hash = Column(String(64), primary_key=True)  # 업로드 원본 SHA-256 (hex)
+    size = Column(Integer, nullable=False)  # 원본 크기 (바이트)
+    width = Column(Integer, nullable=False)  # 원본 너비
+    height = Column(Integer, nullable=False)  # 원본 높이
+    ref_count = Column(Integer, nullable=False, default=0)  # 이 이미지를 image_url 로 쓰는 메뉴 수
+    created_at = Column(DateTime, server_default=func.now())
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Boolean, ForeignKey, Index, UniqueConstraint
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 
@@ -14,6 +14,16 @@ class Category(Base):
 
 class Menu(Base):
     __tablename__ = "menus"
+    __table_args__ = (
+        # 메뉴 목록 정렬/키셋 페이지네이션 (category_id, id) 탐색용
+        Index("ix_menus_category_id_id", "category_id", "id"),
+        # 카테고리 + 판매 여부 필터 후 id 순 정렬 (GET /menus?category_id=..)
+        Index("ix_menus_category_id_is_available_id", "category_id", "is_available", "id"),
+        # 판매 여부 필터 후 (category_id, id) 순 정렬 (GET /menus 기본 조회)
+        Index("ix_menus_is_available_category_id_id", "is_available", "category_id", "id"),
+        # 같은 카테고리 내 메뉴명 중복 방지 (중복 확인 조회에도 사용)
+        UniqueConstraint("category_id", "name", name="uq_menus_category_id_name"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String(200), index=True)  # 길이 추가
@@ -24,4 +34,5 @@ class Menu(Base):
     is_available = Column(Boolean, default=True)
     
     # 관계 설정
-    category = relationship("Category", back_populates="menus") 
\ No newline at end of file
+    # 지연 로딩 금지: 조회 시 joinedload 등으로 명시적으로 로딩해야 함 (N+1 쿼리 방지)
+    category = relationship("Category", back_populates="menus", lazy="raise_on_sql") 
\ No newline at end of file
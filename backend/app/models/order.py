@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func, Enum, Text
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, func, Enum, Text, Index
 from sqlalchemy.orm import relationship
 from app.db.base import Base
 import enum
@@ -13,11 +13,18 @@ class OrderStatus(enum.Enum):
 
 class Order(Base):
     __tablename__ = "orders"
+    __table_args__ = (
+        # 관리자 주문 목록: 최신순 키셋 페이지네이션 (created_at, id)
+        Index("ix_orders_created_at_id", "created_at", "id"),
+        # 상태 필터 + 최신순
+        Index("ix_orders_status_created_at_id", "status", "created_at", "id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=True)  # 비회원 주문 허용
     total_amount = Column(Integer)  # 총 금액 (원 단위)
     status = Column(Enum(OrderStatus), default=OrderStatus.PENDING)
+    version = Column(Integer, nullable=False, default=1, server_default="1")  # 상태 변경마다 1 증가 (낙관적 잠금)
     customer_name = Column(String(50))  # 주문자명
     customer_phone = Column(String(20))  # 연락처
     pickup_time = Column(DateTime)  # 픽업 예정 시간
@@ -31,6 +38,10 @@ class Order(Base):
 
 class OrderItem(Base):
     __tablename__ = "order_items"
+    __table_args__ = (
+        # 주문별 항목 조회/집계 (SQLite 등 FK 인덱스를 자동 생성하지 않는 DB 대비)
+        Index("ix_order_items_order_id", "order_id"),
+    )
     
     id = Column(Integer, primary_key=True, index=True)
     order_id = Column(Integer, ForeignKey("orders.id"))
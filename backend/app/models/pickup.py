@@ -0,0 +1,11 @@
+from sqlalchemy import Column, Integer, DateTime, func
+from app.db.base import Base
+
+class PickupSlot(Base):
+    """픽업 시간대별 수용량과 예약된 주문 수 (예약이 처음 들어올 때 생성)"""
+    __tablename__ = "pickup_slots"
+    
+    slot_start = Column(DateTime, primary_key=True)  # 시간대 시작 시각 (PICKUP_SLOT_MINUTES 단위)
+    capacity = Column(Integer, nullable=False)  # 이 시간대에 받을 수 있는 최대 주문 수
+    reserved = Column(Integer, nullable=False, default=0)  # 예약된(취소되지 않은) 주문 수
+    updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now())
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, Integer, DateTime, Date, Index
+from app.db.base import Base
+
+class SalesHourly(Base):
+    """시간대별(주문 시각 기준) 메뉴 판매 집계 (주문 완료 시 누적)"""
+    __tablename__ = "sales_hourly"
+    __table_args__ = (
+        # 카테고리별 집계
+        Index("ix_sales_hourly_category_id_bucket_start", "category_id", "bucket_start"),
+    )
+    
+    bucket_start = Column(DateTime, primary_key=True)  # 집계 구간 시작 (정시)
+    menu_id = Column(Integer, primary_key=True)  # 메뉴가 삭제되어도 집계는 유지 (FK 없음)
+    category_id = Column(Integer, nullable=True)  # 완료 시점의 메뉴 카테고리
+    quantity = Column(Integer, nullable=False, default=0)  # 판매 수량
+    revenue = Column(Integer, nullable=False, default=0)  # 매출 (원 단위, 항목 소계 합)
+    order_count = Column(Integer, nullable=False, default=0)  # 이 메뉴가 포함된 주문 수
+
+class SalesDaily(Base):
+    """일별(주문 일자 기준) 메뉴 판매 집계 (주문 완료 시 누적)"""
+    __tablename__ = "sales_daily"
+    __table_args__ = (
+        Index("ix_sales_daily_category_id_bucket_date", "category_id", "bucket_date"),
+    )
+    
+    bucket_date = Column(Date, primary_key=True)
+    menu_id = Column(Integer, primary_key=True)
+    category_id = Column(Integer, nullable=True)
+    quantity = Column(Integer, nullable=False, default=0)
+    revenue = Column(Integer, nullable=False, default=0)
+    order_count = Column(Integer, nullable=False, default=0)
@@ -16,4 +16,4 @@ class User(Base):
     
     # 관계 설정
     orders = relationship("Order", back_populates="user")
-    reviews = relationship("Review", back_populates="user") 
\ No newline at end of file
+    # reviews 관계는 Review 모델 추가 시 설정 (미정의 모델 참조 시 매퍼 초기화 실패) 
\ No newline at end of file
@@ -1,15 +1,19 @@
 from .menu import (
     Category, CategoryCreate,
-    Menu, MenuCreate, MenuUpdate
+    Menu, MenuCreate, MenuUpdate,
+    MenuImportError, MenuImportResult, MenuImage,
+    MenuBulkAvailability, MenuBulkPrice, CategoryReorder, BulkUpdateResult
 )
 from .user import (
-    User, UserCreate, UserUpdate, UserUpdatePassword, UserInDB,
+    User, UserCreate, UserUpdate, UserAccessUpdate, UserUpdatePassword, UserInDB,
     UserLogin, Token, TokenData
 )
 from .order import (
     Order, OrderCreate, OrderUpdate, OrderCreateResponse, OrderSummary,
-    OrderItem, OrderItemCreate, OrderItemUpdate
+    OrderItem, OrderItemCreate, OrderItemUpdate,
+    OrderStatusUpdate, OrderStatusEvent, PickupSlotAvailability
 )
+from .stats import DailySales, HourlySales, MenuSales, CategorySales
 
 __all__ = [
     # Menu schemas
@@ -18,11 +22,19 @@ __all__ = [
     "Menu",
     "MenuCreate",
     "MenuUpdate",
+    "MenuImportError",
+    "MenuImportResult",
+    "MenuImage",
+    "MenuBulkAvailability",
+    "MenuBulkPrice",
+    "CategoryReorder",
+    "BulkUpdateResult",
     
     # User schemas
     "User",
     "UserCreate",
     "UserUpdate", 
+    "UserAccessUpdate",
     "UserUpdatePassword",
     "UserInDB",
     "UserLogin",
@@ -38,4 +50,13 @@ __all__ = [
     "OrderItem",
     "OrderItemCreate",
     "OrderItemUpdate",
+    "OrderStatusUpdate",
+    "OrderStatusEvent",
+    "PickupSlotAvailability",
+    
+    # Stats schemas
+    "DailySales",
+    "HourlySales",
+    "MenuSales",
+    "CategorySales",
 ] 
\ No newline at end of file
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, List
+from pydantic import BaseModel, Field, model_validator
+from typing import Dict, Optional, List
 
 # 카테고리 스키마
 class CategoryBase(BaseModel):
@@ -20,23 +20,24 @@ class Category(CategoryBase):
         from_attributes = True
 
 # 메뉴 스키마
+# 문자열 최대 길이는 menus 컬럼 길이와 같음 (넘는 값은 DB 오류 대신 검증 오류로 거절)
 class MenuBase(BaseModel):
-    name: str
+    name: str = Field(..., max_length=200)
     category_id: int
     price: int
-    description: Optional[str] = None
-    image_url: Optional[str] = None
+    description: Optional[str] = Field(None, max_length=1000)
+    image_url: Optional[str] = Field(None, max_length=500)
     is_available: bool = True
 
 class MenuCreate(MenuBase):
     pass
 
 class MenuUpdate(BaseModel):
-    name: Optional[str] = None
+    name: Optional[str] = Field(None, max_length=200)
     category_id: Optional[int] = None
     price: Optional[int] = None
-    description: Optional[str] = None
-    image_url: Optional[str] = None
+    description: Optional[str] = Field(None, max_length=1000)
+    image_url: Optional[str] = Field(None, max_length=500)
     is_available: Optional[bool] = None
 
 class Menu(MenuBase):
@@ -44,4 +45,66 @@ class Menu(MenuBase):
     category: Optional[Category] = None
     
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True 
+
+# 메뉴 일괄 등록 결과 스키마
+class MenuImportError(BaseModel):
+    row: int  # 파일 내 줄 번호
+    message: str
+
+class MenuImportResult(BaseModel):
+    total_rows: int = 0
+    created: int = 0
+    updated: int = 0
+    failed: int = 0
+    errors: List[MenuImportError] = []
+
+# 메뉴 일괄 변경 스키마
+class MenuBulkTarget(BaseModel):
+    """변경 대상: 메뉴 ID 목록 또는 카테고리 (둘 중 하나만 지정)"""
+    menu_ids: Optional[List[int]] = Field(None, min_length=1, max_length=1000)
+    category_id: Optional[int] = None
+
+    @model_validator(mode="after")
+    def check_target(self):
+        if (self.menu_ids is None) == (self.category_id is None):
+            raise ValueError("menu_ids 또는 category_id 중 하나만 지정해야 합니다")
+        return self
+
+class MenuBulkAvailability(MenuBulkTarget):
+    is_available: bool
+
+class MenuBulkPrice(MenuBulkTarget):
+    """가격 변경: percent(%) 또는 amount(원) 중 하나만 지정"""
+    percent: Optional[float] = Field(None, gt=-100, le=1000, description="예: 10 → 10% 인상")
+    amount: Optional[int] = Field(None, description="예: -500 → 500원 인하")
+
+    @model_validator(mode="after")
+    def check_change(self):
+        if (self.percent is None) == (self.amount is None):
+            raise ValueError("percent 또는 amount 중 하나만 지정해야 합니다")
+        return self
+
+class CategoryReorder(BaseModel):
+    """카테고리 ID를 표시할 순서대로 나열 (display_order = 목록 내 위치)"""
+    category_ids: List[int] = Field(..., min_length=1)
+
+    @model_validator(mode="after")
+    def check_unique(self):
+        if len(set(self.category_ids)) != len(self.category_ids):
+            raise ValueError("category_ids에 중복된 ID가 있습니다")
+        return self
+
+class BulkUpdateResult(BaseModel):
+    updated: int
+
+# 메뉴 이미지 업로드 결과 스키마
+class MenuImage(BaseModel):
+    menu_id: int
+    content_hash: str  # 업로드 원본 SHA-256 (이미지 URL 경로에 포함)
+    image_url: str  # 메뉴 카드용 변형 (Menu.image_url)
+    variants: Dict[int, str]  # 너비(px) → WebP URL
+    width: int  # 원본 너비
+    height: int  # 원본 높이
+    size: int  # 업로드 크기 (바이트)
+    reused: bool  # 같은 내용의 이미지가 이미 있어 변환 없이 재사용했는지
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, field_validator
 from typing import Optional, List
 from datetime import datetime
 from app.models.order import OrderStatus
@@ -25,6 +25,13 @@ class OrderItem(OrderItemBase):
     class Config:
         from_attributes = True
 
+def _local_naive(value: Optional[datetime]) -> Optional[datetime]:
+    """시간대가 있는 시각(예: JS toISOString 의 ...Z)은 서버 현지 시각으로 바꾸고 시간대 정보 제거
+    (DB 컬럼과 픽업 시간대 계산은 모두 현지 naive 시각 기준)"""
+    if value is not None and value.tzinfo is not None:
+        return value.astimezone().replace(tzinfo=None)
+    return value
+
 # 주문 스키마
 class OrderBase(BaseModel):
     customer_name: str = Field(..., min_length=2, max_length=50)
@@ -32,6 +39,8 @@ class OrderBase(BaseModel):
     pickup_time: Optional[datetime] = None
     notes: Optional[str] = Field(None, max_length=500)
 
+    _pickup_time_local = field_validator("pickup_time")(_local_naive)
+
 class OrderCreate(OrderBase):
     items: List[OrderItemCreate] = Field(..., min_items=1, description="최소 1개 이상의 메뉴가 필요합니다")
 
@@ -42,11 +51,14 @@ class OrderUpdate(BaseModel):
     pickup_time: Optional[datetime] = None
     notes: Optional[str] = Field(None, max_length=500)
 
+    _pickup_time_local = field_validator("pickup_time")(_local_naive)
+
 class Order(OrderBase):
     id: int
     user_id: Optional[int] = None
     total_amount: int
     status: OrderStatus
+    version: int = 1  # 상태 변경 시 expected_version 으로 전달
     created_at: datetime
     updated_at: Optional[datetime] = None
     order_items: List[OrderItem] = []
@@ -68,6 +80,32 @@ class OrderSummary(BaseModel):
     status: OrderStatus
     created_at: datetime
     item_count: int
+    archived: bool = False  # 보관 테이블의 주문 여부
     
     class Config:
-        from_attributes = True 
\ No newline at end of file
+        from_attributes = True 
+
+# 주문 상태 변경 스키마
+class OrderStatusUpdate(BaseModel):
+    status: OrderStatus
+    expected_version: Optional[int] = Field(
+        None, ge=1, description="마지막으로 본 주문 버전 (다르면 409)"
+    )
+
+# 주문 상태 이벤트 (실시간 스트림 전송용)
+class OrderStatusEvent(BaseModel):
+    order_id: int
+    status: OrderStatus
+    previous_status: Optional[OrderStatus] = None  # 신규 주문이면 None
+    customer_name: str
+    pickup_time: Optional[datetime] = None
+    version: int
+    occurred_at: datetime
+
+# 픽업 시간대 조회 스키마
+class PickupSlotAvailability(BaseModel):
+    start: datetime
+    end: datetime
+    capacity: int
+    reserved: int
+    available: int
@@ -0,0 +1,28 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import date, datetime
+
+# 통계 대시보드 스키마 (판매 집계 테이블 기준)
+class DailySales(BaseModel):
+    date: date
+    quantity: int
+    revenue: int
+
+class HourlySales(BaseModel):
+    hour_start: datetime
+    quantity: int
+    revenue: int
+
+class MenuSales(BaseModel):
+    menu_id: int
+    menu_name: Optional[str] = None  # 삭제된 메뉴면 None
+    category_id: Optional[int] = None
+    quantity: int
+    revenue: int
+    order_count: int
+
+class CategorySales(BaseModel):
+    category_id: Optional[int] = None
+    category_name: Optional[str] = None
+    quantity: int
+    revenue: int
@@ -15,6 +15,11 @@ class UserUpdate(BaseModel):
     email: Optional[EmailStr] = None
     is_active: Optional[bool] = None
 
+class UserAccessUpdate(BaseModel):
+    """관리자용 사용자 활성 상태/권한 변경 (지정한 항목만 변경)"""
+    is_active: Optional[bool] = None
+    is_admin: Optional[bool] = None
+
 class UserUpdatePassword(BaseModel):
     current_password: str
     new_password: str = Field(..., min_length=6, max_length=100)
@@ -0,0 +1,156 @@
+"""
+Catalog Snapshot Service
+
+카탈로그 버전마다 한 번 전체 카탈로그를 JSON 바이트로 직렬화해 두고,
+조회 엔드포인트는 응답 모델 검증/JSON 인코딩 없이 이 바이트를 그대로 반환
+쓰기 발생 시 새 스냅샷을 완성한 뒤 참조만 교체하므로 읽기 측은
+항상 완전한 한 버전의 스냅샷만 보게 됨
+"""
+import asyncio
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+
+from app.core.cache import catalog_cache
+from app.core.http_cache import EncodedBody
+from app.core.logger import logger
+from app.models.menu import Category, Menu
+from app.schemas.menu import Category as CategorySchema, Menu as MenuSchema
+
+SortKey = Tuple[int, int]  # (category_id, id)
+
+def _json_array(fragments: List[bytes]) -> bytes:
+    return b"[" + b",".join(fragments) + b"]"
+
+@dataclass(frozen=True)
+class MenuView:
+    """필터 조건별 메뉴 목록 ((category_id, id) 정렬, 키와 JSON 조각이 같은 순서)"""
+    keys: List[SortKey]
+    fragments: List[bytes]
+
+class CatalogSnapshot:
+    """특정 카탈로그 버전의 직렬화된 카탈로그 (생성 후 변경하지 않음)"""
+
+    def __init__(self, version: int, categories: List[Category], menus: List[Menu]):
+        self.version = version
+        self.categories = EncodedBody(_json_array([
+            CategorySchema.model_validate(c).model_dump_json().encode() for c in categories
+        ]))
+
+        self._menus: Dict[int, EncodedBody] = {}
+        views: Dict[Tuple[Optional[int], bool], MenuView] = {}
+        for menu in menus:
+            fragment = MenuSchema.model_validate(menu).model_dump_json().encode()
+            self._menus[menu.id] = EncodedBody(fragment)
+            key = (menu.category_id, menu.id)
+            for category_id in (None, menu.category_id):
+                for available_only in (False, True):
+                    if available_only and not menu.is_available:
+                        continue
+                    view = views.setdefault(
+                        (category_id, available_only), MenuView(keys=[], fragments=[])
+                    )
+                    view.keys.append(key)
+                    view.fragments.append(fragment)
+        self._views = views
+
+    @property
+    def menu_count(self) -> int:
+        return len(self._menus)
+
+    def menu(self, menu_id: int) -> Optional[EncodedBody]:
+        """메뉴 상세 본문 (없으면 None)"""
+        return self._menus.get(menu_id)
+
+    def menus_by_ids(self, menu_ids: List[int]) -> EncodedBody:
+        """주어진 순서대로 메뉴 목록 본문 생성 (스냅샷에 없는 ID는 제외)"""
+        bodies = (self._menus.get(menu_id) for menu_id in menu_ids)
+        return EncodedBody(_json_array([body.body for body in bodies if body is not None]))
+
+    def menu_page(
+        self,
+        category_id: Optional[int],
+        available_only: bool,
+        skip: int,
+        after: Optional[SortKey],
+        limit: int
+    ) -> Tuple[EncodedBody, Optional[SortKey]]:
+        """
+        메뉴 목록 한 페이지 본문과 다음 페이지 커서용 마지막 키 반환
+
+        DB 조회 경로와 동일하게 (category_id, id) 순서이며,
+        after가 있으면 키셋 탐색, 없으면 skip 만큼 건너뜀
+        """
+        view = self._views.get((category_id or None, available_only))
+        if view is None:
+            return EncodedBody(b"[]"), None
+        start = bisect_right(view.keys, after) if after else skip
+        end = start + limit
+        body = EncodedBody(_json_array(view.fragments[start:end]))
+        last_key = view.keys[end - 1] if end < len(view.keys) else None
+        return body, last_key
+
+async def build_snapshot(db: AsyncSession, version: int) -> CatalogSnapshot:
+    """DB에서 전체 카탈로그를 읽어 스냅샷 생성 (쿼리 2회)"""
+    # 쓰기 직후 같은 세션에서 호출될 수 있으므로 세션에 남은 객체 대신 DB 값을 사용
+    categories = await db.execute(
+        select(Category)
+        .order_by(Category.display_order, Category.id)
+        .execution_options(populate_existing=True)
+    )
+    menus = await db.execute(
+        select(Menu)
+        .options(joinedload(Menu.category))
+        .order_by(Menu.category_id, Menu.id)
+        .execution_options(populate_existing=True)
+    )
+    return CatalogSnapshot(version, categories.scalars().all(), menus.scalars().all())
+
+class CatalogSnapshotStore:
+    """현재 카탈로그 스냅샷 보관 및 교체"""
+
+    def __init__(self):
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._lock = asyncio.Lock()
+
+    def _current(self) -> Optional[CatalogSnapshot]:
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == catalog_cache.version:
+            return snapshot
+        return None
+
+    async def get(self, db: AsyncSession) -> CatalogSnapshot:
+        """현재 버전의 스냅샷 반환 (없으면 한 요청만 생성하고 나머지는 대기)"""
+        snapshot = self._current()
+        if snapshot is not None:
+            return snapshot
+        async with self._lock:
+            snapshot = self._current()
+            if snapshot is not None:
+                return snapshot
+            return await self._rebuild(db)
+
+    async def refresh(self, db: AsyncSession) -> None:
+        """쓰기 직후 호출: 새 버전 스냅샷을 미리 생성 (실패 시 다음 조회에서 재시도)"""
+        try:
+            async with self._lock:
+                if self._current() is None:
+                    await self._rebuild(db)
+        except Exception as e:
+            logger.error(f"카탈로그 스냅샷 재구성 실패: {e}")
+
+    async def _rebuild(self, db: AsyncSession) -> CatalogSnapshot:
+        version = catalog_cache.version
+        snapshot = await build_snapshot(db, version)
+        # 생성 도중 다른 쓰기가 있었다면 교체하지 않음 (다음 조회에서 재구성)
+        if snapshot.version == catalog_cache.version:
+            self._snapshot = snapshot
+            logger.info(f"카탈로그 스냅샷 교체: 버전 {version}, 메뉴 {snapshot.menu_count}개")
+        return snapshot
+
+# 카탈로그 스냅샷 저장소 인스턴스
+catalog_snapshot = CatalogSnapshotStore()
@@ -0,0 +1,238 @@
+"""
+Idempotency Service
+
+Idempotency-Key 헤더로 재시도된 쓰기 요청을 한 번만 처리
+- 완료된 응답은 idempotency_keys 테이블에 저장 (TTL 만료 후 주기적으로 삭제)
+- 테이블 앞단에 크기 제한/TTL 이 있는 메모리 LRU 를 두어 재시도 응답은 DB 조회 없이 반환
+- 같은 키의 동시 요청은 먼저 들어온 요청이 끝날 때까지 기다렸다가 그 결과를 재사용
+- 응답 기록은 쓰기 작업과 같은 트랜잭션에서 INSERT 되므로, 다른 프로세스가
+  같은 키를 먼저 커밋한 경우 기본키 충돌로 이쪽 트랜잭션 전체가 롤백됨 (중복 주문 없음)
+"""
+import asyncio
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, Optional, Tuple
+
+from sqlalchemy import delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.models.idempotency import IdempotencyKey
+
+class IdempotencyKeyReused(ValueError):
+    """같은 키가 다른 내용의 요청에 사용된 경우"""
+
+class IdempotencyInProgress(RuntimeError):
+    """같은 키의 요청이 아직 처리 중이며 대기 시간을 초과한 경우"""
+
+@dataclass(frozen=True)
+class StoredResponse:
+    """저장된 완료 응답"""
+    fingerprint: str
+    status_code: int
+    body: bytes
+    expires_at: datetime
+
+# (상태 코드, 응답 본문) → (저장된 응답, 기록 행)
+RecordFactory = Callable[[int, bytes], Tuple[StoredResponse, IdempotencyKey]]
+
+def request_fingerprint(path: str, payload: Any) -> str:
+    """요청 경로와 본문(JSON 호환 값)의 SHA-256 해시"""
+    canonical = json.dumps(payload, sort_keys=True, ensure_ascii=False, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{path}\n{canonical}".encode()).hexdigest()
+
+class IdempotencyStore:
+    """메모리 LRU + 테이블 2단 응답 저장소"""
+
+    def __init__(self, max_entries: int, ttl_seconds: int):
+        self.max_entries = max_entries
+        self.ttl = timedelta(seconds=ttl_seconds)
+        self._entries: "OrderedDict[str, StoredResponse]" = OrderedDict()
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self._last_purge = time.monotonic()
+
+    def _remember(self, key: str, stored: StoredResponse) -> None:
+        self._entries[key] = stored
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, db: AsyncSession, key: str) -> Optional[StoredResponse]:
+        """저장된 응답 조회 (메모리 → 테이블 순, 만료된 항목은 없는 것으로 처리)"""
+        now = datetime.now()
+        stored = self._entries.get(key)
+        if stored is not None:
+            if stored.expires_at > now:
+                self._entries.move_to_end(key)
+                return stored
+            del self._entries[key]
+
+        row = await db.scalar(
+            select(IdempotencyKey).where(IdempotencyKey.key == key, IdempotencyKey.expires_at > now)
+        )
+        if row is None:
+            return None
+        stored = StoredResponse(
+            fingerprint=row.fingerprint,
+            status_code=row.status_code,
+            body=row.response_body.encode(),
+            expires_at=row.expires_at,
+        )
+        self._remember(key, stored)
+        return stored
+
+    def new_record(
+        self, key: str, fingerprint: str, status_code: int, body: bytes
+    ) -> Tuple[StoredResponse, IdempotencyKey]:
+        """완료 응답과 그 응답을 저장할 행 생성 (행은 쓰기 작업과 같은 트랜잭션에 추가)"""
+        stored = StoredResponse(
+            fingerprint=fingerprint,
+            status_code=status_code,
+            body=body,
+            expires_at=datetime.now() + self.ttl,
+        )
+        record = IdempotencyKey(
+            key=key,
+            fingerprint=fingerprint,
+            status_code=status_code,
+            response_body=body.decode(),
+            expires_at=stored.expires_at,
+        )
+        return stored, record
+
+    async def _wait_for_result(
+        self, db: AsyncSession, key: str, fingerprint: str
+    ) -> Optional[StoredResponse]:
+        """저장된 응답 반환 (없으면 None, 같은 키 요청이 처리 중이면 끝날 때까지 대기)"""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.IDEMPOTENCY_WAIT_TIMEOUT
+        while True:
+            stored = await self.get(db, key)
+            if stored is not None:
+                return self._check(stored, fingerprint)
+            inflight = self._inflight.get(key)
+            if inflight is None:
+                return None
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                raise IdempotencyInProgress(key)
+            try:
+                await asyncio.wait_for(asyncio.shield(inflight), remaining)
+            except asyncio.TimeoutError:
+                raise IdempotencyInProgress(key)
+
+    @asynccontextmanager
+    async def _claim(self, key: str) -> AsyncIterator[None]:
+        """처리 중 표시 (끝나면 대기 중인 같은 키 요청을 깨움)"""
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            yield
+        finally:
+            del self._inflight[key]
+            future.set_result(None)
+
+    async def _committed_elsewhere(
+        self, db: AsyncSession, key: str, fingerprint: str, error: IntegrityError
+    ) -> StoredResponse:
+        """응답 기록 INSERT 가 기본키 충돌로 실패한 경우: 다른 프로세스가 먼저 저장한 응답"""
+        existing = await self.get(db, key)
+        if existing is None:
+            raise error
+        return self._check(existing, fingerprint)
+
+    async def execute(
+        self,
+        db: AsyncSession,
+        key: str,
+        fingerprint: str,
+        operation: Callable[[], Awaitable[Tuple[int, bytes]]]
+    ) -> Tuple[StoredResponse, bool]:
+        """
+        키당 한 번만 operation 실행 후 (응답, 재전송 여부) 반환
+
+        operation 은 쓰기 작업을 수행하고 (상태 코드, 응답 본문)을 반환하되 커밋하지 않음
+        이 메서드가 응답 기록을 같은 트랜잭션에 추가하고 커밋함
+        operation 이 예외를 내면 아무것도 저장하지 않으므로 같은 키로 다시 시도할 수 있음
+        """
+        stored = await self._wait_for_result(db, key, fingerprint)
+        if stored is not None:
+            return stored, True
+
+        async with self._claim(key):
+            status_code, body = await operation()
+            stored, record = self.new_record(key, fingerprint, status_code, body)
+            db.add(record)
+            try:
+                await db.commit()
+            except IntegrityError as e:
+                # 다른 프로세스가 같은 키를 먼저 처리함: 이쪽 쓰기는 롤백하고 그 응답을 재사용
+                await db.rollback()
+                return await self._committed_elsewhere(db, key, fingerprint, e), True
+            self._remember(key, stored)
+
+        await self._purge_expired(db)
+        return stored, False
+
+    async def execute_committed(
+        self,
+        db: AsyncSession,
+        key: str,
+        fingerprint: str,
+        operation: Callable[[RecordFactory], Awaitable[StoredResponse]]
+    ) -> Tuple[StoredResponse, bool]:
+        """
+        execute 와 같지만 operation 이 자체 트랜잭션에서 커밋하는 경우 (주문 그룹 커밋 등)
+
+        operation 은 전달받은 함수로 (응답, 기록 행)을 만들어 기록 행을 쓰기와 함께 커밋한 뒤
+        응답을 반환해야 함. 기록 행의 기본키 충돌(IntegrityError)은 다른 요청이 먼저 저장한 것으로 처리
+        """
+        stored = await self._wait_for_result(db, key, fingerprint)
+        if stored is not None:
+            return stored, True
+
+        async with self._claim(key):
+            try:
+                stored = await operation(
+                    lambda status_code, body: self.new_record(key, fingerprint, status_code, body)
+                )
+            except IntegrityError as e:
+                return await self._committed_elsewhere(db, key, fingerprint, e), True
+            self._remember(key, stored)
+
+        await self._purge_expired(db)
+        return stored, False
+
+    def _check(self, stored: StoredResponse, fingerprint: str) -> StoredResponse:
+        if stored.fingerprint != fingerprint:
+            raise IdempotencyKeyReused("Idempotency-Key가 다른 요청에 이미 사용되었습니다")
+        return stored
+
+    async def _purge_expired(self, db: AsyncSession) -> None:
+        """IDEMPOTENCY_PURGE_INTERVAL 마다 한 번 만료된 행 삭제 (실패해도 요청에는 영향 없음)"""
+        if time.monotonic() - self._last_purge < settings.IDEMPOTENCY_PURGE_INTERVAL:
+            return
+        self._last_purge = time.monotonic()
+        try:
+            result = await db.execute(
+                delete(IdempotencyKey).where(IdempotencyKey.expires_at <= datetime.now())
+            )
+            await db.commit()
+            if result.rowcount:
+                logger.info(f"만료된 Idempotency-Key {result.rowcount}개 삭제")
+        except Exception as e:
+            logger.error(f"Idempotency-Key 정리 실패: {e}")
+            await db.rollback()
+
+# 주문 멱등성 저장소 인스턴스
+idempotency_store = IdempotencyStore(
+    max_entries=settings.IDEMPOTENCY_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.IDEMPOTENCY_TTL_SECONDS,
+)
@@ -0,0 +1,353 @@
+"""
+Image Store Service
+
+업로드 이미지의 내용 주소(content-addressed) 저장소
+- 요청 본문을 받는 대로 임시 파일에 기록하며 SHA-256 을 함께 계산 (MAX_FILE_SIZE 를 넘는 순간 중단)
+- 첫 바이트의 시그니처가 Content-Type 과 다르면 나머지를 받지 않고 거부
+- 변형은 UPLOAD_DIRECTORY/images/{해시}/{너비}.webp 에 저장, URL 은 {UPLOAD_URL_PREFIX}/images/{해시}/{너비}.webp
+  → 같은 바이트를 다시 올리면 변환 없이 기존 변형 재사용 (카테고리/매장마다 같은 사진을 올려도 한 벌만 저장)
+  → 경로의 내용이 바뀌지 않으므로 Cache-Control: immutable 로 제공 (app/core/http_cache.py)
+- image_files.ref_count = 이 이미지를 image_url 로 쓰는 메뉴 수
+  → 메뉴 생성/수정/삭제/일괄 등록/이미지 업로드가 image_url 을 바꾸는 트랜잭션에서 함께 증감
+  → 참조가 0 이 된 뒤 IMAGE_GC_GRACE_HOURS 가 지난 이미지는 collect_garbage 로 삭제 (scripts/gc_images.py)
+    (유예 기간 동안 같은 이미지를 다시 올리면 변환 없이 되살아남)
+  → 업로드는 변형을 재사용하기 전에 행의 updated_at 을 갱신해 커밋하고(_claim), GC 는 행을 지우기 전에
+    디렉토리를 임시 디렉토리로 옮김(_bury) → 커밋 후에도 변형이 남아 있으면 GC 가 지울 수 없고,
+    GC 가 먼저 옮겼으면 업로드가 변형이 없는 것을 보고 다시 생성
+- Menu.image_url 은 IMAGE_CARD_WIDTH 변형을 가리킴 (메뉴 카드에 원본 대신 작은 WebP 제공)
+
+이 저장소 밖의 URL(외부 이미지 등)은 참조 수에 영향 없음
+IMAGE_VARIANT_WIDTHS 등 변형 설정을 바꿔도 이미 저장된 이미지는 그대로 재사용 (새 내용부터 적용)
+"""
+import hashlib
+import json
+import os
+import re
+import shutil
+import time
+import uuid
+from collections import Counter
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, Optional, Tuple
+
+import aiofiles
+from sqlalchemy import bindparam, delete, select, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.core.config import settings
+from app.core.images import FORMAT_EXTENSIONS, IMAGE_FORMATS, SIGNATURE_SIZE, image_processor, sniff_format
+from app.core.logger import logger
+from app.db.base import AsyncSessionLocal
+from app.models.image import ImageFile
+
+# 변형 디렉토리의 원본 정보 파일 (재사용 시 변환 없이 응답 구성)
+MANIFEST = "manifest.json"
+
+class ImageUploadError(ValueError):
+    """업로드 본문이 올바르지 않은 경우"""
+
+class ImageTooLarge(ImageUploadError):
+    """MAX_FILE_SIZE 를 넘는 경우"""
+
+class UnsupportedImageType(ImageUploadError):
+    """허용하지 않는 Content-Type 이거나 내용이 Content-Type 과 다른 경우"""
+
+@dataclass
+class StoredImage:
+    """저장된 이미지 변형"""
+    content_hash: str
+    image_url: str
+    variants: Dict[int, str]  # 너비 → URL
+    width: int  # 원본 너비
+    height: int  # 원본 높이
+    size: int  # 업로드 크기 (바이트)
+    reused: bool  # 같은 내용이 이미 있어 변환을 건너뛰었는지
+
+def images_dir() -> Path:
+    path = settings.upload_path / "images"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def _tmp_dir() -> Path:
+    path = settings.upload_path / "tmp"
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+def _url_prefix() -> str:
+    return f"{settings.UPLOAD_URL_PREFIX.rstrip('/')}/images/"
+
+def image_url(content_hash: str, filename: str) -> str:
+    return f"{_url_prefix()}{content_hash}/{filename}"
+
+_HASH = re.compile(r"[0-9a-f]{64}")
+
+def content_hash_of(url: Optional[str]) -> Optional[str]:
+    """이 저장소의 이미지 URL 이면 내용 해시, 아니면 None"""
+    prefix = _url_prefix()
+    if not url or not url.startswith(prefix):
+        return None
+    content_hash = url[len(prefix):].split("/", 1)[0]
+    return content_hash if _HASH.fullmatch(content_hash) else None
+
+def resolve_image_format(content_type: Optional[str]) -> str:
+    """Content-Type → Pillow 포맷 (허용하지 않으면 UnsupportedImageType)"""
+    media_type = (content_type or "").split(";")[0].strip().lower()
+    image_format = IMAGE_FORMATS.get(media_type)
+    allowed = {extension.lower() for extension in settings.ALLOWED_EXTENSIONS}
+    if image_format is None or not allowed.intersection(FORMAT_EXTENSIONS[image_format]):
+        raise UnsupportedImageType(f"지원하지 않는 이미지 형식입니다 ({media_type or '없음'})")
+    return image_format
+
+async def receive_upload(chunks: AsyncIterator[bytes], image_format: str, path: Path) -> Tuple[int, str]:
+    """
+    본문을 path 에 스트리밍 저장 후 (크기, SHA-256 hex) 반환
+
+    크기 초과/시그니처 불일치 시 파일을 지우고 예외
+    """
+    size = 0
+    head = b""
+    digest = hashlib.sha256()
+    try:
+        async with aiofiles.open(path, "wb") as out:
+            async for chunk in chunks:
+                size += len(chunk)
+                if size > settings.MAX_FILE_SIZE:
+                    raise ImageTooLarge(f"파일 크기가 제한({settings.MAX_FILE_SIZE} bytes)을 초과했습니다")
+                if len(head) < SIGNATURE_SIZE:
+                    head += chunk[:SIGNATURE_SIZE]
+                    if len(head) >= SIGNATURE_SIZE and sniff_format(head) != image_format:
+                        raise UnsupportedImageType("파일 내용이 Content-Type 과 일치하지 않습니다")
+                digest.update(chunk)
+                await out.write(chunk)
+        if size == 0:
+            raise ImageUploadError("빈 파일입니다")
+        if len(head) < SIGNATURE_SIZE and sniff_format(head) != image_format:
+            raise UnsupportedImageType("파일 내용이 Content-Type 과 일치하지 않습니다")
+    except BaseException:
+        path.unlink(missing_ok=True)
+        raise
+    return size, digest.hexdigest()
+
+def _card_width(widths: Iterable[int]) -> int:
+    """IMAGE_CARD_WIDTH 이상인 가장 작은 변형 너비 (없으면 가장 큰 너비)"""
+    widths = list(widths)
+    larger = [width for width in widths if width >= settings.IMAGE_CARD_WIDTH]
+    return min(larger) if larger else max(widths)
+
+def _read_manifest(directory: Path) -> Optional[dict]:
+    try:
+        return json.loads((directory / MANIFEST).read_text())
+    except (OSError, ValueError):
+        return None
+
+def _upsert(db: AsyncSession, row: dict, on_conflict: dict):
+    """image_files 행 UPSERT 문 (기본키 충돌 시 on_conflict 값으로 갱신)"""
+    table = ImageFile.__table__
+    if db.bind.dialect.name == "mysql":
+        return mysql_insert(table).values(row).on_duplicate_key_update(**on_conflict)
+    return sqlite_insert(table).values(row).on_conflict_do_update(
+        index_elements=["content_hash"], set_=on_conflict
+    )
+
+async def _claim(session_factory: async_sessionmaker, content_hash: str, size: int, manifest: dict) -> None:
+    """
+    변형을 쓰기 전에 행의 updated_at 을 지금으로 갱신 (없으면 참조 0 인 행 생성) 후 커밋
+
+    커밋 이후에는 GC 의 조건부 DELETE(updated_at < 기준 시각)가 실패하므로 변형이 지워지지 않음
+    """
+    now = datetime.now()
+    row = {
+        "content_hash": content_hash, "size": size, "width": manifest["width"],
+        "height": manifest["height"], "ref_count": 0, "created_at": now, "updated_at": now,
+    }
+    async with session_factory() as db:
+        await db.execute(_upsert(db, row, {"updated_at": now}))
+        await db.commit()
+
+async def _render(source: Path, staging: Path, target: Path, size: int) -> dict:
+    """변형 생성 후 target 으로 옮기고 manifest 반환"""
+    rendered = await image_processor.render(source, staging)
+    manifest = {"size": size, **rendered}
+    (staging / MANIFEST).write_text(json.dumps(manifest))
+    try:
+        os.replace(staging, target)
+    except OSError:
+        # 같은 내용을 동시에 올린 다른 요청이 먼저 저장함 (내용이 같으므로 그 결과 사용)
+        if _read_manifest(target) is None:
+            raise
+        shutil.rmtree(staging, ignore_errors=True)
+    return manifest
+
+async def store_image(
+    content_type: Optional[str],
+    chunks: AsyncIterator[bytes],
+    session_factory: async_sessionmaker = AsyncSessionLocal
+) -> StoredImage:
+    """
+    업로드 저장 + 변형 생성 (참조 등록은 acquire_upload)
+
+    같은 내용의 변형이 이미 있으면 변환하지 않음
+    변형을 쓰기 전에 image_files 행을 갱신해 커밋하고(_claim), 그 사이 GC 가 변형을 지웠으면 다시 생성
+    InvalidImage / ImageUploadError / ImageProcessorBusy 는 그대로 전달 (임시 파일은 정리)
+    """
+    image_format = resolve_image_format(content_type)
+    token = uuid.uuid4().hex
+    source = _tmp_dir() / f"{token}.upload"
+    staging = _tmp_dir() / token
+    try:
+        size, content_hash = await receive_upload(chunks, image_format, source)
+        target = images_dir() / content_hash
+        while True:
+            manifest = _read_manifest(target)
+            reused = manifest is not None
+            if not reused:
+                manifest = await _render(source, staging, target, size)
+            await _claim(session_factory, content_hash, size, manifest)
+            if (target / MANIFEST).exists():
+                break
+            # 행을 갱신하기 전에 GC 가 변형을 옮겨 지움 → 다시 생성
+    finally:
+        source.unlink(missing_ok=True)
+        shutil.rmtree(staging, ignore_errors=True)
+
+    variants = {int(width): image_url(content_hash, filename) for width, filename in manifest["variants"].items()}
+    return StoredImage(
+        content_hash=content_hash,
+        image_url=variants[_card_width(variants)],
+        variants=variants,
+        width=manifest["width"],
+        height=manifest["height"],
+        size=size,
+        reused=reused,
+    )
+
+def ref_changes(old_url: Optional[str], new_url: Optional[str]) -> Counter:
+    """image_url 변경에 따른 해시별 참조 수 증감"""
+    changes: Counter = Counter()
+    old_hash, new_hash = content_hash_of(old_url), content_hash_of(new_url)
+    if old_hash != new_hash:
+        if old_hash:
+            changes[old_hash] -= 1
+        if new_hash:
+            changes[new_hash] += 1
+    return changes
+
+async def apply_ref_changes(db: AsyncSession, changes: Counter) -> None:
+    """해시별 참조 수 증감 (변화가 없으면 쿼리 없음, 커밋은 호출 측 책임)"""
+    params = [
+        {"target_hash": content_hash, "delta": delta}
+        for content_hash, delta in sorted(changes.items()) if delta
+    ]
+    if not params:
+        return
+    table = ImageFile.__table__
+    await db.execute(
+        update(table)
+        .where(table.c.content_hash == bindparam("target_hash"))
+        .values(ref_count=table.c.ref_count + bindparam("delta"), updated_at=datetime.now()),
+        params,
+    )
+
+async def acquire_upload(db: AsyncSession, stored: StoredImage, previous_url: Optional[str]) -> None:
+    """업로드한 이미지를 image_url 로 쓰기 시작 (행이 없으면 생성) + 이전 image_url 참조 해제"""
+    table = ImageFile.__table__
+    now = datetime.now()
+    row = {
+        "content_hash": stored.content_hash, "size": stored.size, "width": stored.width,
+        "height": stored.height, "ref_count": 1, "created_at": now, "updated_at": now,
+    }
+    await db.execute(_upsert(db, row, {"ref_count": table.c.ref_count + 1, "updated_at": now}))
+    # 같은 이미지를 다시 올린 경우에도 방금 더한 1 과 상쇄되어 그대로 유지
+    await apply_ref_changes(db, ref_changes(previous_url, None))
+
+def _bury(path: Path) -> Optional[Path]:
+    """변형 디렉토리를 임시 디렉토리로 옮긴 경로 (이미 없으면 None)"""
+    tombstone = _tmp_dir() / f"{path.name}.{uuid.uuid4().hex}.deleted"
+    try:
+        os.rename(path, tombstone)
+    except FileNotFoundError:
+        return None
+    return tombstone
+
+def _unbury(tombstone: Path, path: Path) -> None:
+    """지우지 않기로 한 변형을 되돌림 (그 사이 업로드가 다시 생성했으면 옮겨 둔 것은 삭제)"""
+    try:
+        os.rename(tombstone, path)
+    except OSError:
+        shutil.rmtree(tombstone, ignore_errors=True)
+
+def _expired(path: Path, expired: float) -> bool:
+    """유예 기간보다 오래된 파일/디렉토리인지 (이미 없으면 False)"""
+    try:
+        return path.stat().st_mtime < expired
+    except FileNotFoundError:
+        return False
+
+async def collect_garbage(
+    session_factory: async_sessionmaker, grace_hours: Optional[float] = None
+) -> Tuple[int, int]:
+    """
+    참조가 0 인 채로 유예 기간이 지난 이미지 삭제: (삭제한 이미지 수, 정리한 고아 디렉토리/임시 파일 수)
+
+    - 디렉토리를 먼저 임시 디렉토리로 옮긴 뒤 행을 조건부 DELETE 로 지우고,
+      그 사이 다시 참조되거나 업로드가 갱신한 이미지는 되돌림 (store_image 의 _claim 참고)
+    - 행 없이 남은 변형 디렉토리(커밋 전에 실패한 업로드 등)와 임시 파일도 유예 기간이 지나면 삭제
+      (옮긴 뒤 행이 생겼으면 되돌림)
+    """
+    grace = timedelta(hours=settings.IMAGE_GC_GRACE_HOURS if grace_hours is None else grace_hours)
+    cutoff = datetime.now() - grace
+    expired = time.time() - grace.total_seconds()
+    removed = 0
+    orphans = 0
+    async with session_factory() as db:
+        candidates = (await db.scalars(
+            select(ImageFile.content_hash)
+            .where(ImageFile.ref_count <= 0, ImageFile.updated_at < cutoff)
+        )).all()
+        for content_hash in candidates:
+            target = images_dir() / content_hash
+            tombstone = _bury(target)
+            result = await db.execute(
+                delete(ImageFile).where(
+                    ImageFile.content_hash == content_hash,
+                    ImageFile.ref_count <= 0,
+                    ImageFile.updated_at < cutoff,
+                )
+            )
+            await db.commit()
+            if result.rowcount:
+                removed += 1
+                if tombstone is not None:
+                    shutil.rmtree(tombstone, ignore_errors=True)
+            elif tombstone is not None:
+                _unbury(tombstone, target)
+
+        known = set((await db.scalars(select(ImageFile.content_hash))).all())
+        for path in list(images_dir().iterdir()):
+            if path.name in known or not _expired(path, expired):
+                continue
+            tombstone = _bury(path)
+            if tombstone is None:
+                continue
+            await db.commit()  # 새 트랜잭션(스냅샷)에서 다시 확인
+            if await db.scalar(select(ImageFile.content_hash).where(ImageFile.content_hash == path.name)):
+                _unbury(tombstone, path)  # 옮기는 사이 업로드가 행을 만듦
+                continue
+            shutil.rmtree(tombstone, ignore_errors=True)
+            orphans += 1
+
+    for path in list(_tmp_dir().iterdir()):
+        if not _expired(path, expired):
+            continue
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+        orphans += 1
+    if removed or orphans:
+        logger.info(f"이미지 정리: 참조 없는 이미지 {removed}개, 고아 파일 {orphans}개 삭제")
+    return removed, orphans
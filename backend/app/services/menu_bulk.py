@@ -0,0 +1,68 @@
+"""
+Menu Bulk Update Service
+
+여러 메뉴/카테고리를 행 단위 조회 없이 한 번의 UPDATE 문으로 변경
+- 품절 처리: 메뉴 ID 목록 또는 카테고리 단위 is_available 변경
+- 가격 변경: 비율(%) 또는 금액(원) 일괄 적용
+- 카테고리 순서 변경: CASE 식으로 display_order 한 번에 갱신
+커밋과 캐시 무효화는 호출 측에서 일괄 1회 수행
+"""
+from sqlalchemy import Integer, case, cast, func, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.menu import Category, Menu
+from app.schemas.menu import CategoryReorder, MenuBulkAvailability, MenuBulkPrice, MenuBulkTarget
+
+class BulkUpdateError(ValueError):
+    """요청 내용이 현재 데이터와 맞지 않는 경우 (가격 음수, 없는 카테고리 등)"""
+
+def _target_filter(target: MenuBulkTarget):
+    if target.menu_ids is not None:
+        return Menu.id.in_(target.menu_ids)
+    return Menu.category_id == target.category_id
+
+async def set_availability(db: AsyncSession, change: MenuBulkAvailability) -> int:
+    """판매 여부 일괄 변경 (변경된 행 수 반환)"""
+    result = await db.execute(
+        update(Menu)
+        .where(_target_filter(change), Menu.is_available != change.is_available)
+        .values(is_available=change.is_available)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+async def change_prices(db: AsyncSession, change: MenuBulkPrice) -> int:
+    """가격 일괄 변경 (변경된 행 수 반환, 음수 가격이 되는 메뉴가 있으면 전체 거부)"""
+    condition = _target_filter(change)
+    if change.percent is not None:
+        # percent > -100 이므로 결과는 항상 0 이상 (원 단위 반올림)
+        new_price = cast(func.round(Menu.price * (100 + change.percent) / 100), Integer)
+    else:
+        new_price = Menu.price + change.amount
+        if change.amount < 0:
+            negative = await db.scalar(
+                select(func.count(Menu.id)).where(condition, Menu.price + change.amount < 0)
+            )
+            if negative:
+                raise BulkUpdateError(f"가격이 0원 미만이 되는 메뉴가 {negative}개 있습니다")
+
+    result = await db.execute(
+        update(Menu)
+        .where(condition)
+        .values(price=new_price)
+        .execution_options(synchronize_session=False)
+    )
+    return result.rowcount
+
+async def reorder_categories(db: AsyncSession, order: CategoryReorder) -> int:
+    """카테고리 표시 순서 일괄 변경 (목록에 없는 ID가 있으면 전체 거부)"""
+    positions = {category_id: index for index, category_id in enumerate(order.category_ids)}
+    result = await db.execute(
+        update(Category)
+        .where(Category.id.in_(order.category_ids))
+        .values(display_order=case(positions, value=Category.id))
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != len(positions):
+        raise BulkUpdateError("존재하지 않는 카테고리 ID가 포함되어 있습니다")
+    return result.rowcount
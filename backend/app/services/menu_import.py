@@ -0,0 +1,227 @@
+"""
+Menu Import Service
+
+CSV / NDJSON 업로드를 청크 단위로 읽어 메뉴를 일괄 등록/수정
+- 카테고리는 한 번 읽어 둔 맵(ID/이름)으로 검증 (행마다 SELECT 하지 않음)
+- (category_id, name)이 같은 기존 메뉴는 수정, 없으면 생성 (upsert)
+- 수정 시 파일에 없는 열(빈 값 포함)은 기존 값을 유지
+- BULK_IMPORT_BATCH_SIZE 행마다 다중 행 INSERT / UPDATE 실행
+- 잘못된 행은 건너뛰고 줄 번호와 사유를 결과에 기록
+- image_url 이 바뀐 만큼 저장된 이미지의 참조 수를 배치마다 함께 증감 (app/services/image_store.py)
+"""
+import codecs
+import csv
+import json
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+from fastapi import UploadFile
+from pydantic import ValidationError
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.models.menu import Category, Menu
+from app.schemas.menu import MenuCreate, MenuImportError, MenuImportResult
+from app.services.image_store import apply_ref_changes, ref_changes
+
+CHUNK_SIZE = 64 * 1024
+# 빈 문자열을 None(기본값)으로 처리할 선택 필드
+OPTIONAL_FIELDS = ("description", "image_url", "is_available")
+
+class ImportFileError(ValueError):
+    """파일 전체를 처리할 수 없는 오류 (크기 초과, 인코딩 오류 등)"""
+
+async def _iter_lines(upload: UploadFile) -> AsyncIterator[Tuple[int, str]]:
+    """업로드 파일을 청크 단위로 읽어 (줄 번호, 줄) 생성 (UTF-8, BOM 허용)"""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    line_no = 0
+    size = 0
+    try:
+        while True:
+            chunk = await upload.read(CHUNK_SIZE)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > settings.BULK_IMPORT_MAX_SIZE:
+                raise ImportFileError(
+                    f"파일 크기가 제한({settings.BULK_IMPORT_MAX_SIZE} bytes)을 초과했습니다"
+                )
+            buffer += decoder.decode(chunk)
+            *lines, buffer = buffer.split("\n")
+            for line in lines:
+                line_no += 1
+                yield line_no, line.rstrip("\r")
+        buffer += decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        raise ImportFileError("UTF-8로 인코딩된 파일만 지원합니다")
+    if buffer:
+        yield line_no + 1, buffer.rstrip("\r")
+
+async def _iter_csv_rows(upload: UploadFile) -> AsyncIterator[Tuple[int, Any]]:
+    """CSV 행을 (시작 줄 번호, dict) 로 생성 (첫 행은 헤더)"""
+    header: Optional[List[str]] = None
+    pending: List[str] = []
+    start = 0
+    async for line_no, line in _iter_lines(upload):
+        if not pending:
+            start = line_no
+        pending.append(line)
+        record = "\n".join(pending)
+        # 따옴표가 닫히지 않았으면 필드 안의 줄바꿈이므로 다음 줄과 이어서 파싱
+        if record.count('"') % 2:
+            continue
+        pending = []
+        if not record.strip():
+            continue
+        values = next(csv.reader([record]))
+        if header is None:
+            header = [name.strip() for name in values]
+            continue
+        if len(values) != len(header):
+            yield start, ValueError(f"열 개수가 헤더와 다릅니다 ({len(values)}/{len(header)})")
+            continue
+        yield start, dict(zip(header, values))
+    if pending:
+        yield start, ValueError("닫히지 않은 따옴표가 있습니다")
+
+async def _iter_ndjson_rows(upload: UploadFile) -> AsyncIterator[Tuple[int, Any]]:
+    """NDJSON 행을 (줄 번호, dict) 로 생성"""
+    async for line_no, line in _iter_lines(upload):
+        if not line.strip():
+            continue
+        try:
+            row = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, ValueError(f"JSON 파싱 실패: {e.msg}")
+            continue
+        if not isinstance(row, dict):
+            yield line_no, ValueError("각 줄은 JSON 객체여야 합니다")
+            continue
+        yield line_no, row
+
+def iter_upload_rows(upload: UploadFile, file_format: str) -> AsyncIterator[Tuple[int, Any]]:
+    """형식(csv/ndjson)에 맞는 행 생성기 선택"""
+    if file_format == "csv":
+        return _iter_csv_rows(upload)
+    return _iter_ndjson_rows(upload)
+
+def _validation_message(error: ValidationError) -> str:
+    return "; ".join(
+        f"{'.'.join(str(loc) for loc in err['loc'])}: {err['msg']}" for err in error.errors()
+    )
+
+class MenuImporter:
+    """검증된 행을 모아 배치 단위로 기록"""
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self.result = MenuImportResult()
+        self._category_ids: Dict[int, int] = {}
+        self._category_names: Dict[str, int] = {}
+        self._existing: Dict[Tuple[int, str], int] = {}
+        self._image_urls: Dict[int, Optional[str]] = {}
+        self._ref_changes: Counter = Counter()
+        self._seen: Dict[Tuple[int, str], int] = {}
+        self._inserts: List[Dict[str, Any]] = []
+        # 행마다 제공된 열이 달라 executemany 가 가능하도록 열 조합별로 모음
+        self._updates: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+        self._pending = 0
+
+    async def load(self) -> None:
+        """카테고리 맵과 기존 메뉴 (category_id, name) → id, id → image_url 맵을 한 번에 읽기"""
+        categories = await self.db.execute(select(Category.id, Category.name))
+        for category_id, name in categories:
+            self._category_ids[category_id] = category_id
+            self._category_names[name] = category_id
+        menus = await self.db.execute(select(Menu.id, Menu.category_id, Menu.name, Menu.image_url))
+        for menu_id, category_id, name, image_url in menus:
+            self._existing[(category_id, name)] = menu_id
+            self._image_urls[menu_id] = image_url
+
+    def _fail(self, row: int, message: str) -> None:
+        self.result.failed += 1
+        if len(self.result.errors) < settings.BULK_IMPORT_MAX_ERRORS:
+            self.result.errors.append(MenuImportError(row=row, message=message))
+
+    def _resolve_category(self, raw: Dict[str, Any]) -> Optional[int]:
+        category_id = raw.get("category_id")
+        if category_id not in (None, ""):
+            try:
+                return self._category_ids.get(int(category_id))
+            except (TypeError, ValueError):
+                return None
+        return self._category_names.get(str(raw.get("category") or "").strip())
+
+    async def add(self, row: int, raw: Any) -> None:
+        """한 행 검증 후 배치에 추가 (배치가 차면 기록)"""
+        self.result.total_rows += 1
+        if isinstance(raw, Exception):
+            self._fail(row, str(raw))
+            return
+
+        category_id = self._resolve_category(raw)
+        if category_id is None:
+            self._fail(row, "유효하지 않은 카테고리입니다")
+            return
+
+        data = {
+            key: value for key, value in raw.items()
+            if key in MenuCreate.model_fields and not (key in OPTIONAL_FIELDS and value in ("", None))
+        }
+        data["category_id"] = category_id
+        if isinstance(data.get("name"), str):
+            data["name"] = data["name"].strip()
+        try:
+            menu = MenuCreate(**data)
+        except ValidationError as e:
+            self._fail(row, _validation_message(e))
+            return
+
+        key = (menu.category_id, menu.name)
+        if key in self._seen:
+            self._fail(row, f"파일 내 중복 메뉴입니다 ({self._seen[key]}번째 줄과 동일)")
+            return
+        self._seen[key] = row
+
+        menu_id = self._existing.get(key)
+        if menu_id is None:
+            values = menu.model_dump()
+            self._inserts.append(values)
+            self._ref_changes.update(ref_changes(None, values["image_url"]))
+            self.result.created += 1
+        else:
+            # 수정은 행에 있는 열만 기록 (빠진 열은 기존 값 유지)
+            values = menu.model_dump(exclude_unset=True)
+            self._updates.setdefault(tuple(sorted(values)), []).append({"id": menu_id, **values})
+            if "image_url" in values:
+                self._ref_changes.update(ref_changes(self._image_urls.get(menu_id), values["image_url"]))
+            self.result.updated += 1
+        self._pending += 1
+
+        if self._pending >= settings.BULK_IMPORT_BATCH_SIZE:
+            await self.flush()
+
+    async def flush(self) -> None:
+        """모인 행을 다중 행 INSERT / 열 조합별 기본키 기준 일괄 UPDATE 로 기록"""
+        if self._inserts:
+            await self.db.execute(insert(Menu), self._inserts)
+            self._inserts = []
+        for rows in self._updates.values():
+            await self.db.execute(update(Menu), rows)
+        self._updates = {}
+        self._pending = 0
+        await apply_ref_changes(self.db, self._ref_changes)
+        self._ref_changes = Counter()
+
+async def import_menus(
+    db: AsyncSession, upload: UploadFile, file_format: str
+) -> MenuImportResult:
+    """업로드 파일의 메뉴를 일괄 등록 (커밋은 호출 측 책임)"""
+    importer = MenuImporter(db)
+    await importer.load()
+    async for row, raw in iter_upload_rows(upload, file_format):
+        await importer.add(row, raw)
+    await importer.flush()
+    return importer.result
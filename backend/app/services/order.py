@@ -0,0 +1,281 @@
+"""
+Order Service
+
+주문 생성 쓰기 경로
+- 주문 항목의 메뉴 가격/판매 여부를 IN 쿼리 한 번으로 조회
+- 소계/총액은 메모리에서 계산 (주문 당시 가격을 OrderItem.price 에 고정)
+- 주문과 모든 항목을 한 트랜잭션, 한 번의 flush 로 저장
+- 픽업 시간을 지정한 주문은 같은 트랜잭션에서 픽업 시간대를 예약 (취소 시 해제)
+- 주문이 완료되면 같은 트랜잭션에서 판매 집계 테이블에 반영
+
+주문 상태 변경 (전이표 + version 컬럼 기반 낙관적 동시성 제어) 및 실시간 스트림용 이벤트 생성
+관리자 주문 목록: 항목 수는 해당 페이지 주문에 대해서만 GROUP BY 로 집계 (항목 컬렉션 미로딩)
+  활성/보관 테이블(order_archive 참고)을 함께 조회
+"""
+from datetime import datetime
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from sqlalchemy import and_, func, literal, or_, select, union_all, update
+from sqlalchemy.orm import joinedload, selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.archive import ArchivedOrder, ArchivedOrderItem
+from app.models.menu import Menu
+from app.models.order import Order, OrderItem, OrderStatus
+from app.schemas.order import OrderCreate, OrderStatusEvent, OrderSummary
+from app.services.pickup_slots import pickup_scheduler
+from app.services.sales_stats import record_completed_order
+
+# 주문 상태 전이표: 현재 상태 → 바꿀 수 있는 상태
+STATUS_TRANSITIONS: Dict[OrderStatus, FrozenSet[OrderStatus]] = {
+    OrderStatus.PENDING: frozenset({OrderStatus.CONFIRMED, OrderStatus.PREPARING, OrderStatus.CANCELLED}),
+    OrderStatus.CONFIRMED: frozenset({OrderStatus.PREPARING, OrderStatus.CANCELLED}),
+    OrderStatus.PREPARING: frozenset({OrderStatus.READY, OrderStatus.CANCELLED}),
+    OrderStatus.READY: frozenset({OrderStatus.COMPLETED, OrderStatus.CANCELLED}),
+    OrderStatus.COMPLETED: frozenset(),
+    OrderStatus.CANCELLED: frozenset(),
+}
+
+# 바꿀 상태 → 그 상태로 바뀔 수 있는 현재 상태 (조건부 UPDATE 의 status IN 조건)
+_TRANSITION_SOURCES: Dict[OrderStatus, Tuple[OrderStatus, ...]] = {
+    target: tuple(source for source, targets in STATUS_TRANSITIONS.items() if target in targets)
+    for target in OrderStatus
+}
+
+# 더 이상 상태를 바꿀 수 없는 종료 상태
+FINAL_STATUSES = tuple(status for status, targets in STATUS_TRANSITIONS.items() if not targets)
+
+class OrderError(ValueError):
+    """주문 내용이 유효하지 않은 경우 (없는 메뉴, 품절 메뉴 등)"""
+
+class OrderNotFound(LookupError):
+    """주문이 존재하지 않는 경우"""
+
+class OrderConflict(RuntimeError):
+    """다른 요청이 먼저 주문을 변경한 경우 (버전 불일치)"""
+
+async def load_menu_prices(db: AsyncSession, menu_ids) -> Dict[int, Tuple[int, bool]]:
+    """메뉴 ID → (가격, 판매 여부) 조회 (쿼리 1회)"""
+    result = await db.execute(
+        select(Menu.id, Menu.price, Menu.is_available).where(Menu.id.in_(set(menu_ids)))
+    )
+    return {menu_id: (price, bool(is_available)) for menu_id, price, is_available in result}
+
+def price_items(order_in: OrderCreate, prices: Dict[int, Tuple[int, bool]]) -> List[dict]:
+    """주문 항목 검증 후 가격/소계를 채운 항목 값 목록 반환 (DB 접근 없음)"""
+    missing = sorted({item.menu_id for item in order_in.items} - prices.keys())
+    if missing:
+        raise OrderError(f"존재하지 않는 메뉴가 포함되어 있습니다: {missing}")
+    sold_out = sorted({item.menu_id for item in order_in.items if not prices[item.menu_id][1]})
+    if sold_out:
+        raise OrderError(f"품절된 메뉴가 포함되어 있습니다: {sold_out}")
+
+    items = []
+    for item in order_in.items:
+        price = prices[item.menu_id][0]
+        items.append({
+            "menu_id": item.menu_id,
+            "quantity": item.quantity,
+            "price": price,
+            "subtotal": price * item.quantity,
+            "options": item.options,
+        })
+    return items
+
+def new_order(order_in: OrderCreate, total_amount: int, user_id: Optional[int] = None) -> Order:
+    """항목 없이 주문 객체 생성"""
+    # 응답에 필요한 생성 시각을 INSERT 후 재조회하지 않도록 애플리케이션에서 지정
+    now = datetime.now()
+    return Order(
+        user_id=user_id,
+        customer_name=order_in.customer_name,
+        customer_phone=order_in.customer_phone,
+        pickup_time=order_in.pickup_time,
+        notes=order_in.notes,
+        status=OrderStatus.PENDING,
+        version=1,
+        total_amount=total_amount,
+        created_at=now,
+        updated_at=now,
+    )
+
+def build_order(
+    order_in: OrderCreate,
+    prices: Dict[int, Tuple[int, bool]],
+    user_id: Optional[int] = None
+) -> Order:
+    """가격 정보로 주문/항목 객체 생성 (DB 접근 없음)"""
+    items = price_items(order_in, prices)
+    order = new_order(order_in, sum(item["subtotal"] for item in items), user_id)
+    order.order_items = [OrderItem(**item) for item in items]
+    return order
+
+async def create_order(
+    db: AsyncSession, order_in: OrderCreate, user_id: Optional[int] = None
+) -> Order:
+    """주문 생성 (가격 조회 1회 + 픽업 시간대 예약 + flush 1회, 커밋은 호출 측 책임)"""
+    prices = await load_menu_prices(db, (item.menu_id for item in order_in.items))
+    order = build_order(order_in, prices, user_id)
+    if order_in.pickup_time is not None:
+        await pickup_scheduler.reserve(db, order_in.pickup_time)
+    db.add(order)
+    await db.flush()
+    return order
+
+async def change_status(
+    db: AsyncSession, order_id: int, status: OrderStatus, expected_version: Optional[int] = None
+) -> Tuple[Order, OrderStatus]:
+    """
+    주문 상태 변경 후 (주문, 이전 상태) 반환 (커밋은 호출 측 책임)
+
+    잠금 없이 주문을 읽은 뒤 하나의 조건부 UPDATE
+    (WHERE id=? AND version=? AND status IN (전이 가능한 상태)) 로 변경하므로
+    동시에 같은 주문을 바꾸면 한쪽만 성공하고 나머지는 OrderConflict
+    expected_version 이 있으면 클라이언트가 본 버전과 다를 때도 OrderConflict
+    """
+    # 완료 시에만 판매 집계용 항목을 별도 SELECT 로 로딩하고,
+    # 그 밖의 전이는 응답용 항목을 주문과 같은 SELECT 에서 JOIN 으로 함께 읽음 (SELECT 1 + UPDATE 1)
+    if status == OrderStatus.COMPLETED:
+        items = selectinload(Order.order_items)
+    else:
+        items = joinedload(Order.order_items)
+    result = await db.execute(select(Order).options(items).where(Order.id == order_id))
+    order = result.unique().scalar_one_or_none()
+    if order is None:
+        raise OrderNotFound(order_id)
+    if expected_version is not None and order.version != expected_version:
+        raise OrderConflict(order_id)
+    if status not in STATUS_TRANSITIONS[order.status]:
+        if order.status in FINAL_STATUSES:
+            raise OrderError("이미 완료되었거나 취소된 주문입니다")
+        raise OrderError(f"{order.status.value} 상태에서 {status.value} 상태로 바꿀 수 없습니다")
+
+    previous = order.status
+    now = datetime.now()
+    result = await db.execute(
+        update(Order)
+        .where(
+            Order.id == order_id,
+            Order.version == order.version,
+            Order.status.in_(_TRANSITION_SOURCES[status]),
+        )
+        .values(status=status, version=Order.version + 1, updated_at=now)
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount != 1:
+        raise OrderConflict(order_id)
+    for key, value in (("status", status), ("version", order.version + 1), ("updated_at", now)):
+        set_committed_value(order, key, value)
+
+    if status == OrderStatus.CANCELLED and order.pickup_time is not None:
+        await pickup_scheduler.release(db, order.pickup_time)
+    if status == OrderStatus.COMPLETED:
+        await record_completed_order(db, order)
+    return order, previous
+
+def status_event(order: Order, previous: Optional[OrderStatus] = None) -> OrderStatusEvent:
+    """주문 상태 스트림으로 보낼 이벤트 생성"""
+    return OrderStatusEvent(
+        order_id=order.id,
+        status=order.status,
+        previous_status=previous,
+        customer_name=order.customer_name,
+        pickup_time=order.pickup_time,
+        version=order.version,
+        occurred_at=order.updated_at or datetime.now(),
+    )
+
+def _summary_page(
+    order_model,
+    item_model,
+    limit: int,
+    statuses: Optional[Sequence[OrderStatus]],
+    created_from: Optional[datetime],
+    created_to: Optional[datetime],
+    before: Optional[Tuple[datetime, int]],
+    archived: bool
+):
+    """
+    한 주문 테이블(활성/보관)에서 최신순 limit+1 건과 항목 수를 조회하는 SELECT
+
+    (created_at, id) 내림차순 키셋 탐색으로 limit+1 건만 읽은 CTE 를 만들고,
+    항목 수는 그 페이지의 주문 항목만 GROUP BY 로 집계해 LEFT JOIN
+    """
+    conditions = []
+    if statuses:
+        conditions.append(order_model.status.in_(statuses))
+    if created_from:
+        conditions.append(order_model.created_at >= created_from)
+    if created_to:
+        conditions.append(order_model.created_at < created_to)
+    if before:
+        created_at, order_id = before
+        # created_at <= 조건을 중복으로 두어 OR 조건에서도 인덱스 범위 탐색을 사용하도록 함
+        conditions.append(order_model.created_at <= created_at)
+        conditions.append(or_(
+            order_model.created_at < created_at,
+            and_(order_model.created_at == created_at, order_model.id < order_id)
+        ))
+
+    page = (
+        select(
+            order_model.id, order_model.customer_name, order_model.customer_phone,
+            order_model.total_amount, order_model.status, order_model.created_at
+        )
+        .where(*conditions)
+        .order_by(order_model.created_at.desc(), order_model.id.desc())
+        .limit(limit + 1)
+        .cte(f"{order_model.__tablename__}_page")
+    )
+    item_counts = (
+        select(item_model.order_id, func.count(item_model.id).label("item_count"))
+        .where(item_model.order_id.in_(select(page.c.id)))
+        .group_by(item_model.order_id)
+        .subquery(f"{item_model.__tablename__}_counts")
+    )
+    return (
+        select(
+            page,
+            func.coalesce(item_counts.c.item_count, 0).label("item_count"),
+            literal(archived).label("archived"),
+        )
+        .outerjoin(item_counts, item_counts.c.order_id == page.c.id)
+    )
+
+async def list_order_summaries(
+    db: AsyncSession,
+    limit: int,
+    statuses: Optional[Sequence[OrderStatus]] = None,
+    created_from: Optional[datetime] = None,
+    created_to: Optional[datetime] = None,
+    before: Optional[Tuple[datetime, int]] = None
+) -> Tuple[List[OrderSummary], Optional[Tuple[datetime, int]]]:
+    """
+    최신순 주문 요약 한 페이지와 다음 페이지 키 반환 (쿼리 1회)
+
+    활성 테이블과 보관 테이블에서 각각 limit+1 건을 키셋으로 읽어 합친 뒤 다시 정렬하므로
+    보관 여부와 관계없이 같은 커서로 이어서 조회 가능
+    (상태 필터에 완료/취소가 없으면 보관 테이블은 조회하지 않음)
+    """
+    args = (limit, statuses, created_from, created_to, before)
+    pages = [_summary_page(Order, OrderItem, *args, archived=False)]
+    if not statuses or any(status in FINAL_STATUSES for status in statuses):
+        pages.append(_summary_page(ArchivedOrder, ArchivedOrderItem, *args, archived=True))
+
+    if len(pages) == 1:
+        combined = pages[0].subquery("orders_page")
+    else:
+        combined = union_all(*(page.subquery().select() for page in pages)).subquery("orders_page")
+    result = await db.execute(
+        select(combined)
+        .order_by(combined.c.created_at.desc(), combined.c.id.desc())
+        .limit(limit + 1)
+    )
+    rows = result.mappings().all()
+
+    next_key = None
+    if len(rows) > limit:
+        last = rows[limit - 1]
+        next_key = (last["created_at"], last["id"])
+    return [OrderSummary.model_validate(dict(row)) for row in rows[:limit]], next_key
@@ -0,0 +1,103 @@
+"""
+Order Archive Service
+
+보관 기간(ORDER_ARCHIVE_AFTER_DAYS)이 지난 완료/취소 주문을 orders_archive / order_items_archive 로 이동
+- ORDER_ARCHIVE_BATCH_SIZE 건씩 별도 트랜잭션으로 처리해 잠금 시간을 짧게 유지
+  (대상 ID 조회 → INSERT ... SELECT 2회 → DELETE 2회 → 커밋)
+- 배치 사이에 ORDER_ARCHIVE_BATCH_PAUSE 초 쉬어 다른 쓰기 요청이 끼어들 수 있게 함
+- 주문/항목 ID 를 그대로 유지하므로 조회 API 는 활성 테이블에 없으면 보관 테이블에서 찾음
+
+주문 테이블은 하위 테이블(order_items)의 외래키가 있어 MySQL 파티셔닝을 적용할 수 없으므로
+파티션 대신 보관 테이블을 사용 (판매 집계는 이미 반영되어 있고, 백필 시에는 보관 테이블도 함께 집계)
+"""
+import asyncio
+from datetime import datetime, timedelta
+from typing import List, Optional
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+
+from app.core.logger import logger
+from app.models.archive import ArchivedOrder, ArchivedOrderItem
+from app.models.order import Order, OrderItem
+from app.services.order import FINAL_STATUSES
+
+_ORDER_COLUMNS = (
+    "id", "user_id", "total_amount", "status", "version", "customer_name", "customer_phone",
+    "pickup_time", "notes", "created_at", "updated_at",
+)
+_ITEM_COLUMNS = ("id", "order_id", "menu_id", "quantity", "price", "subtotal", "options")
+
+async def archive_batch(db: AsyncSession, cutoff: datetime, batch_size: int) -> int:
+    """
+    cutoff 이전에 생성된 완료/취소 주문을 최대 batch_size 건 보관 테이블로 이동 후 건수 반환
+    (커밋은 호출 측 책임)
+    """
+    order_ids: List[int] = list(await db.scalars(
+        select(Order.id)
+        .where(Order.status.in_(FINAL_STATUSES), Order.created_at < cutoff)
+        .limit(batch_size)
+    ))
+    if not order_ids:
+        return 0
+
+    await db.execute(
+        insert(ArchivedOrder).from_select(
+            _ORDER_COLUMNS,
+            select(*(getattr(Order, name) for name in _ORDER_COLUMNS)).where(Order.id.in_(order_ids)),
+        )
+    )
+    await db.execute(
+        insert(ArchivedOrderItem).from_select(
+            _ITEM_COLUMNS,
+            select(*(getattr(OrderItem, name) for name in _ITEM_COLUMNS))
+            .where(OrderItem.order_id.in_(order_ids)),
+        )
+    )
+    await db.execute(
+        delete(OrderItem).where(OrderItem.order_id.in_(order_ids)).execution_options(synchronize_session=False)
+    )
+    await db.execute(
+        delete(Order).where(Order.id.in_(order_ids)).execution_options(synchronize_session=False)
+    )
+    return len(order_ids)
+
+async def archive_orders(
+    session_factory,
+    older_than_days: int,
+    batch_size: int,
+    pause: float = 0.0,
+    max_batches: Optional[int] = None
+) -> int:
+    """보관 대상이 없을 때까지 (또는 max_batches 회) 배치 이동 후 총 건수 반환"""
+    cutoff = datetime.now() - timedelta(days=older_than_days)
+    total = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        async with session_factory() as db:
+            try:
+                moved = await archive_batch(db, cutoff, batch_size)
+                await db.commit()
+            except Exception as e:
+                logger.error(f"주문 보관 실패: {e}")
+                await db.rollback()
+                raise
+        if not moved:
+            break
+        total += moved
+        batches += 1
+        logger.info(f"주문 {moved}건 보관 (누적 {total}건)")
+        if pause:
+            await asyncio.sleep(pause)
+    return total
+
+async def get_order_any(db: AsyncSession, order_id: int):
+    """활성/보관 테이블에서 주문과 항목 조회 (활성 테이블 우선, 없으면 None)"""
+    for model in (Order, ArchivedOrder):
+        order = await db.scalar(
+            select(model).options(selectinload(model.order_items)).where(model.id == order_id)
+        )
+        if order is not None:
+            return order
+    return None
@@ -0,0 +1,177 @@
+"""
+Order Group Commit
+
+주문이 몰릴 때 커밋(fsync) 대기 시간이 처리량을 제한하지 않도록
+짧은 시간 창 안에 들어온 주문들을 한 트랜잭션으로 모아 한 번에 커밋 (ORDER_GROUP_COMMIT_ENABLED)
+- 첫 주문이 들어온 뒤 ORDER_GROUP_COMMIT_WINDOW_MS 가 지나거나
+  ORDER_GROUP_COMMIT_MAX_BATCH 건이 모이면 배치 처리
+- 메뉴 가격은 배치 전체에 대해 IN 쿼리 한 번으로 조회
+- 주문 항목은 배치 전체를 한 번의 다중 행 INSERT 로 저장
+  (주문 행은 생성된 ID가 필요하므로 RETURNING 이 없는 MySQL 에서는 행마다 INSERT 되지만
+  커밋은 배치당 한 번)
+- 픽업 시간대 예약도 같은 트랜잭션에서 처리
+- 없는/품절 메뉴, 마감된 픽업 시간대 등 검증 오류는 해당 주문 요청에만 전달되고 나머지 주문은 그대로 저장
+- 배치 저장이 DB 오류로 실패하면 주문별 트랜잭션으로 다시 시도해 실패 원인을 해당 요청에만 전달
+"""
+import asyncio
+from dataclasses import dataclass, field
+from typing import List, Optional, Set
+
+from sqlalchemy import insert, select
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.db.base import AsyncSessionLocal
+from app.models.order import Order, OrderItem
+from app.schemas.order import OrderCreate, OrderCreateResponse
+from app.services.idempotency import RecordFactory, StoredResponse
+from app.services.order import OrderError, load_menu_prices, new_order, price_items
+from app.services.pickup_slots import PickupSlotError, pickup_scheduler
+
+@dataclass
+class CommittedOrder:
+    """커밋된 주문과 응답 본문 (멱등성 키가 있으면 저장된 응답 포함)"""
+    order: Order
+    body: bytes
+    stored: Optional[StoredResponse] = None
+
+@dataclass
+class _PendingOrder:
+    order_in: OrderCreate
+    record_factory: Optional[RecordFactory]
+    future: asyncio.Future
+    items: List[dict] = field(default_factory=list)
+
+    def fail(self, error: BaseException) -> None:
+        if not self.future.done():
+            self.future.set_exception(error)
+
+class OrderGroupCommitter:
+    """주문 생성 요청을 모아 한 트랜잭션으로 커밋"""
+
+    def __init__(self, window_ms: float, max_batch: int, session_factory=None):
+        self.window = window_ms / 1000
+        self.max_batch = max_batch
+        # 벤치마크 등에서 교체할 수 있도록 지정하지 않으면 AsyncSessionLocal 사용
+        self.session_factory = session_factory or AsyncSessionLocal
+        self._pending: List[_PendingOrder] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    async def submit(
+        self, order_in: OrderCreate, record_factory: Optional[RecordFactory] = None
+    ) -> CommittedOrder:
+        """
+        주문을 다음 배치에 추가하고 커밋될 때까지 대기
+
+        record_factory 가 있으면 멱등성 응답 기록을 같은 트랜잭션에 저장
+        (IdempotencyStore.execute_committed 에서 전달받은 함수)
+        """
+        loop = asyncio.get_running_loop()
+        pending = _PendingOrder(order_in, record_factory, loop.create_future())
+        self._pending.append(pending)
+        if len(self._pending) >= self.max_batch:
+            self._start_flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window, self._start_flush)
+        return await pending.future
+
+    def _start_flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._flush(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, batch: List[_PendingOrder]) -> None:
+        try:
+            await self._write(batch)
+            return
+        except Exception as e:
+            if len(batch) == 1:
+                logger.error(f"주문 저장 실패: {e}")
+                batch[0].fail(e)
+                return
+            logger.warning(f"주문 {len(batch)}건 배치 저장 실패, 주문별로 다시 시도: {e}")
+
+        for pending in batch:
+            if pending.future.done():
+                continue
+            try:
+                await self._write([pending])
+            except Exception as e:
+                logger.error(f"주문 저장 실패: {e}")
+                pending.fail(e)
+
+    async def _write(self, batch: List[_PendingOrder]) -> None:
+        """배치를 한 트랜잭션으로 저장 (검증 오류는 해당 주문에만 전달, DB 오류는 예외로 전파)"""
+        async with self.session_factory() as db:
+            prices = await load_menu_prices(
+                db, (item.menu_id for pending in batch for item in pending.order_in.items)
+            )
+            accepted = []
+            for pending in batch:
+                if pending.future.done():
+                    continue  # 대기 중 취소된 요청
+                try:
+                    pending.items = price_items(pending.order_in, prices)
+                    if pending.order_in.pickup_time is not None:
+                        await pickup_scheduler.reserve(db, pending.order_in.pickup_time)
+                except (OrderError, PickupSlotError) as e:
+                    pending.fail(e)
+                    continue
+                accepted.append(pending)
+            if not accepted:
+                return
+
+            orders = [
+                new_order(p.order_in, sum(item["subtotal"] for item in p.items)) for p in accepted
+            ]
+            db.add_all(orders)
+            await db.flush()
+
+            await db.execute(insert(OrderItem), [
+                {**item, "order_id": order.id}
+                for pending, order in zip(accepted, orders)
+                for item in pending.items
+            ])
+            items_by_order = {order.id: [] for order in orders}
+            result = await db.scalars(
+                select(OrderItem)
+                .where(OrderItem.order_id.in_(items_by_order.keys()))
+                .order_by(OrderItem.id)
+            )
+            for item in result:
+                items_by_order[item.order_id].append(item)
+
+            committed = []
+            for pending, order in zip(accepted, orders):
+                set_committed_value(order, "order_items", items_by_order[order.id])
+                body = OrderCreateResponse(order=order).model_dump_json().encode()
+                stored = None
+                if pending.record_factory is not None:
+                    stored, record = pending.record_factory(200, body)
+                    db.add(record)
+                committed.append((pending, CommittedOrder(order, body, stored)))
+
+            try:
+                await db.commit()
+            except Exception:
+                await db.rollback()
+                raise
+
+        logger.info(f"주문 {len(committed)}건 그룹 커밋")
+        for pending, result in committed:
+            if not pending.future.done():
+                pending.future.set_result(result)
+
+# 주문 그룹 커밋 인스턴스 (ORDER_GROUP_COMMIT_ENABLED 일 때 사용)
+order_group_committer = OrderGroupCommitter(
+    window_ms=settings.ORDER_GROUP_COMMIT_WINDOW_MS,
+    max_batch=settings.ORDER_GROUP_COMMIT_MAX_BATCH,
+)
@@ -0,0 +1,168 @@
+"""
+Order Event Hub
+
+주문 상태 변경을 구독자(관리자 토큰을 가진 주방/카운터 화면)에게 전달하는 프로세스 내 pub/sub
+- 이벤트에 고객 이름/픽업 시간이 포함되므로 스트림은 관리자 전용
+- 동시 구독자는 ORDER_STREAM_MAX_SUBSCRIBERS 명까지 (초과 시 OrderStreamFull → 503)
+- 발행: 최근 이벤트를 링 버퍼에 보관하고 모든 구독자 큐에 전달 (DB 조회 없음)
+- 백프레셔: 구독자마다 크기 제한 큐를 두고, 가득 찬(느린) 구독자는 연결을 끊음
+  → 클라이언트가 Last-Event-ID 로 재연결하면 버퍼에서 놓친 이벤트부터 이어서 수신
+- 재개: 이벤트 ID는 "인스턴스ID:순번" 형식이며, 다른 인스턴스(재시작 전)의 ID이거나
+  버퍼에서 이미 밀려난 ID면 reset 이벤트로 전체 목록 재조회를 요청
+
+여러 워커 프로세스로 실행하면 각 프로세스의 구독자는 해당 프로세스에서 발생한 변경만 받음
+"""
+import asyncio
+import secrets
+from collections import deque
+from dataclasses import dataclass
+from typing import AsyncIterator, Deque, List, Optional, Set
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.schemas.order import OrderStatusEvent
+
+# 프로세스별 식별자: 재시작 전에 받은 이벤트 ID로 잘못 이어받지 않도록 ID에 포함
+_instance_id = secrets.token_hex(4)
+
+class OrderStreamFull(Exception):
+    """동시 구독자 수가 한도에 도달한 경우"""
+
+@dataclass(frozen=True)
+class OrderEvent:
+    """발행된 이벤트 (JSON 본문은 발행 시 한 번만 직렬화)"""
+    seq: int
+    payload: bytes
+
+    @property
+    def event_id(self) -> str:
+        return f"{_instance_id}:{self.seq}"
+
+def _sse(event: str, data: bytes, event_id: Optional[str] = None) -> bytes:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.append(f"event: {event}")
+    return ("\n".join(lines) + "\n").encode() + b"data: " + data + b"\n\n"
+
+RESET_MESSAGE = _sse("reset", b"{}")
+
+class Subscription:
+    """구독자 한 명의 이벤트 큐"""
+
+    def __init__(self, backlog: List[OrderEvent], reset: bool):
+        self._queue: "asyncio.Queue[Optional[OrderEvent]]" = asyncio.Queue(
+            maxsize=settings.ORDER_STREAM_QUEUE_SIZE
+        )
+        self._backlog = backlog
+        self._reset = reset
+        self.closed = False
+
+    def offer(self, event: OrderEvent) -> bool:
+        """이벤트 전달 (큐가 가득 차면 구독 종료 후 False)"""
+        if self.closed:
+            return False
+        try:
+            self._queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            self.close()
+            return False
+
+    def close(self) -> None:
+        """구독 종료: 남은 이벤트를 버리고 종료 신호만 남김"""
+        if self.closed:
+            return
+        self.closed = True
+        while not self._queue.empty():
+            self._queue.get_nowait()
+        self._queue.put_nowait(None)
+
+    async def messages(self, heartbeat: float) -> AsyncIterator[bytes]:
+        """SSE 메시지 스트림 (heartbeat 초 동안 이벤트가 없으면 주석 줄 전송)"""
+        yield f"retry: {settings.ORDER_STREAM_RETRY_MS}\n\n".encode()
+        if self._reset:
+            yield RESET_MESSAGE
+        for event in self._backlog:
+            yield _sse("order_status", event.payload, event.event_id)
+        self._backlog = []
+
+        while True:
+            try:
+                event = await asyncio.wait_for(self._queue.get(), heartbeat)
+            except asyncio.TimeoutError:
+                yield b": keep-alive\n\n"
+                continue
+            if event is None:
+                return
+            yield _sse("order_status", event.payload, event.event_id)
+
+class OrderEventHub:
+    """주문 상태 이벤트 발행/구독"""
+
+    def __init__(self, buffer_size: int, max_subscribers: int):
+        self.max_subscribers = max_subscribers
+        self._seq = 0
+        self._buffer: Deque[OrderEvent] = deque(maxlen=buffer_size)
+        self._subscribers: Set[Subscription] = set()
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    def publish(self, event: OrderStatusEvent) -> None:
+        """상태 변경 이벤트를 버퍼에 기록하고 모든 구독자에게 전달"""
+        self._seq += 1
+        published = OrderEvent(seq=self._seq, payload=event.model_dump_json().encode())
+        self._buffer.append(published)
+        dropped = [sub for sub in self._subscribers if not sub.offer(published)]
+        for sub in dropped:
+            self._subscribers.discard(sub)
+        if dropped:
+            logger.warning(f"주문 이벤트 수신이 느린 구독자 {len(dropped)}명 연결 종료")
+
+    def _backlog_after(self, last_event_id: Optional[str]) -> Optional[List[OrderEvent]]:
+        """last_event_id 이후 이벤트 목록 (이어받을 수 없으면 None)"""
+        if not last_event_id:
+            return []
+        instance, _, seq = last_event_id.partition(":")
+        if instance != _instance_id or not seq.isdigit():
+            return None
+        last_seq = int(seq)
+        if last_seq > self._seq:
+            return None
+        oldest = self._buffer[0].seq if self._buffer else self._seq + 1
+        if last_seq < oldest - 1:
+            return None  # 버퍼에서 밀려난 이벤트가 있음
+        return [event for event in self._buffer if event.seq > last_seq]
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Subscription:
+        """구독 시작 (last_event_id 가 있으면 그 이후 이벤트부터, 구독자가 한도에 도달했으면 OrderStreamFull)"""
+        if len(self._subscribers) >= self.max_subscribers:
+            raise OrderStreamFull(f"주문 상태 스트림 구독자가 한도({self.max_subscribers}명)에 도달했습니다")
+        backlog = self._backlog_after(last_event_id)
+        subscription = Subscription(backlog or [], reset=backlog is None)
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+        subscription.closed = True
+
+    async def stream(self, subscription: Subscription) -> AsyncIterator[bytes]:
+        """
+        구독의 SSE 메시지 생성 (연결 종료 시 구독 해제)
+
+        한도 초과를 응답 시작 전에 알 수 있도록 구독은 호출 측에서 subscribe 로 먼저 시작
+        """
+        try:
+            async for message in subscription.messages(settings.ORDER_STREAM_HEARTBEAT):
+                yield message
+        finally:
+            self.unsubscribe(subscription)
+
+# 주문 이벤트 허브 인스턴스
+order_event_hub = OrderEventHub(
+    buffer_size=settings.ORDER_EVENT_BUFFER_SIZE,
+    max_subscribers=settings.ORDER_STREAM_MAX_SUBSCRIBERS,
+)
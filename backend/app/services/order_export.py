@@ -0,0 +1,221 @@
+"""
+Order Export Service
+
+회계용 주문/주문 항목/일별 판매 내보내기 (CSV, NDJSON)
+- 행을 리스트로 모으지 않고 서버 측 커서(db.stream)에서 EXPORT_CHUNK_SIZE 행씩 받아
+  바로 직렬화한 바이트 청크를 비동기 제너레이터로 전달
+  → StreamingResponse(API) 또는 gzip 파일(scripts/export_orders.py)로 흘려보내므로
+    메모리 사용량은 전체 행 수와 무관하게 청크 하나 크기로 유지
+- 주문/항목은 활성 테이블과 보관 테이블을 차례로 조회 (보관 여부는 archived 컬럼)
+- 기간은 주문 시각(created_at) 기준, 양 끝 날짜 포함
+- CSV 는 엑셀에서 열리므로 =, +, -, @, 탭, CR 로 시작하는 문자열 값 앞에 ' 를 붙여 수식으로 실행되지 않게 함
+"""
+import csv
+import enum
+import io
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import AsyncIterator, Callable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import Boolean, Enum, Select, String, literal, select
+
+from app.core.config import settings
+from app.core.logger import logger
+from app.db.base import AsyncSessionLocal
+from app.models.archive import ArchivedOrder, ArchivedOrderItem
+from app.models.menu import Menu
+from app.models.order import Order, OrderItem
+from app.models.stats import SalesDaily
+
+class ExportDataset(str, enum.Enum):
+    ORDERS = "orders"
+    ORDER_ITEMS = "order_items"
+    SALES_DAILY = "sales_daily"
+
+class ExportFormat(str, enum.Enum):
+    CSV = "csv"
+    NDJSON = "ndjson"
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv; charset=utf-8",
+    ExportFormat.NDJSON: "application/x-ndjson",
+}
+
+@dataclass(frozen=True)
+class _DatasetSpec:
+    columns: Tuple[str, ...]
+    statements: Callable[[datetime, datetime], List[Select]]  # (시작 시각, 끝 시각 미포함) → 순서대로 실행할 쿼리
+
+def _orders(start: datetime, end: datetime) -> List[Select]:
+    return [
+        select(
+            model.id, model.created_at, model.status, model.total_amount, model.customer_name,
+            model.customer_phone, model.pickup_time, model.notes, model.updated_at,
+            literal(archived, Boolean),
+        )
+        .where(model.created_at >= start, model.created_at < end)
+        .order_by(model.created_at, model.id)  # (created_at, id) 인덱스 순서
+        for model, archived in ((Order, False), (ArchivedOrder, True))
+    ]
+
+def _order_items(start: datetime, end: datetime) -> List[Select]:
+    return [
+        select(
+            item_model.id, item_model.order_id, order_model.created_at, order_model.status,
+            item_model.menu_id, Menu.name, item_model.quantity, item_model.price,
+            item_model.subtotal, item_model.options, literal(archived, Boolean),
+        )
+        .join(order_model, order_model.id == item_model.order_id)
+        .outerjoin(Menu, Menu.id == item_model.menu_id)
+        .where(order_model.created_at >= start, order_model.created_at < end)
+        .order_by(order_model.created_at, order_model.id, item_model.id)
+        for order_model, item_model, archived in (
+            (Order, OrderItem, False), (ArchivedOrder, ArchivedOrderItem, True)
+        )
+    ]
+
+def _sales_daily(start: datetime, end: datetime) -> List[Select]:
+    return [
+        select(
+            SalesDaily.bucket_date, SalesDaily.menu_id, Menu.name, SalesDaily.category_id,
+            SalesDaily.quantity, SalesDaily.revenue, SalesDaily.order_count,
+        )
+        .outerjoin(Menu, Menu.id == SalesDaily.menu_id)
+        .where(SalesDaily.bucket_date >= start.date(), SalesDaily.bucket_date < end.date())
+        .order_by(SalesDaily.bucket_date, SalesDaily.menu_id)
+    ]
+
+_DATASETS = {
+    ExportDataset.ORDERS: _DatasetSpec(
+        ("id", "created_at", "status", "total_amount", "customer_name", "customer_phone",
+         "pickup_time", "notes", "updated_at", "archived"),
+        _orders,
+    ),
+    ExportDataset.ORDER_ITEMS: _DatasetSpec(
+        ("id", "order_id", "order_created_at", "order_status", "menu_id", "menu_name",
+         "quantity", "price", "subtotal", "options", "archived"),
+        _order_items,
+    ),
+    ExportDataset.SALES_DAILY: _DatasetSpec(
+        ("date", "menu_id", "menu_name", "category_id", "quantity", "revenue", "order_count"),
+        _sales_daily,
+    ),
+}
+
+def export_range(date_from: Optional[date], date_to: Optional[date]) -> Tuple[date, date]:
+    """
+    내보내기 기간 (양 끝 포함)
+    - 둘 다 없으면 지난달 1일 ~ 말일
+    - 하나만 있으면 종료일 기본값은 오늘, 시작일 기본값은 종료일이 속한 달의 1일
+    """
+    if date_from is None and date_to is None:
+        date_to = date.today().replace(day=1) - timedelta(days=1)
+        date_from = date_to.replace(day=1)
+    date_to = date_to or date.today()
+    date_from = date_from or date_to.replace(day=1)
+    if date_from > date_to:
+        raise ValueError("시작일이 종료일보다 늦습니다")
+    return date_from, date_to
+
+def export_filename(dataset: ExportDataset, fmt: ExportFormat, date_from: date, date_to: date) -> str:
+    return f"{dataset.value}_{date_from:%Y%m%d}_{date_to:%Y%m%d}.{fmt.value}"
+
+def _json_default(value):
+    """json.dumps 가 직렬화하지 못하는 값만 변환 (Enum → 값, 날짜/시각 → ISO 문자열)"""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ")
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"{type(value).__name__} 값은 내보낼 수 없습니다")
+
+def _enum_indexes(stmt: Select) -> Tuple[int, ...]:
+    """Enum 컬럼 위치 (CSV 에서 이름 대신 값으로 쓰도록 변환할 컬럼만)"""
+    return tuple(
+        i for i, column in enumerate(stmt.selected_columns) if isinstance(column.type, Enum)
+    )
+
+def _text_indexes(stmt: Select) -> Tuple[int, ...]:
+    """문자열 컬럼 위치 (고객이 입력한 값이 들어갈 수 있어 CSV 수식 주입을 막아야 하는 컬럼, Enum 제외)"""
+    return tuple(
+        i for i, column in enumerate(stmt.selected_columns)
+        if isinstance(column.type, String) and not isinstance(column.type, Enum)
+    )
+
+# 엑셀 등에서 수식으로 해석되는 첫 글자
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+def _escape_formula(value: Optional[str]) -> Optional[str]:
+    if value and value.startswith(_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+def _encode_csv(
+    columns: Sequence[str],
+    rows: Sequence[Sequence],
+    enums: Tuple[int, ...] = (),
+    texts: Tuple[int, ...] = ()
+) -> bytes:
+    # 날짜/시각은 csv 모듈의 str() 변환이 ISO 형식과 같으므로 Enum / 문자열 컬럼만 변환
+    if enums or texts:
+        rows = [list(row) for row in rows]
+        for row in rows:
+            for i in enums:
+                if row[i] is not None:
+                    row[i] = row[i].value
+            for i in texts:
+                row[i] = _escape_formula(row[i])
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+def _encode_ndjson(
+    columns: Sequence[str],
+    rows: Sequence[Sequence],
+    enums: Tuple[int, ...] = (),
+    texts: Tuple[int, ...] = ()
+) -> bytes:
+    dumps = json.JSONEncoder(ensure_ascii=False, default=_json_default).encode
+    return "".join(dumps(dict(zip(columns, row))) + "\n" for row in rows).encode()
+
+async def export_chunks(
+    dataset: ExportDataset,
+    fmt: ExportFormat,
+    date_from: date,
+    date_to: date,
+    session_factory=None,
+    chunk_size: Optional[int] = None
+) -> AsyncIterator[bytes]:
+    """
+    내보내기 본문을 chunk_size 행 단위 바이트 청크로 생성 (CSV 는 헤더 포함)
+
+    응답 본문은 엔드포인트가 반환된 뒤에 전송되므로 요청 의존성 세션 대신
+    스트림이 끝날 때까지 유지되는 별도 세션 사용
+    """
+    spec = _DATASETS[dataset]
+    encode = _encode_csv if fmt == ExportFormat.CSV else _encode_ndjson
+    chunk_size = chunk_size or settings.EXPORT_CHUNK_SIZE
+    start = datetime.combine(date_from, time.min)
+    end = datetime.combine(date_to + timedelta(days=1), time.min)
+
+    if fmt == ExportFormat.CSV:
+        # UTF-8 BOM: 엑셀에서 한글이 깨지지 않도록
+        yield "\ufeff".encode() + _encode_csv(spec.columns, [spec.columns])
+
+    rows = 0
+    async with (session_factory or AsyncSessionLocal)() as db:
+        try:
+            for stmt in spec.statements(start, end):
+                enums = _enum_indexes(stmt)
+                texts = _text_indexes(stmt)
+                result = await db.stream(stmt.execution_options(yield_per=chunk_size))
+                async for partition in result.partitions():
+                    rows += len(partition)
+                    yield encode(spec.columns, partition, enums, texts)
+        except Exception as e:
+            # 응답 헤더가 이미 전송되어 상태 코드를 바꿀 수 없으므로 로그만 남기고 연결 종료
+            logger.error(f"{dataset.value} 내보내기 실패 ({rows}행 전송 후): {e}")
+            raise
+    logger.info(f"{dataset.value} 내보내기 완료: {date_from} ~ {date_to}, {rows}행")
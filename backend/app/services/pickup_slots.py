@@ -0,0 +1,197 @@
+"""
+Pickup Slot Scheduler
+
+픽업 시간대(PICKUP_SLOT_MINUTES 단위)별 주문 수 제한
+- 예약: pickup_slots 행의 reserved 를 조건부 UPDATE (reserved < capacity) 로 1 증가
+  → 같은 시간대의 동시 주문도 DB 가 원자적으로 판정하므로 수용량을 넘지 않음
+  → 행이 없으면 (그 시간대 첫 예약) INSERT, 다른 요청과 충돌하면 UPDATE 를 다시 시도
+- 취소: 주문이 취소되면 reserved 를 1 감소
+- 조회: 시간대별 예약 수를 메모리에 두고 PICKUP_SLOT_CACHE_TTL 마다 pickup_slots 범위 조회로 갱신
+  (orders 테이블 COUNT 없음, 이 프로세스의 예약/취소는 커밋되는 즉시 반영)
+  → 예약/취소의 메모리 반영은 세션에 모아 두었다가 커밋 후에 적용하고, 롤백되면 버림
+
+메모리 값은 조회용 근사치이며 예약 가능 여부는 항상 DB 의 조건부 UPDATE 로 판정
+"""
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, SessionTransaction
+
+from app.core.config import settings
+from app.models.pickup import PickupSlot
+from app.schemas.order import PickupSlotAvailability
+
+# 세션 info 에 모아 두는 커밋 대기 중인 메모리 반영 목록 키
+_PENDING_KEY = "pickup_slot_adjustments"
+
+class PickupSlotError(ValueError):
+    """예약할 수 없는 픽업 시간인 경우 (준비 시간 이전, 예약 가능 범위 밖)"""
+
+class PickupSlotFull(PickupSlotError):
+    """선택한 픽업 시간대의 수용량이 모두 찬 경우"""
+
+class PickupSlotScheduler:
+    """픽업 시간대 예약/조회"""
+
+    def __init__(
+        self,
+        slot_minutes: int,
+        capacity: int,
+        lead_minutes: int,
+        horizon_minutes: int,
+        cache_ttl: float
+    ):
+        self.slot = timedelta(minutes=slot_minutes)
+        self.capacity = capacity
+        self.lead = timedelta(minutes=lead_minutes)
+        self.horizon = timedelta(minutes=horizon_minutes)
+        self.cache_ttl = cache_ttl
+        # 시간대 시작 → (수용량, 예약 수), 행이 없는 시간대는 (capacity, 0)
+        self._slots: Dict[datetime, Tuple[int, int]] = {}
+        self._loaded_range: Optional[Tuple[datetime, datetime]] = None
+        self._loaded_at = 0.0
+        self._load_lock = asyncio.Lock()
+
+    def slot_start(self, when: datetime) -> datetime:
+        """when 이 속한 시간대의 시작 시각"""
+        start = when.replace(second=0, microsecond=0)
+        minutes = start.hour * 60 + start.minute
+        return start - timedelta(minutes=minutes % (self.slot.seconds // 60))
+
+    def bookable_range(self, now: Optional[datetime] = None) -> Tuple[datetime, datetime]:
+        """예약 가능한 첫 시간대 시작 ~ 마지막 시간대 끝 (미포함)"""
+        now = now or datetime.now()
+        earliest = now + self.lead
+        first = self.slot_start(earliest)
+        if first < earliest:
+            first += self.slot
+        return first, self.slot_start(now + self.horizon)
+
+    def _check_bookable(self, pickup_time: datetime) -> datetime:
+        slot = self.slot_start(pickup_time)
+        first, end = self.bookable_range()
+        if not first <= slot < end:
+            raise PickupSlotError(
+                f"예약할 수 없는 픽업 시간입니다 (가능 범위: {first:%H:%M} ~ {end:%H:%M})"
+            )
+        return slot
+
+    def _adjust(self, slot: datetime, delta: int) -> None:
+        capacity, reserved = self._slots.get(slot, (self.capacity, 0))
+        self._slots[slot] = (capacity, max(0, reserved + delta))
+
+    def _adjust_on_commit(self, db: AsyncSession, slot: datetime, delta: int) -> None:
+        """세션이 커밋되면 메모리 예약 수에 반영 (롤백되면 반영하지 않음)"""
+        db.info.setdefault(_PENDING_KEY, []).append((self, slot, delta))
+
+    async def reserve(self, db: AsyncSession, pickup_time: datetime) -> datetime:
+        """
+        pickup_time 이 속한 시간대에 주문 1건 예약 후 시간대 시작 시각 반환 (커밋은 호출 측 책임)
+
+        주문 INSERT 와 같은 트랜잭션에서 호출하면 주문이 롤백될 때 예약도 함께 롤백됨
+        (메모리 예약 수는 커밋된 뒤에만 반영)
+        """
+        slot = self._check_bookable(pickup_time)
+        if not await self._increment(db, slot):
+            try:
+                async with db.begin_nested():
+                    await db.execute(
+                        insert(PickupSlot).values(slot_start=slot, capacity=self.capacity, reserved=1)
+                    )
+            except IntegrityError:
+                # 행이 이미 있음 (꽉 찼거나 다른 요청이 방금 만든 경우)
+                if not await self._increment(db, slot):
+                    capacity = self._slots.get(slot, (self.capacity, 0))[0]
+                    self._slots[slot] = (capacity, capacity)  # 메모리 값도 마감으로 표시
+                    raise PickupSlotFull(f"{slot:%H:%M} 픽업 시간대가 마감되었습니다")
+        self._adjust_on_commit(db, slot, 1)
+        return slot
+
+    async def _increment(self, db: AsyncSession, slot: datetime) -> bool:
+        result = await db.execute(
+            update(PickupSlot)
+            .where(PickupSlot.slot_start == slot, PickupSlot.reserved < PickupSlot.capacity)
+            .values(reserved=PickupSlot.reserved + 1)
+        )
+        return result.rowcount > 0
+
+    async def release(self, db: AsyncSession, pickup_time: datetime) -> None:
+        """주문 취소 시 시간대 예약 1건 해제 (커밋은 호출 측 책임)"""
+        slot = self.slot_start(pickup_time)
+        await db.execute(
+            update(PickupSlot)
+            .where(PickupSlot.slot_start == slot, PickupSlot.reserved > 0)
+            .values(reserved=PickupSlot.reserved - 1)
+        )
+        self._adjust_on_commit(db, slot, -1)
+
+    async def _ensure_loaded(self, db: AsyncSession, first: datetime, end: datetime) -> None:
+        """메모리 예약 수가 오래됐거나 범위를 벗어나면 pickup_slots 범위 조회로 갱신 (쿼리 1회)"""
+        def fresh() -> bool:
+            return (
+                self._loaded_range is not None
+                and self._loaded_range[0] <= first
+                and end <= self._loaded_range[1]
+                and time.monotonic() - self._loaded_at < self.cache_ttl
+            )
+
+        if fresh():
+            return
+        async with self._load_lock:
+            if fresh():
+                return  # 대기하는 동안 다른 요청이 갱신함
+            result = await db.execute(
+                select(PickupSlot.slot_start, PickupSlot.capacity, PickupSlot.reserved)
+                .where(PickupSlot.slot_start >= first, PickupSlot.slot_start < end)
+            )
+            self._slots = {slot: (capacity, reserved) for slot, capacity, reserved in result}
+            self._loaded_range = (first, end)
+            self._loaded_at = time.monotonic()
+
+    async def available_slots(
+        self, db: AsyncSession, include_full: bool = False
+    ) -> List[PickupSlotAvailability]:
+        """예약 가능한 시간대 목록 (메모리 값이 최신이면 DB 조회 없음)"""
+        first, end = self.bookable_range()
+        await self._ensure_loaded(db, first, end)
+
+        slots = []
+        start = first
+        while start < end:
+            capacity, reserved = self._slots.get(start, (self.capacity, 0))
+            available = max(0, capacity - reserved)
+            if available or include_full:
+                slots.append(PickupSlotAvailability(
+                    start=start,
+                    end=start + self.slot,
+                    capacity=capacity,
+                    reserved=reserved,
+                    available=available,
+                ))
+            start += self.slot
+        return slots
+
+@event.listens_for(Session, "after_commit")
+def _apply_committed_adjustments(session: Session) -> None:
+    for scheduler, slot, delta in session.info.pop(_PENDING_KEY, ()):
+        scheduler._adjust(slot, delta)
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_uncommitted_adjustments(session: Session, transaction: SessionTransaction) -> None:
+    # 커밋 없이 끝난 최상위 트랜잭션 (롤백, 세션 종료) 의 예약/취소는 버림
+    if transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
+
+# 픽업 시간대 스케줄러 인스턴스
+pickup_scheduler = PickupSlotScheduler(
+    slot_minutes=settings.PICKUP_SLOT_MINUTES,
+    capacity=settings.PICKUP_SLOT_CAPACITY,
+    lead_minutes=settings.PICKUP_SLOT_LEAD_MINUTES,
+    horizon_minutes=settings.PICKUP_SLOT_HORIZON_MINUTES,
+    cache_ttl=settings.PICKUP_SLOT_CACHE_TTL,
+)
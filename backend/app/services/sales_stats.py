@@ -0,0 +1,239 @@
+"""
+Sales Stats Service
+
+통계 대시보드용 판매 집계
+- 주문이 COMPLETED 가 되는 트랜잭션에서 시간별/일별 메뉴 집계 행에 수량/매출을 더함 (UPSERT 2회)
+  → 대시보드는 order_items 를 합산하지 않고 집계 테이블만 조회
+- 집계 구간은 주문 시각(created_at) 기준
+- 과거 주문은 rebuild_day 로 하루씩 다시 집계 (scripts/backfill_sales_rollups.py)
+  보관 테이블로 옮겨진 주문(app/services/order_archive.py)도 활성 테이블과 UNION ALL 로 함께 집계
+
+완료된 주문은 상태를 다시 바꿀 수 없으므로 (FINAL_STATUSES) 집계 차감은 필요 없음
+"""
+from collections import defaultdict
+from datetime import date, datetime, time, timedelta
+from typing import Dict, Iterable, List, Optional, Tuple, Type
+
+from sqlalchemy import delete, func, insert, select, union_all
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.archive import ArchivedOrder, ArchivedOrderItem
+from app.models.menu import Category, Menu
+from app.models.order import Order, OrderItem, OrderStatus
+from app.models.stats import SalesDaily, SalesHourly
+from app.schemas.stats import CategorySales, DailySales, HourlySales, MenuSales
+
+# 누적되는 집계 값 컬럼
+_MEASURES = ("quantity", "revenue", "order_count")
+
+def hour_start(when: datetime) -> datetime:
+    return when.replace(minute=0, second=0, microsecond=0)
+
+def _upsert(db: AsyncSession, model: Type, rows: List[dict]):
+    """기본키가 같은 행이 있으면 집계 값을 더하는 다중 행 UPSERT 문"""
+    table = model.__table__
+    if db.bind.dialect.name == "mysql":
+        stmt = mysql_insert(table).values(rows)
+        return stmt.on_duplicate_key_update(
+            category_id=stmt.inserted.category_id,
+            **{name: table.c[name] + stmt.inserted[name] for name in _MEASURES},
+        )
+    stmt = sqlite_insert(table).values(rows)
+    return stmt.on_conflict_do_update(
+        index_elements=[column.name for column in table.primary_key],
+        set_={
+            "category_id": stmt.excluded.category_id,
+            **{name: table.c[name] + stmt.excluded[name] for name in _MEASURES},
+        },
+    )
+
+async def _menu_categories(db: AsyncSession, menu_ids: Iterable[int]) -> Dict[int, Optional[int]]:
+    result = await db.execute(select(Menu.id, Menu.category_id).where(Menu.id.in_(set(menu_ids))))
+    return dict(result.all())
+
+def _rollup_rows(
+    totals: Dict[Tuple[datetime, int], List[int]], categories: Dict[int, Optional[int]]
+) -> Tuple[List[dict], List[dict]]:
+    """(정시, 메뉴 ID) → [수량, 매출, 주문 수] 를 시간별/일별 행으로 변환"""
+    hourly = []
+    daily: Dict[Tuple[date, int], List[int]] = defaultdict(lambda: [0, 0, 0])
+    for (bucket, menu_id), values in totals.items():
+        hourly.append({
+            "bucket_start": bucket, "menu_id": menu_id, "category_id": categories.get(menu_id),
+            **dict(zip(_MEASURES, values)),
+        })
+        day = daily[(bucket.date(), menu_id)]
+        for i, value in enumerate(values):
+            day[i] += value  # 주문은 한 시간 구간에만 속하므로 주문 수도 그대로 합산
+    daily_rows = [
+        {
+            "bucket_date": bucket_date, "menu_id": menu_id, "category_id": categories.get(menu_id),
+            **dict(zip(_MEASURES, values)),
+        }
+        for (bucket_date, menu_id), values in daily.items()
+    ]
+    return hourly, daily_rows
+
+async def record_completed_order(db: AsyncSession, order: Order) -> None:
+    """완료된 주문을 집계에 반영 (order_items 가 로딩된 주문, 커밋은 호출 측 책임)"""
+    if not order.order_items:
+        return
+    bucket = hour_start(order.created_at)
+    totals: Dict[Tuple[datetime, int], List[int]] = {}
+    for item in order.order_items:
+        values = totals.setdefault((bucket, item.menu_id), [0, 0, 1])
+        values[0] += item.quantity
+        values[1] += item.subtotal
+
+    categories = await _menu_categories(db, (menu_id for _, menu_id in totals))
+    hourly, daily = _rollup_rows(totals, categories)
+    await db.execute(_upsert(db, SalesHourly, hourly))
+    await db.execute(_upsert(db, SalesDaily, daily))
+
+def _completed_items(start: datetime, end: datetime):
+    """기간 내 완료된 주문의 항목 (활성 + 보관 테이블 UNION ALL, 주문 ID 는 두 테이블에서 겹치지 않음)"""
+    return union_all(*(
+        select(
+            order_model.id.label("order_id"), order_model.created_at,
+            item_model.menu_id, item_model.quantity, item_model.subtotal,
+        )
+        .join(item_model, item_model.order_id == order_model.id)
+        .where(
+            order_model.status == OrderStatus.COMPLETED,
+            order_model.created_at >= start,
+            order_model.created_at < end,
+        )
+        for order_model, item_model in ((Order, OrderItem), (ArchivedOrder, ArchivedOrderItem))
+    )).subquery("completed_items")
+
+async def rebuild_day(db: AsyncSession, day: date) -> int:
+    """
+    하루치 집계를 완료된 주문으로부터 다시 계산해 교체 후 집계한 주문 수 반환 (커밋은 호출 측 책임)
+
+    활성/보관 테이블의 주문을 각각 (status, created_at, id) 인덱스 범위로 읽어 스트리밍하므로
+    메모리는 하루치 집계만 사용 (보관 기준일이 걸친 날도 두 테이블을 합쳐 계산)
+    """
+    start = datetime.combine(day, time.min)
+    end = start + timedelta(days=1)
+    await db.execute(
+        delete(SalesHourly).where(SalesHourly.bucket_start >= start, SalesHourly.bucket_start < end)
+    )
+    await db.execute(delete(SalesDaily).where(SalesDaily.bucket_date == day))
+
+    totals: Dict[Tuple[datetime, int], List[int]] = {}
+    last_order: Dict[Tuple[datetime, int], int] = {}
+    orders = set()
+    items = _completed_items(start, end)
+    result = await db.stream(
+        select(items.c.order_id, items.c.created_at, items.c.menu_id, items.c.quantity, items.c.subtotal)
+        .order_by(items.c.created_at, items.c.order_id)  # 같은 주문의 항목이 연속되도록
+        .execution_options(yield_per=1000)
+    )
+    async for order_id, created_at, menu_id, quantity, subtotal in result:
+        key = (hour_start(created_at), menu_id)
+        values = totals.setdefault(key, [0, 0, 0])
+        values[0] += quantity
+        values[1] += subtotal
+        if last_order.get(key) != order_id:
+            last_order[key] = order_id
+            values[2] += 1
+        orders.add(order_id)
+
+    if totals:
+        categories = await _menu_categories(db, (menu_id for _, menu_id in totals))
+        hourly, daily = _rollup_rows(totals, categories)
+        await db.execute(insert(SalesHourly), hourly)
+        await db.execute(insert(SalesDaily), daily)
+    return len(orders)
+
+async def completed_order_date_range(db: AsyncSession) -> Optional[Tuple[date, date]]:
+    """완료된 주문의 첫/마지막 주문 일자 (백필 범위 기본값, 보관된 주문 포함)"""
+    bounds = union_all(*(
+        select(func.min(model.created_at).label("first"), func.max(model.created_at).label("last"))
+        .where(model.status == OrderStatus.COMPLETED)
+        for model in (Order, ArchivedOrder)
+    )).subquery("completed_bounds")
+    first, last = (await db.execute(select(func.min(bounds.c.first), func.max(bounds.c.last)))).one()
+    if first is None:
+        return None
+    return first.date(), last.date()
+
+async def daily_sales(db: AsyncSession, date_from: date, date_to: date) -> List[DailySales]:
+    """일별 판매 합계 (date_to 포함)"""
+    result = await db.execute(
+        select(
+            SalesDaily.bucket_date.label("date"),
+            func.sum(SalesDaily.quantity).label("quantity"),
+            func.sum(SalesDaily.revenue).label("revenue"),
+        )
+        .where(SalesDaily.bucket_date >= date_from, SalesDaily.bucket_date <= date_to)
+        .group_by(SalesDaily.bucket_date)
+        .order_by(SalesDaily.bucket_date)
+    )
+    return [DailySales.model_validate(dict(row)) for row in result.mappings()]
+
+async def hourly_sales(db: AsyncSession, day: date) -> List[HourlySales]:
+    """하루의 시간별 판매 합계"""
+    start = datetime.combine(day, time.min)
+    result = await db.execute(
+        select(
+            SalesHourly.bucket_start.label("hour_start"),
+            func.sum(SalesHourly.quantity).label("quantity"),
+            func.sum(SalesHourly.revenue).label("revenue"),
+        )
+        .where(SalesHourly.bucket_start >= start, SalesHourly.bucket_start < start + timedelta(days=1))
+        .group_by(SalesHourly.bucket_start)
+        .order_by(SalesHourly.bucket_start)
+    )
+    return [HourlySales.model_validate(dict(row)) for row in result.mappings()]
+
+async def menu_sales(
+    db: AsyncSession,
+    date_from: date,
+    date_to: date,
+    category_id: Optional[int] = None,
+    limit: int = 20
+) -> List[MenuSales]:
+    """기간 내 메뉴별 판매 (매출 내림차순)"""
+    totals = (
+        select(
+            SalesDaily.menu_id,
+            func.sum(SalesDaily.quantity).label("quantity"),
+            func.sum(SalesDaily.revenue).label("revenue"),
+            func.sum(SalesDaily.order_count).label("order_count"),
+        )
+        .where(SalesDaily.bucket_date >= date_from, SalesDaily.bucket_date <= date_to)
+        .group_by(SalesDaily.menu_id)
+    )
+    if category_id is not None:
+        totals = totals.where(SalesDaily.category_id == category_id)
+    totals = totals.subquery("menu_totals")
+
+    result = await db.execute(
+        select(totals, Menu.name.label("menu_name"), Menu.category_id)
+        .outerjoin(Menu, Menu.id == totals.c.menu_id)
+        .order_by(totals.c.revenue.desc(), totals.c.menu_id)
+        .limit(limit)
+    )
+    return [MenuSales.model_validate(dict(row)) for row in result.mappings()]
+
+async def category_sales(db: AsyncSession, date_from: date, date_to: date) -> List[CategorySales]:
+    """기간 내 카테고리별 판매 (매출 내림차순)"""
+    totals = (
+        select(
+            SalesDaily.category_id,
+            func.sum(SalesDaily.quantity).label("quantity"),
+            func.sum(SalesDaily.revenue).label("revenue"),
+        )
+        .where(SalesDaily.bucket_date >= date_from, SalesDaily.bucket_date <= date_to)
+        .group_by(SalesDaily.category_id)
+        .subquery("category_totals")
+    )
+    result = await db.execute(
+        select(totals, Category.name.label("category_name"))
+        .outerjoin(Category, Category.id == totals.c.category_id)
+        .order_by(totals.c.revenue.desc())
+    )
+    return [CategorySales.model_validate(dict(row)) for row in result.mappings()]
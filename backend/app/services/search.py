@@ -0,0 +1,211 @@
+"""
+Menu Search Service
+
+메뉴 이름/설명에 대한 인메모리 문자 바이그램 역색인
+"라떼"처럼 단어 중간에 나오는 한국어 부분 문자열도 B-tree 인덱스 없이 검색 가능
+
+- 색인 단위: 공백으로 나눈 단어별 2글자 바이그램 (1글자 검색어용 유니그램 포함)
+- 순위: 바이그램 IDF 가중합 (이름 가중치 3, 설명 1) + 검색어 전체 포함 시 가산
+- 메뉴 생성/수정/삭제 시 해당 메뉴만 증분 갱신
+"""
+import asyncio
+import heapq
+import math
+import unicodedata
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logger import logger
+from app.models.menu import Menu
+
+NAME_WEIGHT = 3.0
+DESCRIPTION_WEIGHT = 1.0
+# 검색어 바이그램 중 이 비율 이상이 일치해야 결과에 포함
+MIN_COVERAGE = 0.6
+# 검색어 전체가 이름/설명에 그대로 포함된 경우 점수 배수
+NAME_MATCH_BOOST = 2.0
+DESCRIPTION_MATCH_BOOST = 1.3
+
+def normalize(text: Optional[str]) -> str:
+    """NFC 정규화 + 소문자 변환 (조합형/완성형 한글 차이 제거)"""
+    return unicodedata.normalize("NFC", text or "").lower()
+
+def _grams(text: str) -> Iterator[str]:
+    """단어별 유니그램과 바이그램 생성"""
+    for word in text.split():
+        yield from word
+        for i in range(len(word) - 1):
+            yield word[i:i + 2]
+
+def query_grams(text: str) -> List[str]:
+    """검색어 색인 단위 (바이그램이 없으면 유니그램 사용)"""
+    words = text.split()
+    grams = {word[i:i + 2] for word in words for i in range(len(word) - 1)}
+    if not grams:
+        grams = {char for word in words for char in word}
+    return sorted(grams)
+
+@dataclass
+class IndexedMenu:
+    """색인된 메뉴 정보"""
+    category_id: int
+    is_available: bool
+    name: str  # 정규화 + 공백 제거
+    description: str  # 정규화 + 공백 제거
+    weights: Dict[str, float]
+
+class MenuSearchIndex:
+    """메뉴 바이그램 역색인"""
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[int, float]] = defaultdict(dict)
+        self._docs: Dict[int, IndexedMenu] = {}
+        self._built = False
+        self._building = False
+        self._stale = False
+        self._lock = asyncio.Lock()
+
+    @property
+    def size(self) -> int:
+        return len(self._docs)
+
+    def upsert(self, menu: Menu) -> None:
+        """메뉴 추가 또는 갱신"""
+        if self._building:
+            self._stale = True
+        if not self._built:
+            return
+        self._remove(menu.id)
+        self._add(menu)
+
+    def remove(self, menu_id: int) -> None:
+        """메뉴 제거"""
+        if self._building:
+            self._stale = True
+        if self._built:
+            self._remove(menu_id)
+
+    def invalidate(self) -> None:
+        """일괄 변경 후 호출: 다음 검색 시 전체 재색인"""
+        if self._building:
+            self._stale = True
+        self._built = False
+
+    def _add(self, menu: Menu) -> None:
+        name = normalize(menu.name)
+        description = normalize(menu.description)
+        weights: Dict[str, float] = defaultdict(float)
+        for gram in _grams(name):
+            weights[gram] += NAME_WEIGHT
+        for gram in _grams(description):
+            weights[gram] += DESCRIPTION_WEIGHT
+        self._docs[menu.id] = IndexedMenu(
+            category_id=menu.category_id,
+            is_available=bool(menu.is_available),
+            name="".join(name.split()),
+            description="".join(description.split()),
+            weights=dict(weights),
+        )
+        for gram, weight in weights.items():
+            self._postings[gram][menu.id] = weight
+
+    def _remove(self, menu_id: int) -> None:
+        doc = self._docs.pop(menu_id, None)
+        if doc is None:
+            return
+        for gram in doc.weights:
+            posting = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.pop(menu_id, None)
+            if not posting:
+                del self._postings[gram]
+
+    def build(self, menus: List[Menu]) -> None:
+        """전체 재색인"""
+        self._postings = defaultdict(dict)
+        self._docs = {}
+        for menu in menus:
+            self._add(menu)
+        self._built = True
+
+    async def ensure_built(self, db: AsyncSession) -> None:
+        """색인이 없으면 DB에서 전체 메뉴를 읽어 생성 (동시 요청은 한 번만 생성)"""
+        if self._built:
+            return
+        async with self._lock:
+            if self._built:
+                return
+            self._building = True
+            self._stale = False
+            try:
+                result = await db.execute(select(Menu))
+                self.build(result.scalars().all())
+                # 조회 이후 발생한 변경은 반영되지 않았으므로 다음 검색에서 재색인
+                if self._stale:
+                    self._built = False
+                logger.info(f"메뉴 검색 색인 생성: {self.size}개")
+            finally:
+                self._building = False
+
+    def search(
+        self,
+        query: str,
+        limit: int,
+        category_id: Optional[int] = None,
+        available_only: bool = True
+    ) -> List[int]:
+        """검색어와 관련도 높은 순으로 메뉴 ID 목록 반환"""
+        normalized = normalize(query)
+        grams = query_grams(normalized)
+        if not grams:
+            return []
+
+        total = len(self._docs) or 1
+        postings = sorted(
+            ((gram, self._postings.get(gram) or {}) for gram in grams),
+            key=lambda item: len(item[1])
+        )
+        required = max(1, math.ceil(len(grams) * MIN_COVERAGE))
+
+        # required개 이상 일치하려면 가장 희귀한 (n - required + 1)개 중 하나에는
+        # 반드시 포함되므로, 흔한 바이그램의 긴 포스팅 목록은 순회하지 않음
+        candidates = set()
+        for _, posting in postings[:len(grams) - required + 1]:
+            candidates.update(posting)
+        idfs = [
+            (gram, math.log(1 + total / len(posting)))
+            for gram, posting in postings if posting
+        ]
+
+        compact = "".join(normalized.split())
+        ranked = []
+        for menu_id in candidates:
+            doc = self._docs[menu_id]
+            if available_only and not doc.is_available:
+                continue
+            if category_id and doc.category_id != category_id:
+                continue
+            score = 0.0
+            matched = 0
+            for gram, idf in idfs:
+                weight = doc.weights.get(gram)
+                if weight:
+                    score += weight * idf
+                    matched += 1
+            if matched < required:
+                continue
+            if compact in doc.name:
+                score *= NAME_MATCH_BOOST
+            elif compact in doc.description:
+                score *= DESCRIPTION_MATCH_BOOST
+            ranked.append((score, -menu_id))
+
+        return [-neg_id for _, neg_id in heapq.nlargest(limit, ranked)]
+
+# 메뉴 검색 색인 인스턴스
+menu_search_index = MenuSearchIndex()
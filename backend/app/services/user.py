@@ -0,0 +1,101 @@
+"""
+User Service
+
+로그인(자격 증명 확인), 비밀번호 변경, 토큰 → Principal 해석, 사용자 권한/활성 상태 변경
+- 비밀번호 해싱/검증은 password_hasher 스레드 풀에서 실행 (대기열이 차면 PasswordHasherBusy)
+- 로그인 시 저장된 해시의 bcrypt cost 가 설정과 다르면 새 해시로 교체 (커밋은 호출 측 책임)
+- 인증된 요청은 principal_cache 적중 시 users 조회 없이 처리 (app/core/security.py)
+- 권한/활성 상태를 바꾸면 커밋 후 해당 사용자의 캐시 항목을 무효화해야 함 (호출 측 책임)
+"""
+from typing import Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.logger import logger
+from app.core.security import Principal, decode_access_token, password_hasher, principal_cache
+from app.models.user import User
+
+class UserNotFound(LookupError):
+    """사용자가 없는 경우"""
+
+class InvalidPassword(ValueError):
+    """현재 비밀번호가 일치하지 않는 경우"""
+
+async def _check_password(user: User, password: str) -> bool:
+    """비밀번호 확인, cost 가 바뀐 해시는 새 해시로 교체"""
+    if not user.hashed_password:
+        await password_hasher.verify_dummy(password)
+        return False
+    valid, new_hash = await password_hasher.verify_and_update(password, user.hashed_password)
+    if valid and new_hash:
+        user.hashed_password = new_hash
+        logger.info(f"비밀번호 재해싱: {user.username} (ID: {user.id})")
+    return valid
+
+async def authenticate(db: AsyncSession, username: str, password: str) -> Optional[User]:
+    """
+    아이디/비밀번호 확인 후 사용자 반환 (실패 시 None)
+
+    없는 아이디도 고정 해시로 검증해 응답 시간으로 아이디 존재 여부를 알 수 없게 함
+    """
+    user = await db.scalar(select(User).where(User.username == username))
+    if user is None:
+        await password_hasher.verify_dummy(password)
+        return None
+    if not await _check_password(user, password):
+        return None
+    return user
+
+async def change_password(db: AsyncSession, user_id: int, current_password: str, new_password: str) -> User:
+    """현재 비밀번호 확인 후 새 비밀번호로 변경 (커밋은 호출 측 책임)"""
+    user = await db.get(User, user_id)
+    if user is None:
+        raise UserNotFound(user_id)
+    if not await _check_password(user, current_password):
+        raise InvalidPassword("현재 비밀번호가 올바르지 않습니다")
+    user.hashed_password = await password_hasher.hash(new_password)
+    return user
+
+async def resolve_principal(db: AsyncSession, token: str) -> Optional[Principal]:
+    """
+    토큰 → Principal (캐시 미스일 때만 서명 검증 + users 조회 1회)
+
+    유효하지 않은 토큰이면 InvalidToken, 사용자가 없으면 None
+    """
+    principal = principal_cache.get(token)
+    if principal is not None:
+        return principal
+
+    user_id, expires_at = decode_access_token(token)
+    generation = principal_cache.generation
+    row = (await db.execute(
+        select(User.username, User.is_admin, User.is_active).where(User.id == user_id)
+    )).one_or_none()
+    if row is None:
+        return None
+    principal = Principal(
+        user_id=user_id, username=row.username, is_admin=bool(row.is_admin), is_active=bool(row.is_active)
+    )
+    principal_cache.set(token, principal, expires_at, generation)
+    return principal
+
+async def update_access(
+    db: AsyncSession,
+    user_id: int,
+    is_active: Optional[bool] = None,
+    is_admin: Optional[bool] = None
+) -> User:
+    """사용자 활성 상태/관리자 권한 변경 (커밋과 캐시 무효화는 호출 측 책임)"""
+    values = {
+        name: value for name, value in (("is_active", is_active), ("is_admin", is_admin))
+        if value is not None
+    }
+    if values:
+        result = await db.execute(update(User).where(User.id == user_id).values(**values))
+        if result.rowcount == 0:
+            raise UserNotFound(user_id)
+    user = await db.get(User, user_id, populate_existing=True)
+    if user is None:
+        raise UserNotFound(user_id)
+    return user
@@ -16,21 +16,14 @@ try:
     from app.core.config import settings
     from app.core.logger import logger
     from app.db.base import engine, Base, SessionLocal
-    from app.models import Category, Menu, User, Order, OrderItem, OrderStatus
-    from passlib.context import CryptContext
+    from app.models import Category, Menu, User, Order, OrderItem, OrderStatus, SalesHourly, SalesDaily
+    from app.core.security import hash_password
 except ImportError as e:
     print(f"❌ Import 에러: {e}")
     print("현재 작업 디렉토리:", os.getcwd())
     print("Python 경로:", sys.path)
     raise
 
-# 비밀번호 해싱 컨텍스트
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def hash_password(password: str) -> str:
-    """비밀번호 해싱"""
-    return pwd_context.hash(password)
-
 def init_database():
     """데이터베이스 초기화"""
     try:
@@ -51,6 +44,8 @@ def clear_existing_data(db):
     """기존 데이터 삭제"""
     try:
         # 순서 중요: 외래키 관계 고려
+        db.query(SalesHourly).delete()
+        db.query(SalesDaily).delete()
         db.query(OrderItem).delete()
         db.query(Order).delete()
         db.query(Menu).delete()
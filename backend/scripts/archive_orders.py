@@ -0,0 +1,66 @@
+"""
+주문 보관
+
+생성 후 ORDER_ARCHIVE_AFTER_DAYS 일이 지난 완료/취소 주문을 보관 테이블
+(orders_archive / order_items_archive)로 옮깁니다.
+ORDER_ARCHIVE_BATCH_SIZE 건씩 짧은 트랜잭션으로 나누어 처리하므로 영업 중에도 실행할 수 있으며,
+cron 등으로 하루 한 번 실행하는 것을 권장합니다.
+보관된 주문도 GET /orders/{id}, GET /admin/orders 로 계속 조회됩니다.
+
+실행 (backend 디렉토리에서, .env 의 데이터베이스 대상):
+    python scripts/archive_orders.py
+    python scripts/archive_orders.py --older-than-days 30 --batch-size 200 --max-batches 10
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.config import settings
+from app.db.base import AsyncSessionLocal, Base, async_engine
+from app.models import ArchivedOrder, ArchivedOrderItem
+from app.services.order_archive import archive_orders
+
+async def main(args) -> int:
+    async with async_engine.begin() as conn:
+        # 보관 테이블이 없으면 생성 (앱 시작 시와 동일)
+        await conn.run_sync(
+            Base.metadata.create_all, tables=[ArchivedOrder.__table__, ArchivedOrderItem.__table__]
+        )
+
+    started = time.perf_counter()
+    try:
+        moved = await archive_orders(
+            AsyncSessionLocal,
+            older_than_days=args.older_than_days,
+            batch_size=args.batch_size,
+            pause=args.pause,
+            max_batches=args.max_batches,
+        )
+    except Exception as e:
+        print(f"❌ 주문 보관 실패: {e}")
+        return 1
+    finally:
+        await async_engine.dispose()
+
+    print(
+        f"✅ {args.older_than_days}일 지난 완료/취소 주문 {moved}건 보관 "
+        f"({time.perf_counter() - started:.1f}초)"
+    )
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="오래된 완료/취소 주문을 보관 테이블로 이동")
+    parser.add_argument("--older-than-days", type=int, default=settings.ORDER_ARCHIVE_AFTER_DAYS,
+                        help="생성 후 경과 일수")
+    parser.add_argument("--batch-size", type=int, default=settings.ORDER_ARCHIVE_BATCH_SIZE,
+                        help="트랜잭션당 주문 수")
+    parser.add_argument("--pause", type=float, default=settings.ORDER_ARCHIVE_BATCH_PAUSE,
+                        help="배치 사이 대기 시간 (초)")
+    parser.add_argument("--max-batches", type=int, help="최대 배치 수 (기본: 대상이 없을 때까지)")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,78 @@
+"""
+판매 집계 백필
+
+완료된 주문(보관 테이블로 옮겨진 주문 포함)으로부터 sales_hourly / sales_daily 집계를 하루 단위로 다시 계산합니다.
+집계 테이블을 처음 도입했을 때 과거 주문을 반영하거나, 집계가 어긋났을 때 복구하는 용도이며
+하루씩 별도 트랜잭션으로 교체하므로 여러 번 실행해도 결과가 같습니다.
+기간을 지정하지 않으면 완료된 주문이 있는 첫날부터 마지막 날까지 처리합니다.
+(완료된 주문이 없을 때 --from 만 지정하면 오늘까지, --to 만 지정하면 시작일을 정할 수 없어 오류)
+
+실행 (backend 디렉토리에서, .env 의 데이터베이스 대상):
+    python scripts/backfill_sales_rollups.py
+    python scripts/backfill_sales_rollups.py --from 2026-01-01 --to 2026-01-31
+"""
+import argparse
+import asyncio
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.db.base import AsyncSessionLocal, Base, async_engine
+from app.models import ArchivedOrder, ArchivedOrderItem, SalesDaily, SalesHourly
+from app.services.sales_stats import completed_order_date_range, rebuild_day
+
+async def main(args) -> int:
+    async with async_engine.begin() as conn:
+        # 집계/보관 테이블이 없으면 생성 (앱 시작 시와 동일)
+        await conn.run_sync(Base.metadata.create_all, tables=[
+            SalesHourly.__table__, SalesDaily.__table__, ArchivedOrder.__table__, ArchivedOrderItem.__table__,
+        ])
+
+    async with AsyncSessionLocal() as db:
+        date_range = await completed_order_date_range(db)
+    if date_range is None and args.date_from is None:
+        await async_engine.dispose()
+        if args.date_to is None:
+            print("완료된 주문이 없습니다")
+            return 0
+        print("❌ 완료된 주문이 없어 시작일을 정할 수 없습니다. --from 을 함께 지정하세요")
+        return 1
+    date_from = args.date_from or date_range[0]
+    date_to = args.date_to or (date_range[1] if date_range else date.today())
+
+    started = time.perf_counter()
+    total_orders = 0
+    day = date_from
+    while day <= date_to:
+        async with AsyncSessionLocal() as db:
+            try:
+                orders = await rebuild_day(db, day)
+                await db.commit()
+            except Exception as e:
+                await db.rollback()
+                print(f"❌ {day}: {e}")
+                await async_engine.dispose()
+                return 1
+        total_orders += orders
+        if orders or args.verbose:
+            print(f"✅ {day}: 주문 {orders}건")
+        day += timedelta(days=1)
+
+    print(
+        f"\n{date_from} ~ {date_to} 집계 완료: 주문 {total_orders}건 "
+        f"({time.perf_counter() - started:.1f}초)"
+    )
+    await async_engine.dispose()
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="완료된 주문으로 판매 집계 테이블 재계산")
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, help="시작일 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, help="종료일 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--verbose", action="store_true", help="주문이 없는 날도 출력")
+    sys.exit(asyncio.run(main(parser.parse_args())))
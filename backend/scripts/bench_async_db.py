@@ -0,0 +1,147 @@
+"""
+비동기 DB 계층 벤치마크
+
+async def 핸들러에서 동기 Session 을 호출하던 기존 방식(before)과
+AsyncSession 기반 엔드포인트(after)의 동시 요청 처리량을 비교합니다.
+쿼리마다 BENCH_QUERY_LATENCY_MS(기본 2ms) 지연을 주어 원격 MySQL 왕복을 흉내내며,
+부하 중 /health 응답 시간으로 이벤트 루프 블로킹 여부도 함께 측정합니다.
+
+실행 (backend 디렉토리에서):
+    python scripts/bench_async_db.py --requests 400 --concurrency 50
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from bench_utils import (
+    QUERY_LATENCY, SlowConnection, prepare_environment, print_report, summarize
+)
+
+db_path = prepare_environment("bench_async_db")
+
+import httpx
+from fastapi import Depends
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import Session, lazyload, sessionmaker
+
+from app.db.base import Base, get_async_db
+from app.main import app
+from app.models import Category, Menu
+from app.schemas.menu import Menu as MenuSchema
+
+# 풀 고갈로 인한 대기가 아닌 쿼리 실행 방식 차이만 비교하도록 풀을 넉넉하게 설정
+POOL_OPTIONS = {"pool_size": 100, "max_overflow": 100}
+
+slow_sync_engine = create_engine(
+    f"sqlite:///{db_path}",
+    connect_args={"factory": SlowConnection, "check_same_thread": False},
+    **POOL_OPTIONS,
+)
+slow_async_engine = create_async_engine(
+    f"sqlite+aiosqlite:///{db_path}",
+    connect_args={"factory": SlowConnection},
+    **POOL_OPTIONS,
+)
+SlowSessionLocal = sessionmaker(bind=slow_sync_engine, autoflush=False)
+SlowAsyncSessionLocal = async_sessionmaker(bind=slow_async_engine, expire_on_commit=False)
+
+def seed(menu_count: int):
+    """카테고리 5개, 메뉴 menu_count개 생성"""
+    seed_engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=seed_engine)
+    with Session(seed_engine) as db:
+        categories = [Category(name=f"카테고리{i}", display_order=i) for i in range(5)]
+        db.add_all(categories)
+        db.flush()
+        db.add_all(
+            Menu(
+                name=f"메뉴{i}",
+                category_id=categories[i % 5].id,
+                price=3000 + i,
+                description="벤치마크용 메뉴",
+                is_available=True,
+            )
+            for i in range(menu_count)
+        )
+        db.commit()
+    seed_engine.dispose()
+
+def get_legacy_db():
+    db = SlowSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+@app.get("/bench/legacy/menus", response_model=List[MenuSchema])
+async def legacy_get_menus(db: Session = Depends(get_legacy_db)):
+    """기존 방식: async def 안에서 동기 쿼리 실행 (이벤트 루프 블로킹, 카테고리 지연 로딩)"""
+    query = db.query(Menu).options(lazyload(Menu.category))
+    return query.filter(Menu.is_available == True).offset(0).limit(20).all()
+
+async def get_bench_async_db():
+    async with SlowAsyncSessionLocal() as db:
+        yield db
+
+app.dependency_overrides[get_async_db] = get_bench_async_db
+
+async def run_load(client: httpx.AsyncClient, path: str, total: int, concurrency: int):
+    """path 로 total 건을 concurrency 동시성으로 요청하며 /health 응답 시간도 측정"""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+    health_latencies: List[float] = []
+    done = asyncio.Event()
+
+    async def one_request():
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.get(path)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    async def probe_health():
+        while not done.is_set():
+            started = time.perf_counter()
+            await client.get("/health")
+            health_latencies.append(time.perf_counter() - started)
+            await asyncio.sleep(0.005)
+
+    prober = asyncio.create_task(probe_health())
+    started = time.perf_counter()
+    await asyncio.gather(*(one_request() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    done.set()
+    await prober
+    return summarize(latencies, elapsed), summarize(health_latencies, elapsed)
+
+async def main(args):
+    seed(args.menus)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        before, before_health = await run_load(
+            client, "/bench/legacy/menus", args.requests, args.concurrency
+        )
+        after, after_health = await run_load(
+            client, "/api/v1/menus", args.requests, args.concurrency
+        )
+    await slow_async_engine.dispose()
+
+    print_report(
+        f"GET /menus 동시 요청 (동시성 {args.concurrency}, "
+        f"쿼리 지연 {QUERY_LATENCY * 1000:.0f}ms)",
+        {
+            "before: 동기 Session": before,
+            "after: AsyncSession": after,
+            "before: /health 중": before_health,
+            "after: /health 중": after_health,
+        },
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="동기/비동기 DB 계층 처리량 비교")
+    parser.add_argument("--requests", type=int, default=400, help="엔드포인트별 요청 수")
+    parser.add_argument("--concurrency", type=int, default=50, help="동시 요청 수")
+    parser.add_argument("--menus", type=int, default=200, help="생성할 메뉴 수")
+    asyncio.run(main(parser.parse_args()))
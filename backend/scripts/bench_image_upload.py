@@ -0,0 +1,178 @@
+"""
+메뉴 이미지 업로드 벤치마크
+
+GET /menus 를 일정 간격으로 계속 호출하는 동안 PUT /menus/{id}/image 로 사진 크기 JPEG 를 동시에 올려
+변형 생성(디코딩/리사이즈/WebP 인코딩)을 이벤트 루프에서 직접 실행하는 방식(before)과
+프로세스 풀(image_processor)에서 실행하는 방식(after)의 /menus 지연 시간(p50/p99)을 비교합니다.
+업로드가 없을 때의 /menus 지연 시간(baseline), 같은 사진을 다시 올릴 때(내용 해시로 재사용)의 업로드 시간,
+메뉴 카드가 받는 이미지 크기(원본 vs 변형)도 함께 출력합니다.
+
+실행 (backend 디렉토리에서):
+    python scripts/bench_image_upload.py --uploads 8 --duration 5
+"""
+import argparse
+import asyncio
+import io
+import os
+import tempfile
+import time
+from typing import Dict, List, Optional, Tuple
+
+from bench_utils import prepare_environment, print_report, probe_latency, summarize
+
+db_path = prepare_environment("bench_image_upload")
+os.environ["UPLOAD_DIRECTORY"] = tempfile.mkdtemp(prefix="bench_image_upload_")
+
+import httpx
+from PIL import Image, ImageFilter
+from sqlalchemy import create_engine, insert
+
+from app.core.config import settings
+from app.core.images import image_processor, render_variants
+from app.core.security import create_access_token
+from app.db.base import Base
+from app.main import app, lifespan
+from app.models import Category, Menu, User
+from app.services import image_store
+
+ADMIN_ID = 1
+
+class InlineProcessor:
+    """before: 이벤트 루프에서 직접 변형 생성 (프로세스 풀 도입 전 방식)"""
+
+    async def render(self, source, target_dir) -> Dict[str, object]:
+        return render_variants(
+            str(source), str(target_dir), tuple(settings.IMAGE_VARIANT_WIDTHS),
+            settings.IMAGE_WEBP_QUALITY, settings.IMAGE_MAX_PIXELS,
+        )
+
+def photo_jpeg(width: int, height: int) -> bytes:
+    """사진처럼 압축이 잘 안 되는 JPEG (그라데이션 + 노이즈)"""
+    gradient = Image.linear_gradient("L").resize((width, height))
+    noise = Image.effect_noise((width, height), 48).filter(ImageFilter.GaussianBlur(1))
+    image = Image.merge("RGB", (gradient, noise, Image.blend(gradient, noise, 0.5)))
+    buffer = io.BytesIO()
+    image.save(buffer, "JPEG", quality=92)
+    return buffer.getvalue()
+
+def seed(menu_count: int):
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{
+            "id": ADMIN_ID, "username": "admin", "email": "admin@cafe.com", "hashed_password": "", "is_admin": True,
+        }])
+        conn.execute(insert(Category), [{"id": 1, "name": "커피", "display_order": 0}])
+        conn.execute(insert(Menu), [
+            {"name": f"메뉴{i}", "category_id": 1, "price": 3000 + i, "is_available": True}
+            for i in range(menu_count)
+        ])
+    engine.dispose()
+
+def distinct_photos(photo: bytes, count: int) -> List[bytes]:
+    """내용 해시가 서로 다른 같은 사진 count 개 (JPEG 끝 뒤에 붙인 바이트는 디코딩에 영향 없음)"""
+    return [photo + i.to_bytes(4, "big") for i in range(count)]
+
+async def upload_burst(client: httpx.AsyncClient, photos: List[bytes], first_menu_id: int = 1) -> Tuple[list, Optional[dict]]:
+    """사진마다 다른 메뉴로 동시에 업로드: (성공 응답 시간 목록, 마지막 응답 본문)"""
+    latencies = []
+    last = None
+
+    async def one_upload(menu_id: int):
+        nonlocal last
+        started = time.perf_counter()
+        response = await client.put(
+            f"/api/v1/menus/{menu_id}/image", content=photos[menu_id - first_menu_id],
+            headers={"Content-Type": "image/jpeg"},
+        )
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+        last = response.json()
+
+    await asyncio.gather(*(one_upload(first_menu_id + i) for i in range(len(photos))))
+    return latencies, last
+
+async def run(client: httpx.AsyncClient, args, photos: List[bytes], processor) -> Tuple[dict, Optional[dict], Optional[dict]]:
+    stop = asyncio.Event()
+    started = time.perf_counter()
+    probe = asyncio.create_task(probe_latency(client, "/api/v1/menus", stop, args.interval_ms / 1000))
+    upload_stats = None
+    last = None
+    if photos:
+        image_store.image_processor = processor
+        await asyncio.sleep(args.duration / 5)  # 업로드 전 정상 구간
+        upload_started = time.perf_counter()
+        latencies, last = await upload_burst(client, photos)
+        upload_stats = summarize(latencies, time.perf_counter() - upload_started)
+    await asyncio.sleep(max(0.0, args.duration - (time.perf_counter() - started)))
+    stop.set()
+    menu_latencies = await probe
+    return summarize(menu_latencies, time.perf_counter() - started), upload_stats, last
+
+def warmup_paths(photo: bytes):
+    """작업 프로세스 시작용 (원본 경로, 변형 경로)"""
+    source = settings.upload_path / "warmup.jpg"
+    source.write_bytes(photo)
+    return source, settings.upload_path / "warmup"
+
+async def main(args):
+    seed(max(args.menus, args.uploads * 3))
+    photo = photo_jpeg(args.width, args.height)
+    image_processor.max_queue = args.uploads  # 동시 업로드가 503 없이 모두 처리되도록
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://bench", timeout=None,
+            headers={"Authorization": f"Bearer {create_access_token(ADMIN_ID)}"},  # 업로드는 관리자 전용
+        ) as client:
+            (await client.get("/api/v1/menus")).raise_for_status()  # 카탈로그 캐시 준비
+            # 작업 프로세스 시작 비용은 측정에서 제외
+            await image_processor.render(*warmup_paths(photo))
+            # before/after 가 서로의 결과를 재사용하지 않도록 다른 내용으로 업로드
+            before_photos = distinct_photos(photo, args.uploads)
+            after_photos = distinct_photos(photo + b"after", args.uploads)
+            baseline, _, _ = await run(client, args, [], None)
+            before, before_uploads, _ = await run(client, args, before_photos, InlineProcessor())
+            after, after_uploads, stored = await run(client, args, after_photos, image_processor)
+            # 같은 사진을 다른 메뉴에 다시 올림 (변환 없이 재사용)
+            started = time.perf_counter()
+            latencies, reused = await upload_burst(client, after_photos, first_menu_id=args.uploads + 1)
+            reuse_uploads = summarize(latencies, time.perf_counter() - started)
+            stored_count = sum(1 for path in image_store.images_dir().iterdir() if path.is_dir())
+            sizes = {
+                width: len((await client.get(url)).content) for width, url in stored["variants"].items()
+            }
+
+    print_report(
+        f"/menus 응답 시간 (업로드 {args.uploads}건 동시 요청, {args.width}x{args.height} JPEG "
+        f"{len(photo) / 1024:.0f}KB, 변형 {settings.IMAGE_VARIANT_WIDTHS}, 작업 프로세스 {image_processor.workers}개)",
+        {"baseline: 업로드 없음": baseline, "before: 루프에서 변환": before, "after: 프로세스 풀": after},
+    )
+    print_report(
+        "업로드 응답 시간",
+        {
+            "before: 루프에서 변환": before_uploads,
+            "after: 프로세스 풀": after_uploads,
+            "after: 같은 사진 재업로드": reuse_uploads,
+        },
+        unit="uploads/s",
+    )
+    print(
+        f"\n업로드 {args.uploads * 3}건 → 저장된 이미지 {stored_count}개 "
+        f"(재업로드 응답 reused={reused['reused']})"
+    )
+    print("\n=== 메뉴 카드 이미지 크기 ===")
+    print(f"원본 JPEG: {len(photo) / 1024:.1f}KB")
+    for width, size in sorted(sizes.items(), key=lambda item: int(item[0])):
+        marker = " (image_url)" if stored["variants"][width] == stored["image_url"] else ""
+        print(f"{width}px WebP: {size / 1024:.1f}KB{marker}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="이미지 업로드 중 /menus 지연 시간 측정")
+    parser.add_argument("--uploads", type=int, default=8, help="동시에 보낼 업로드 수")
+    parser.add_argument("--duration", type=float, default=5.0, help="변형별 측정 시간 (초, 업로드가 끝날 때까지 연장)")
+    parser.add_argument("--interval-ms", type=float, default=10.0, help="/menus 호출 간격 (밀리초)")
+    parser.add_argument("--menus", type=int, default=100, help="생성할 메뉴 수")
+    parser.add_argument("--width", type=int, default=4000, help="업로드 사진 너비")
+    parser.add_argument("--height", type=int, default=3000, help="업로드 사진 높이")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,120 @@
+"""
+로그인 폭주 벤치마크
+
+GET /menus 를 일정 간격으로 계속 호출하는 동안 POST /auth/token 로그인을 한꺼번에 보내
+bcrypt 검증을 이벤트 루프에서 직접 실행하는 방식(before)과
+전용 스레드 풀(password_hasher)에서 실행하는 방식(after)의 /menus 지연 시간(p50/p99)을 비교합니다.
+로그인이 없을 때의 /menus 지연 시간(baseline)도 함께 측정합니다.
+
+실행 (backend 디렉토리에서):
+    python scripts/bench_login_burst.py --logins 40 --duration 5
+"""
+import argparse
+import asyncio
+import time
+from typing import List, Optional, Tuple
+
+from bench_utils import prepare_environment, print_report, probe_latency, summarize
+
+db_path = prepare_environment("bench_login_burst")
+
+import httpx
+from sqlalchemy import create_engine, insert
+
+from app.core.config import settings
+from app.core.security import hash_password, password_hasher, pwd_context
+from app.db.base import Base
+from app.main import app, lifespan
+from app.models import Category, Menu, User
+from app.services import user as user_service
+
+PASSWORD = "bench-password"
+
+class InlineHasher:
+    """before: 이벤트 루프에서 직접 bcrypt 검증 (전용 풀 도입 전 방식)"""
+
+    async def verify_and_update(self, password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+        return pwd_context.verify_and_update(password, hashed_password)
+
+def seed(menu_count: int):
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Category), [{"id": 1, "name": "커피", "display_order": 0}])
+        conn.execute(insert(Menu), [
+            {"name": f"메뉴{i}", "category_id": 1, "price": 3000 + i, "is_available": True}
+            for i in range(menu_count)
+        ])
+        conn.execute(insert(User), [{
+            "username": "staff", "email": "staff@cafe.com",
+            "hashed_password": hash_password(PASSWORD), "is_admin": True,
+        }])
+    engine.dispose()
+
+async def login_burst(client: httpx.AsyncClient, count: int) -> Tuple[List[float], int]:
+    """로그인 count 건을 동시에 요청: (성공 응답 시간 목록, 503 거절 수)"""
+    latencies: List[float] = []
+    rejected = 0
+
+    async def one_login():
+        nonlocal rejected
+        started = time.perf_counter()
+        response = await client.post("/api/v1/auth/token", json={"username": "staff", "password": PASSWORD})
+        if response.status_code == 503:
+            rejected += 1
+            return
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - started)
+
+    await asyncio.gather(*(one_login() for _ in range(count)))
+    return latencies, rejected
+
+async def run(client: httpx.AsyncClient, args, hasher) -> Tuple[dict, Optional[dict], int]:
+    stop = asyncio.Event()
+    started = time.perf_counter()
+    probe = asyncio.create_task(probe_latency(client, "/api/v1/menus", stop, args.interval_ms / 1000))
+    login_stats = None
+    rejected = 0
+    if hasher is not None:
+        user_service.password_hasher = hasher
+        await asyncio.sleep(args.duration / 5)  # 폭주 전 정상 구간
+        login_started = time.perf_counter()
+        latencies, rejected = await login_burst(client, args.logins)
+        login_stats = summarize(latencies, time.perf_counter() - login_started)
+    await asyncio.sleep(max(0.0, args.duration - (time.perf_counter() - started)))
+    stop.set()
+    menu_latencies = await probe
+    return summarize(menu_latencies, time.perf_counter() - started), login_stats, rejected
+
+async def main(args):
+    seed(args.menus)
+    password_hasher.max_queue = args.max_queue
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+            (await client.get("/api/v1/menus")).raise_for_status()  # 카탈로그 캐시 준비
+            baseline, _, _ = await run(client, args, None)
+            before, before_logins, before_rejected = await run(client, args, InlineHasher())
+            after, after_logins, after_rejected = await run(client, args, password_hasher)
+
+    print_report(
+        f"/menus 응답 시간 (로그인 {args.logins}건 동시 요청, bcrypt cost {settings.PASSWORD_BCRYPT_ROUNDS}, "
+        f"해싱 스레드 {password_hasher.workers}개, 대기열 {args.max_queue})",
+        {"baseline: 로그인 없음": baseline, "before: 루프에서 해싱": before, "after: 전용 풀": after},
+    )
+    print_report(
+        "로그인 응답 시간",
+        {"before: 루프에서 해싱": before_logins, "after: 전용 풀": after_logins},
+        unit="logins/s",
+    )
+    print(f"\n대기열 초과로 거절된 로그인 (503): before {before_rejected}건, after {after_rejected}건")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="로그인 폭주 중 /menus 지연 시간 측정")
+    parser.add_argument("--logins", type=int, default=40, help="동시에 보낼 로그인 수")
+    parser.add_argument("--duration", type=float, default=5.0, help="변형별 측정 시간 (초, 로그인이 끝날 때까지 연장)")
+    parser.add_argument("--interval-ms", type=float, default=10.0, help="/menus 호출 간격 (밀리초)")
+    parser.add_argument("--menus", type=int, default=100, help="생성할 메뉴 수")
+    parser.add_argument("--max-queue", type=int, default=settings.PASSWORD_HASH_MAX_QUEUE,
+                        help="해싱 대기열 한도")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,99 @@
+"""
+메뉴 목록 페이지네이션 벤치마크
+
+100,000개 메뉴의 합성 카탈로그를 GET /menus 로 끝까지 순회하며
+OFFSET(skip) 방식과 키셋(cursor) 방식의 총 소요 시간과
+앞쪽/뒤쪽 페이지의 응답 시간 차이를 비교합니다.
+
+실행 (backend 디렉토리에서):
+    python scripts/bench_menu_pagination.py --menus 100000 --page-size 100
+"""
+import argparse
+import asyncio
+import time
+from typing import List, Optional
+
+from bench_utils import prepare_environment
+
+db_path = prepare_environment("bench_menu_pagination")
+
+import httpx
+from sqlalchemy import create_engine, insert
+
+from app.core.cache import catalog_cache
+from app.db.base import Base, async_engine
+from app.main import app
+from app.models import Category, Menu
+
+def seed(menu_count: int, category_count: int = 50):
+    """카테고리 category_count개, 메뉴 menu_count개를 일괄 생성"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Category), [
+            {"id": i + 1, "name": f"카테고리{i}", "display_order": i}
+            for i in range(category_count)
+        ])
+        conn.execute(insert(Menu), [
+            {
+                "name": f"메뉴{i}",
+                "category_id": i % category_count + 1,
+                "price": 3000 + i % 5000,
+                "description": "페이지네이션 벤치마크용 메뉴",
+                "is_available": True,
+            }
+            for i in range(menu_count)
+        ])
+    engine.dispose()
+
+async def walk(client: httpx.AsyncClient, page_size: int, use_cursor: bool):
+    """카탈로그 끝까지 페이지를 순회하며 페이지별 응답 시간(초) 기록"""
+    catalog_cache.invalidate()
+    latencies: List[float] = []
+    total = 0
+    skip = 0
+    cursor: Optional[str] = None
+    while True:
+        params = {"limit": page_size}
+        if use_cursor and cursor:
+            params["cursor"] = cursor
+        elif not use_cursor:
+            params["skip"] = skip
+        started = time.perf_counter()
+        response = await client.get("/api/v1/menus", params=params)
+        latencies.append(time.perf_counter() - started)
+        response.raise_for_status()
+        page = response.json()
+        total += len(page)
+        skip += len(page)
+        cursor = response.headers.get("X-Next-Cursor")
+        if not page or (use_cursor and not cursor) or len(page) < page_size:
+            break
+    return total, latencies
+
+def describe(label: str, total: int, latencies: List[float]):
+    head = sum(latencies[:10]) / min(10, len(latencies)) * 1000
+    tail = sum(latencies[-10:]) / min(10, len(latencies)) * 1000
+    print(
+        f"{label:<12}{total:>10}{len(latencies):>8}{sum(latencies):>10.2f}"
+        f"{head:>14.2f}{tail:>14.2f}"
+    )
+
+async def main(args):
+    seed(args.menus)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        offset_total, offset_latencies = await walk(client, args.page_size, use_cursor=False)
+        cursor_total, cursor_latencies = await walk(client, args.page_size, use_cursor=True)
+    await async_engine.dispose()
+
+    print(f"\n=== GET /menus 전체 순회 (메뉴 {args.menus}개, 페이지 {args.page_size}건) ===")
+    print(f"{'방식':<12}{'메뉴':>10}{'페이지':>8}{'총(s)':>10}{'앞10p(ms)':>14}{'뒤10p(ms)':>14}")
+    describe("OFFSET", offset_total, offset_latencies)
+    describe("키셋 커서", cursor_total, cursor_latencies)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OFFSET/키셋 페이지네이션 비교")
+    parser.add_argument("--menus", type=int, default=100_000, help="합성 메뉴 수")
+    parser.add_argument("--page-size", type=int, default=100, help="페이지 크기")
+    asyncio.run(main(parser.parse_args()))
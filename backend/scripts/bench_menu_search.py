@@ -0,0 +1,124 @@
+"""
+메뉴 검색 벤치마크
+
+50,000개 메뉴의 합성 카탈로그에서 바이그램 역색인 검색과
+기존 대안인 LIKE '%검색어%' 스캔의 지연 시간을 비교합니다.
+색인 생성 시간, 색인 직접 검색, GET /menus/search 엔드포인트 지연을 함께 출력합니다.
+
+실행 (backend 디렉토리에서):
+    python scripts/bench_menu_search.py --menus 50000 --rounds 20
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from bench_utils import prepare_environment, print_report, summarize
+
+db_path = prepare_environment("bench_menu_search")
+
+import httpx
+from sqlalchemy import create_engine, insert, or_, select
+from sqlalchemy.orm import Session
+
+from app.db.base import Base, async_engine
+from app.main import app
+from app.models import Category, Menu
+from app.services.search import menu_search_index
+
+PREFIXES = ["아이스", "핫", "바닐라", "헤이즐넛", "카라멜", "시나몬", "흑당", "말차", "딸기", "제주"]
+BASES = ["라떼", "아메리카노", "모카", "콜드브루", "에이드", "스무디", "프라페", "케이크", "마카롱", "스콘"]
+SUFFIXES = ["", "라지", "디카페인", "오트", "시즌", "스페셜"]
+DESCRIPTIONS = ["부드러운 우유", "진한 에스프레소", "달콤한 시럽", "상큼한 과일", "고소한 견과류"]
+QUERIES = ["라떼", "바닐라라떼", "콜드브루", "딸기", "흑당 라떼", "오트", "에스프레소", "케이크", "말차 프라페"]
+
+def seed(menu_count: int):
+    """합성 메뉴 menu_count개 생성"""
+    rng = random.Random(42)
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Category), [
+            {"id": i + 1, "name": f"카테고리{i}", "display_order": i} for i in range(20)
+        ])
+        conn.execute(insert(Menu), [
+            {
+                "name": f"{rng.choice(PREFIXES)} {rng.choice(BASES)} {rng.choice(SUFFIXES)} {i}",
+                "category_id": rng.randint(1, 20),
+                "price": rng.randint(30, 90) * 100,
+                "description": f"{rng.choice(DESCRIPTIONS)}와 {rng.choice(DESCRIPTIONS)}",
+                "is_available": rng.random() > 0.1,
+            }
+            for i in range(menu_count)
+        ])
+    engine.dispose()
+
+def like_scan(rounds: int) -> List[float]:
+    """기존 대안: LIKE '%검색어%' 전체 스캔 (순위를 매기려면 일치하는 행을 모두 읽어야 함)"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    latencies = []
+    with Session(engine) as db:
+        for _ in range(rounds):
+            for query in QUERIES:
+                pattern = f"%{query}%"
+                started = time.perf_counter()
+                db.execute(
+                    select(Menu.id, Menu.name, Menu.description)
+                    .where(or_(Menu.name.like(pattern), Menu.description.like(pattern)))
+                ).all()
+                latencies.append(time.perf_counter() - started)
+    engine.dispose()
+    return latencies
+
+def index_search(rounds: int) -> List[float]:
+    latencies = []
+    for _ in range(rounds):
+        for query in QUERIES:
+            started = time.perf_counter()
+            menu_search_index.search(query, limit=20)
+            latencies.append(time.perf_counter() - started)
+    return latencies
+
+async def endpoint_search(rounds: int) -> List[float]:
+    latencies = []
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        # 첫 요청에서 색인/스냅샷 생성
+        await client.get("/api/v1/menus/search", params={"q": QUERIES[0]})
+        for _ in range(rounds):
+            for query in QUERIES:
+                started = time.perf_counter()
+                response = await client.get("/api/v1/menus/search", params={"q": query})
+                response.raise_for_status()
+                latencies.append(time.perf_counter() - started)
+    await async_engine.dispose()
+    return latencies
+
+def main(args):
+    seed(args.menus)
+
+    started = time.perf_counter()
+    engine = create_engine(f"sqlite:///{db_path}")
+    with Session(engine) as db:
+        menu_search_index.build(db.execute(select(Menu)).scalars().all())
+    engine.dispose()
+    print(f"색인 생성: 메뉴 {menu_search_index.size}개, {time.perf_counter() - started:.2f}s")
+
+    results = {}
+    for label, runner in (
+        ("LIKE 스캔", lambda: like_scan(args.rounds)),
+        ("바이그램 색인", lambda: index_search(args.rounds)),
+        ("GET /menus/search", lambda: asyncio.run(endpoint_search(args.rounds))),
+    ):
+        started = time.perf_counter()
+        latencies = runner()
+        results[label] = summarize(latencies, time.perf_counter() - started)
+
+    print_report(f"메뉴 검색 (메뉴 {args.menus}개, 검색어 {len(QUERIES)}종)", results, unit="q/s")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="바이그램 색인/LIKE 검색 지연 비교")
+    parser.add_argument("--menus", type=int, default=50_000, help="합성 메뉴 수")
+    parser.add_argument("--rounds", type=int, default=20, help="검색어 목록 반복 횟수")
+    main(parser.parse_args())
@@ -0,0 +1,139 @@
+"""
+주문 생성 벤치마크
+
+점심 피크처럼 수백 건의 주문이 동시에 들어올 때 POST /orders 의
+지연 시간(p50/p99)과 초당 처리 주문 수를 측정합니다.
+비교 기준(before)은 기존 메뉴 엔드포인트와 같은 방식으로 항목마다 메뉴를 조회하고
+flush 한 뒤 주문을 다시 읽어 오는 구현입니다.
+쿼리마다 BENCH_QUERY_LATENCY_MS(기본 2ms) 지연을 주어 원격 MySQL 왕복을 흉내내며,
+SQLite 특성상 쓰기 트랜잭션은 직렬화되므로 트랜잭션 안의 왕복 수 차이가 처리량에 그대로 드러납니다.
+
+실행 (backend 디렉토리에서):
+    python scripts/bench_order_create.py --orders 500 --concurrency 200
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import List
+
+from bench_utils import (
+    QUERY_LATENCY, create_slow_write_engine, prepare_environment, print_report, summarize
+)
+
+db_path = prepare_environment("bench_order_create")
+
+import httpx
+from fastapi import Depends
+from sqlalchemy import create_engine, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import selectinload
+
+from app.db.base import Base, get_async_db
+from app.main import app
+from app.models import Category, Menu, Order, OrderItem
+from app.schemas.order import OrderCreate, OrderCreateResponse
+
+slow_engine = create_slow_write_engine(db_path)
+SlowAsyncSessionLocal = async_sessionmaker(bind=slow_engine, expire_on_commit=False)
+
+def seed(menu_count: int):
+    """카테고리 5개, 메뉴 menu_count개 생성"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Category), [
+            {"id": i + 1, "name": f"카테고리{i}", "display_order": i} for i in range(5)
+        ])
+        conn.execute(insert(Menu), [
+            {"name": f"메뉴{i}", "category_id": i % 5 + 1, "price": 3000 + i * 100, "is_available": True}
+            for i in range(menu_count)
+        ])
+    engine.dispose()
+
+async def get_bench_async_db():
+    async with SlowAsyncSessionLocal() as db:
+        yield db
+
+app.dependency_overrides[get_async_db] = get_bench_async_db
+
+@app.post("/bench/naive/orders", response_model=OrderCreateResponse)
+async def naive_create_order(order: OrderCreate, db: AsyncSession = Depends(get_async_db)):
+    """비교 기준: 항목마다 메뉴 조회 + flush, 커밋 후 주문 재조회"""
+    db_order = Order(
+        customer_name=order.customer_name,
+        customer_phone=order.customer_phone,
+        notes=order.notes,
+        total_amount=0,
+    )
+    db.add(db_order)
+    await db.flush()
+    total = 0
+    for item in order.items:
+        menu = await db.get(Menu, item.menu_id)
+        subtotal = menu.price * item.quantity
+        db.add(OrderItem(
+            order_id=db_order.id, menu_id=item.menu_id, quantity=item.quantity,
+            price=menu.price, subtotal=subtotal, options=item.options,
+        ))
+        await db.flush()
+        total += subtotal
+    db_order.total_amount = total
+    await db.commit()
+    result = await db.execute(
+        select(Order).options(selectinload(Order.order_items)).where(Order.id == db_order.id)
+    )
+    return OrderCreateResponse(order=result.scalar_one())
+
+def make_orders(count: int, menu_count: int, max_items: int) -> List[dict]:
+    rng = random.Random(7)
+    return [
+        {
+            "customer_name": f"고객{i}",
+            "customer_phone": f"010{i:08d}",
+            "items": [
+                {"menu_id": rng.randint(1, menu_count), "quantity": rng.randint(1, 3)}
+                for _ in range(rng.randint(1, max_items))
+            ],
+        }
+        for i in range(count)
+    ]
+
+async def run_load(client: httpx.AsyncClient, path: str, orders: List[dict], concurrency: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one_order(body: dict):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post(path, json=body)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one_order(body) for body in orders))
+    return summarize(latencies, time.perf_counter() - started)
+
+async def main(args):
+    seed(args.menus)
+    orders = make_orders(args.orders, args.menus, args.max_items)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        before = await run_load(client, "/bench/naive/orders", orders, args.concurrency)
+        after = await run_load(client, "/api/v1/orders", orders, args.concurrency)
+    await slow_engine.dispose()
+
+    print_report(
+        f"주문 {args.orders}건 동시 생성 (동시성 {args.concurrency}, "
+        f"주문당 최대 {args.max_items}개 항목, 쿼리 지연 {QUERY_LATENCY * 1000:.0f}ms)",
+        {"before: 항목별 조회/flush": before, "after: IN 조회 + 1회 flush": after},
+        unit="orders/s",
+    )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="주문 생성 처리량/지연 측정")
+    parser.add_argument("--orders", type=int, default=500, help="변형별 주문 수")
+    parser.add_argument("--concurrency", type=int, default=200, help="동시 요청 수")
+    parser.add_argument("--menus", type=int, default=100, help="생성할 메뉴 수")
+    parser.add_argument("--max-items", type=int, default=4, help="주문당 최대 항목 수")
+    asyncio.run(main(parser.parse_args()))
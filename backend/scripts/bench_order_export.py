@@ -0,0 +1,171 @@
+"""
+회계 내보내기 벤치마크
+
+한 달치 합성 주문 항목(기본 5,000,000행)을 order_items 내보내기로 출력하며
+전체 행을 리스트로 읽어 한 번에 직렬화하는 방식(before)과
+서버 측 커서에서 EXPORT_CHUNK_SIZE 행씩 스트리밍해 gzip 파일로 쓰는 방식(after)의
+소요 시간, 초당 행 수, 최대 메모리(RSS)를 비교합니다.
+변형마다 별도 프로세스에서 실행해 최대 RSS 가 서로 섞이지 않게 합니다 (Linux 의 /proc 사용).
+
+실행 (backend 디렉토리에서):
+    python scripts/bench_order_export.py --items 5000000
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from bench_utils import prepare_environment
+
+db_path = prepare_environment("bench_order_export")
+if "--db" in sys.argv:
+    # 변형 측정용 자식 프로세스: 부모가 만든 DB 사용
+    db_path = Path(sys.argv[sys.argv.index("--db") + 1])
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+
+from sqlalchemy import create_engine, insert
+
+from app.core.config import settings
+from app.db.base import AsyncSessionLocal, Base, async_engine
+from app.models import Category, Menu, Order, OrderItem, OrderStatus
+from app.services.order_export import (
+    ExportDataset, ExportFormat, _DATASETS, _encode_csv, _enum_indexes, _text_indexes
+)
+from export_orders import write_export
+
+MONTH_START = date(2026, 9, 1)
+MONTH_END = date(2026, 9, 30)
+
+def seed(item_count: int, items_per_order: int, menu_count: int = 100, chunk: int = 100_000):
+    """MONTH_START 달에 고르게 분포한 주문과 주문 항목 생성"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    rng = random.Random(7)
+    order_count = item_count // items_per_order
+    month_seconds = (MONTH_END - MONTH_START).days * 86400 + 86399
+    started_at = datetime.combine(MONTH_START, datetime.min.time())
+    with engine.begin() as conn:
+        conn.execute(insert(Category), [{"id": 1, "name": "커피", "display_order": 0}])
+        conn.execute(insert(Menu), [
+            {"id": i + 1, "name": f"메뉴{i}", "category_id": 1, "price": 3000 + i * 100, "is_available": True}
+            for i in range(menu_count)
+        ])
+        for first in range(0, order_count, chunk):
+            ids = range(first + 1, min(first + chunk, order_count) + 1)
+            conn.execute(insert(Order), [
+                {
+                    "id": order_id,
+                    "total_amount": 0,
+                    "status": OrderStatus.COMPLETED,
+                    "customer_name": f"고객{order_id % 1000}",
+                    "customer_phone": f"010{order_id:08d}",
+                    "created_at": started_at + timedelta(seconds=order_id * month_seconds // order_count),
+                }
+                for order_id in ids
+            ])
+            conn.execute(insert(OrderItem), [
+                {
+                    "order_id": order_id,
+                    "menu_id": rng.randint(1, menu_count),
+                    "quantity": 2,
+                    "price": 4000,
+                    "subtotal": 8000,
+                    "options": "샷 추가" if order_id % 3 == 0 else None,
+                }
+                for order_id in ids
+                for _ in range(items_per_order)
+            ])
+    engine.dispose()
+    return order_count * items_per_order
+
+async def export_all_at_once(dataset: ExportDataset) -> int:
+    """before: 전체 행을 리스트로 읽고 본문 하나로 직렬화 (스트리밍 도입 전 방식)"""
+    spec = _DATASETS[dataset]
+    start = datetime.combine(MONTH_START, datetime.min.time())
+    end = datetime.combine(MONTH_END + timedelta(days=1), datetime.min.time())
+    rows = []
+    async with AsyncSessionLocal() as db:
+        for stmt in spec.statements(start, end):
+            rows.extend((await db.execute(stmt)).all())
+    first = spec.statements(start, end)[0]
+    body = _encode_csv(spec.columns, [spec.columns]) + _encode_csv(
+        spec.columns, rows, _enum_indexes(first), _text_indexes(first)
+    )
+    return len(body)
+
+def memory_mb(field: str) -> float:
+    """
+    /proc/self/status 의 메모리 값 (MB, VmRSS: 현재, VmHWM: 최대)
+
+    ru_maxrss 는 fork 시점 부모 프로세스의 최대값을 물려받으므로 사용하지 않음 (Linux 전용)
+    """
+    with open("/proc/self/status") as status:
+        for line in status:
+            if line.startswith(field + ":"):
+                return int(line.split()[1]) / 1024
+    raise RuntimeError(f"{field} 값을 찾을 수 없습니다")
+
+async def measure(variant: str, out_dir: Path) -> dict:
+    """자식 프로세스에서 한 변형을 실행하고 결과를 반환"""
+    baseline = memory_mb("VmRSS")
+    started = time.perf_counter()
+    if variant == "before":
+        size = await export_all_at_once(ExportDataset.ORDER_ITEMS)
+    else:
+        fmt = ExportFormat(variant.split("-", 1)[1])
+        size = await write_export(
+            out_dir / f"order_items.{fmt.value}.gz", ExportDataset.ORDER_ITEMS, fmt, MONTH_START, MONTH_END
+        )
+    elapsed = time.perf_counter() - started
+    await async_engine.dispose()
+    return {
+        "elapsed": elapsed,
+        "bytes": size,
+        "baseline_mb": baseline,
+        "peak_mb": memory_mb("VmHWM"),
+    }
+
+def run_variant(variant: str) -> dict:
+    result = subprocess.run(
+        [sys.executable, __file__, "--variant", variant, "--db", str(db_path)],
+        capture_output=True, text=True, check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def main(args):
+    started = time.perf_counter()
+    rows = seed(args.items, args.items_per_order)
+    print(f"주문 항목 {rows:,}행 생성 ({time.perf_counter() - started:.1f}초)")
+
+    variants = [("after: 스트리밍 CSV.gz", "after-csv"), ("after: 스트리밍 NDJSON.gz", "after-ndjson")]
+    if not args.skip_before:
+        variants.insert(0, ("before: 전체 로딩", "before"))
+
+    print(f"\n=== order_items {rows:,}행 내보내기 (청크 {settings.EXPORT_CHUNK_SIZE:,}행) ===")
+    print(f"{'구분':<26}{'초':>8}{'rows/s':>12}{'출력(MB)':>10}{'최대 RSS(MB)':>14}{'증가(MB)':>10}")
+    for label, variant in variants:
+        stats = run_variant(variant)
+        print(
+            f"{label:<26}{stats['elapsed']:>8.1f}{rows / stats['elapsed']:>12,.0f}"
+            f"{stats['bytes'] / 1024 / 1024:>10.1f}{stats['peak_mb']:>14.1f}"
+            f"{stats['peak_mb'] - stats['baseline_mb']:>10.1f}"
+        )
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="전체 로딩 vs 스트리밍 내보내기 메모리/처리량 측정")
+    parser.add_argument("--items", type=int, default=5_000_000, help="생성할 주문 항목 수")
+    parser.add_argument("--items-per-order", type=int, default=2, help="주문당 항목 수")
+    parser.add_argument("--skip-before", action="store_true", help="전체 로딩 방식 측정 생략 (메모리 부족 시)")
+    parser.add_argument("--variant", help=argparse.SUPPRESS)
+    parser.add_argument("--db", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.variant:
+        print(json.dumps(asyncio.run(measure(args.variant, db_path.parent))))
+    else:
+        main(args)
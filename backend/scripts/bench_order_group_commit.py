@@ -0,0 +1,135 @@
+"""
+주문 그룹 커밋 벤치마크
+
+주문 폭주 시 POST /orders 를 요청별 트랜잭션(기본)과 그룹 커밋(ORDER_GROUP_COMMIT_ENABLED)으로
+각각 처리해 초당 커밋 수, 초당 처리 주문 수, 지연 시간(p50/p99)을 비교합니다.
+커밋마다 BENCH_COMMIT_LATENCY_MS(기본 10ms) 지연을 주어 MySQL 의 fsync 대기를 흉내내고,
+쿼리마다 BENCH_QUERY_LATENCY_MS(기본 2ms) 지연을 줍니다.
+SQLite 특성상 쓰기 트랜잭션은 직렬화되므로 요청별 모드에서는 커밋 지연이 주문마다 누적됩니다.
+
+실행 (backend 디렉토리에서):
+    python scripts/bench_order_group_commit.py --orders 1000 --concurrency 200
+"""
+import argparse
+import asyncio
+import os
+import random
+import time
+from typing import List
+
+os.environ.setdefault("BENCH_COMMIT_LATENCY_MS", "10")
+
+from bench_utils import (
+    COMMIT_LATENCY, QUERY_LATENCY, create_slow_write_engine, prepare_environment, print_report, summarize
+)
+
+db_path = prepare_environment("bench_order_group_commit")
+
+import httpx
+from sqlalchemy import create_engine, event, insert
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from app.core.config import settings
+from app.db.base import Base, get_async_db
+from app.main import app
+from app.models import Category, Menu
+from app.services.order_batcher import order_group_committer
+
+slow_engine = create_slow_write_engine(db_path)
+SlowAsyncSessionLocal = async_sessionmaker(bind=slow_engine, expire_on_commit=False)
+
+commit_count = 0
+
+@event.listens_for(slow_engine.sync_engine, "commit")
+def _count_commit(conn):
+    global commit_count
+    commit_count += 1
+
+def seed(menu_count: int):
+    """카테고리 5개, 메뉴 menu_count개 생성"""
+    engine = create_engine(f"sqlite:///{db_path}")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(Category), [
+            {"id": i + 1, "name": f"카테고리{i}", "display_order": i} for i in range(5)
+        ])
+        conn.execute(insert(Menu), [
+            {"name": f"메뉴{i}", "category_id": i % 5 + 1, "price": 3000 + i * 100, "is_available": True}
+            for i in range(menu_count)
+        ])
+    engine.dispose()
+
+async def get_bench_async_db():
+    async with SlowAsyncSessionLocal() as db:
+        yield db
+
+app.dependency_overrides[get_async_db] = get_bench_async_db
+order_group_committer.session_factory = SlowAsyncSessionLocal
+
+def make_orders(count: int, menu_count: int, max_items: int) -> List[dict]:
+    rng = random.Random(7)
+    return [
+        {
+            "customer_name": f"고객{i}",
+            "customer_phone": f"010{i:08d}",
+            "items": [
+                {"menu_id": rng.randint(1, menu_count), "quantity": rng.randint(1, 3)}
+                for _ in range(rng.randint(1, max_items))
+            ],
+        }
+        for i in range(count)
+    ]
+
+async def run_load(client: httpx.AsyncClient, orders: List[dict], concurrency: int, group_commit: bool):
+    global commit_count
+    settings.ORDER_GROUP_COMMIT_ENABLED = group_commit
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies: List[float] = []
+
+    async def one_order(body: dict):
+        async with semaphore:
+            started = time.perf_counter()
+            response = await client.post("/api/v1/orders", json=body)
+            response.raise_for_status()
+            latencies.append(time.perf_counter() - started)
+
+    commit_count = 0
+    started = time.perf_counter()
+    await asyncio.gather(*(one_order(body) for body in orders))
+    elapsed = time.perf_counter() - started
+    return summarize(latencies, elapsed), commit_count, elapsed
+
+async def main(args):
+    seed(args.menus)
+    orders = make_orders(args.orders, args.menus, args.max_items)
+    order_group_committer.window = args.window_ms / 1000
+    order_group_committer.max_batch = args.max_batch
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench", timeout=None) as client:
+        before, before_commits, before_elapsed = await run_load(client, orders, args.concurrency, False)
+        after, after_commits, after_elapsed = await run_load(client, orders, args.concurrency, True)
+    await slow_engine.dispose()
+
+    print_report(
+        f"주문 {args.orders}건 동시 생성 (동시성 {args.concurrency}, 쿼리 지연 {QUERY_LATENCY * 1000:.0f}ms, "
+        f"커밋 지연 {COMMIT_LATENCY * 1000:.0f}ms, 배치 창 {args.window_ms:g}ms)",
+        {"before: 요청별 커밋": before, "after: 그룹 커밋": after},
+        unit="orders/s",
+    )
+    print(f"\n{'구분':<24}{'커밋 수':>10}{'commits/s':>12}{'주문/커밋':>10}")
+    for label, commits, elapsed in (
+        ("before: 요청별 커밋", before_commits, before_elapsed),
+        ("after: 그룹 커밋", after_commits, after_elapsed),
+    ):
+        print(f"{label:<24}{commits:>10}{commits / elapsed:>12.1f}{args.orders / max(commits, 1):>10.1f}")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="요청별 커밋 vs 그룹 커밋 주문 처리량 측정")
+    parser.add_argument("--orders", type=int, default=1000, help="변형별 주문 수")
+    parser.add_argument("--concurrency", type=int, default=200, help="동시 요청 수")
+    parser.add_argument("--menus", type=int, default=100, help="생성할 메뉴 수")
+    parser.add_argument("--max-items", type=int, default=4, help="주문당 최대 항목 수")
+    parser.add_argument("--window-ms", type=float, default=settings.ORDER_GROUP_COMMIT_WINDOW_MS, help="배치 창 (밀리초)")
+    parser.add_argument("--max-batch", type=int, default=settings.ORDER_GROUP_COMMIT_MAX_BATCH, help="배치당 최대 주문 수")
+    asyncio.run(main(parser.parse_args()))
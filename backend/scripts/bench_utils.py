@@ -0,0 +1,140 @@
+"""
+벤치마크/점검 스크립트 공통 유틸리티
+
+- 임시 SQLite 데이터베이스로 앱을 구동하기 위한 환경 변수 설정
+- DB 왕복 지연(네트워크 RTT)과 커밋 지연(fsync) 시뮬레이션용 sqlite3 커넥션 팩토리
+- 동시 쓰기 벤치마크용 비동기 엔진 (BEGIN IMMEDIATE 로 쓰기 트랜잭션 직렬화)
+- 부하 중 다른 요청의 지연 시간 측정 (예정 시각 기준 주기 호출)
+- 지연 시간 통계 출력
+
+사용 예:
+    from bench_utils import prepare_environment
+    db_path = prepare_environment("bench_async_db")
+    from app.main import app  # 환경 설정 이후에 import
+"""
+import asyncio
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+# 쿼리당 주입할 지연 시간 (초)
+QUERY_LATENCY = float(os.environ.get("BENCH_QUERY_LATENCY_MS", "2")) / 1000
+# 커밋당 주입할 지연 시간 (초, 디스크 fsync 시뮬레이션)
+COMMIT_LATENCY = float(os.environ.get("BENCH_COMMIT_LATENCY_MS", "0")) / 1000
+
+def prepare_environment(name: str) -> Path:
+    """벤치마크용 임시 SQLite DB 경로를 만들고 앱 설정용 환경 변수를 지정"""
+    db_path = Path(tempfile.mkdtemp(prefix=f"{name}_")) / "bench.db"
+    os.environ["DATABASE_URL"] = f"sqlite:///{db_path}"
+    os.environ.setdefault("MYSQL_HOST", "localhost")
+    os.environ.setdefault("MYSQL_USER", "bench")
+    os.environ.setdefault("MYSQL_PASSWORD", "bench")
+    os.environ.setdefault("MYSQL_DATABASE", "bench")
+    os.environ["ENVIRONMENT"] = "test"
+    os.environ["DEBUG"] = "False"
+    os.environ["LOG_LEVEL"] = "WARNING"
+    os.environ["RATE_LIMIT_ENABLED"] = "False"  # 한 클라이언트에서 대량으로 요청하므로 요청 제한 끔
+    return db_path
+
+class SlowCursor(sqlite3.Cursor):
+    """execute 마다 고정 지연을 주는 커서 (원격 MySQL 왕복 시뮬레이션)"""
+
+    def execute(self, *args, **kwargs):
+        time.sleep(QUERY_LATENCY)
+        return super().execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        time.sleep(QUERY_LATENCY)
+        return super().executemany(*args, **kwargs)
+
+class SlowConnection(sqlite3.Connection):
+    """SlowCursor를 생성하는 커넥션 (connect_args={"factory": SlowConnection})"""
+
+    def cursor(self, factory=SlowCursor):
+        return super().cursor(factory)
+
+    def commit(self):
+        if COMMIT_LATENCY:
+            time.sleep(COMMIT_LATENCY)
+        return super().commit()
+
+def create_slow_write_engine(db_path: Path, pool_size: int = 100) -> AsyncEngine:
+    """
+    쿼리 지연을 주입한 aiosqlite 엔진 (동시 쓰기용)
+
+    SQLite 는 동시에 여러 트랜잭션이 쓰기 잠금으로 승격하려 하면 즉시
+    "database is locked" 오류를 내므로, 트랜잭션 시작 시 BEGIN IMMEDIATE 로
+    쓰기 잠금을 먼저 잡고 나머지는 대기하게 함 (MySQL 행 잠금 대기와 유사)
+    """
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}",
+        connect_args={"factory": SlowConnection, "timeout": 120},
+        pool_size=pool_size,
+        max_overflow=pool_size,
+    )
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _disable_implicit_begin(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin_immediate(conn):
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+
+    return engine
+
+async def probe_latency(client, path: str, stop: asyncio.Event, interval: float) -> List[float]:
+    """
+    stop 까지 interval 간격으로 GET path 호출하며 응답 시간(초) 기록
+
+    응답 시간은 예정된 호출 시각부터 측정 (이벤트 루프가 멈춰 호출 자체가 늦어진 시간도 포함)
+    """
+    latencies = []
+    scheduled = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        response = await client.get(path)
+        response.raise_for_status()
+        latencies.append(time.perf_counter() - scheduled)
+        scheduled += interval
+    return latencies
+
+def summarize(latencies: List[float], elapsed: float) -> Dict[str, float]:
+    """지연 시간 목록(초)을 요약 통계로 변환"""
+    ordered = sorted(latencies)
+
+    def percentile(p: float) -> float:
+        if not ordered:
+            return 0.0
+        index = min(len(ordered) - 1, int(round(p / 100 * (len(ordered) - 1))))
+        return ordered[index] * 1000
+
+    return {
+        "count": len(ordered),
+        "throughput": len(ordered) / elapsed if elapsed else 0.0,
+        "p50_ms": percentile(50),
+        "p99_ms": percentile(99),
+        "mean_ms": statistics.fmean(ordered) * 1000 if ordered else 0.0,
+    }
+
+def print_report(title: str, results: Dict[str, Dict[str, float]], unit: str = "req/s"):
+    """벤치마크 결과 표 출력"""
+    print(f"\n=== {title} ===")
+    print(f"{'구분':<24}{'건수':>8}{unit:>12}{'p50(ms)':>10}{'p99(ms)':>10}")
+    for label, stats in results.items():
+        print(
+            f"{label:<24}{stats['count']:>8}{stats['throughput']:>12.1f}"
+            f"{stats['p50_ms']:>10.2f}{stats['p99_ms']:>10.2f}"
+        )
@@ -0,0 +1,200 @@
+"""
+엔드포인트별 쿼리 수 점검
+
+임시 SQLite DB에 카테고리 5개, 메뉴 100개를 만든 뒤 각 엔드포인트가
+실행하는 SQL 문 수가 기대값과 정확히 일치하는지 확인합니다.
+메뉴 목록 100건 조회가 1개의 쿼리로 끝나야 하며(N+1 금지),
+스냅샷 모드에서는 버전당 한 번의 재구성(2개) 외에는 조회 시 쿼리가 없어야 합니다.
+메뉴/주문 변경 요청은 관리자 토큰으로 보내며 권한은 캐시에서 확인합니다(추가 쿼리 없음).
+요청 한도를 넘은 주문은 DB 세션을 열기 전에 429로 거절되어야 합니다(쿼리 0개).
+일괄 등록으로 기존 메뉴를 수정할 때 파일에 없는 열은 기존 값이 유지되어야 합니다.
+하나라도 어긋나면 실행된 SQL 목록을 출력하고 종료 코드 1로 끝납니다.
+
+실행 (backend 디렉토리에서):
+    python scripts/check_query_counts.py
+"""
+import asyncio
+import sys
+from datetime import datetime, timedelta
+
+from bench_utils import prepare_environment
+
+prepare_environment("check_query_counts")
+
+import httpx
+
+from app.core.cache import catalog_cache
+from app.core.config import settings
+from app.core.rate_limit import rate_limiters
+from app.core.security import create_access_token, principal_cache
+from app.db.base import AsyncSessionLocal, async_engine
+from app.db.query_counter import assert_query_count
+from app.main import app, lifespan
+from app.models import User
+
+# 예약 가능한 픽업 시간 (준비 시간 이후 다음 시간대)
+PICKUP_TIME = (
+    datetime.now() + timedelta(minutes=settings.PICKUP_SLOT_LEAD_MINUTES + settings.PICKUP_SLOT_MINUTES)
+).isoformat()
+PICKUP_ORDER = {
+    "customer_name": "홍길동", "customer_phone": "01012345678", "pickup_time": PICKUP_TIME,
+    "items": [{"menu_id": 1, "quantity": 1}],
+}
+
+# (설명, 스냅샷 사용, HTTP 메서드, 경로, 요청 본문, 기대 쿼리 수, 카탈로그 캐시 비우기 여부)
+CHECKS = [
+    ("카테고리 목록", False, "GET", "/api/v1/categories", None, 1, True),
+    ("카테고리 목록 (캐시)", False, "GET", "/api/v1/categories", None, 0, False),
+    ("메뉴 목록 100건", False, "GET", "/api/v1/menus?limit=100", None, 1, True),
+    ("메뉴 목록 (카테고리 필터)", False, "GET", "/api/v1/menus?category_id=1", None, 1, True),
+    ("메뉴 목록 (캐시)", False, "GET", "/api/v1/menus?category_id=1", None, 0, False),
+    ("메뉴 상세", False, "GET", "/api/v1/menus/1", None, 1, True),
+    ("메뉴 생성", False, "POST", "/api/v1/menus",
+     {"name": "신메뉴", "category_id": 1, "price": 5000}, 4, True),
+    ("메뉴 수정", False, "PUT", "/api/v1/menus/1", {"price": 5500}, 3, True),
+    ("메뉴 수정 (카테고리 변경)", False, "PUT", "/api/v1/menus/1", {"category_id": 2}, 4, True),
+    # 저장된 이미지 URL 로 변경: 참조 수 증감 UPDATE 1회 추가
+    ("메뉴 수정 (이미지 URL 변경)", False, "PUT", "/api/v1/menus/1",
+     {"image_url": f"{settings.UPLOAD_URL_PREFIX}/images/{'0' * 64}/400.webp"}, 4, True),
+    ("메뉴 삭제", False, "DELETE", "/api/v1/menus/2", None, 2, True),
+    ("판매 여부 일괄 변경 (카테고리)", False, "PATCH", "/api/v1/menus/availability",
+     {"category_id": 3, "is_available": False}, 1, True),
+    ("가격 일괄 변경 (비율)", False, "PATCH", "/api/v1/menus/price",
+     {"category_id": 3, "percent": 10}, 1, True),
+    ("가격 일괄 변경 (금액 인하)", False, "PATCH", "/api/v1/menus/price",
+     {"menu_ids": [3, 4, 5], "amount": -100}, 2, True),
+    ("카테고리 순서 변경", False, "PUT", "/api/v1/categories/order",
+     {"category_ids": [5, 4, 3, 2, 1]}, 1, True),
+    # 가격 IN 조회 1 + 주문 INSERT 1 + 항목 INSERT (RETURNING 미지원 DB 에서는 항목 수만큼)
+    ("주문 생성 (2개 항목)", False, "POST", "/api/v1/orders",
+     {"customer_name": "홍길동", "customer_phone": "01012345678",
+      "items": [{"menu_id": 1, "quantity": 2}, {"menu_id": 5, "quantity": 1}]}, 4, True),
+    ("픽업 시간대 목록", False, "GET", "/api/v1/pickup-slots", None, 1, True),
+    ("픽업 시간대 목록 (메모리)", False, "GET", "/api/v1/pickup-slots", None, 0, False),
+    # 시간대 첫 예약: 조건부 UPDATE(0건) + SAVEPOINT/INSERT/RELEASE 로 시간대 행 생성
+    ("주문 생성 (픽업 시간대 첫 예약)", False, "POST", "/api/v1/orders", PICKUP_ORDER, 7, True),
+    # 이후 예약: 조건부 UPDATE 1회만 추가 (orders COUNT 없음)
+    ("주문 생성 (픽업 시간대 예약)", False, "POST", "/api/v1/orders", PICKUP_ORDER, 4, True),
+    ("픽업 시간대 목록 (예약 후)", False, "GET", "/api/v1/pickup-slots", None, 0, False),
+    # 상태 변경: 주문+항목 JOIN 조회 1 + 조건부 UPDATE 1
+    # 주문 완료: 주문+항목 조회 2 + 메뉴 카테고리 조회 1 + 집계 UPSERT 2 + 상태 UPDATE 1
+    ("주문 상태 변경 (조건부 UPDATE)", False, "PATCH", "/api/v1/orders/1/status", {"status": "preparing", "expected_version": 1}, 2, True),
+    ("주문 상태 변경 (준비 완료)", False, "PATCH", "/api/v1/orders/1/status", {"status": "ready"}, 2, True),
+    ("주문 완료 (판매 집계 반영)", False, "PATCH", "/api/v1/orders/1/status", {"status": "completed"}, 6, True),
+    ("일별 판매 통계", False, "GET", "/api/v1/admin/stats/daily", None, 1, True),
+    ("시간별 판매 통계", False, "GET", "/api/v1/admin/stats/hourly", None, 1, True),
+    ("메뉴별 판매 통계", False, "GET", "/api/v1/admin/stats/menus", None, 1, True),
+    ("카테고리별 판매 통계", False, "GET", "/api/v1/admin/stats/categories", None, 1, True),
+    ("스냅샷 재구성", True, "GET", "/api/v1/menus?limit=100", None, 2, True),
+    ("스냅샷 메뉴 목록", True, "GET", "/api/v1/menus?category_id=1", None, 0, False),
+    ("스냅샷 메뉴 상세", True, "GET", "/api/v1/menus/1", None, 0, False),
+    ("스냅샷 카테고리 목록", True, "GET", "/api/v1/categories", None, 0, False),
+    ("스냅샷 메뉴 수정 (재구성 포함)", True, "PUT", "/api/v1/menus/1", {"price": 6000}, 5, False),
+    ("스냅샷 메뉴 목록 (수정 후)", True, "GET", "/api/v1/menus", None, 0, False),
+    ("스냅샷 판매 여부 일괄 변경 (재구성 포함)", True, "PATCH", "/api/v1/menus/availability",
+     {"menu_ids": [6, 7, 8], "is_available": False}, 3, False),
+]
+
+async def seed(client: httpx.AsyncClient):
+    async with AsyncSessionLocal() as db:
+        admin = User(username="admin", email="admin@cafe.com", hashed_password="", is_admin=True)
+        db.add(admin)
+        await db.commit()
+    client.headers["Authorization"] = f"Bearer {create_access_token(admin.id)}"
+    for i in range(5):
+        response = await client.post(
+            "/api/v1/categories", json={"name": f"카테고리{i}", "display_order": i}
+        )
+        response.raise_for_status()
+    for i in range(100):
+        response = await client.post(
+            "/api/v1/menus",
+            json={"name": f"메뉴{i}", "category_id": i % 5 + 1, "price": 3000 + i},
+        )
+        response.raise_for_status()
+
+async def main() -> int:
+    failures = 0
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://check") as client:
+            await seed(client)
+            for label, snapshot, method, path, body, expected, clear_cache in CHECKS:
+                settings.CATALOG_SNAPSHOT_ENABLED = snapshot
+                if clear_cache:
+                    catalog_cache.invalidate()
+                try:
+                    with assert_query_count(async_engine, expected) as counter:
+                        response = await client.request(method, path, json=body)
+                        response.raise_for_status()
+                    print(f"✅ {label}: {counter.count}개")
+                except AssertionError as e:
+                    failures += 1
+                    print(f"❌ {label}: {e}")
+            failures += await check_admin_auth(client)
+            failures += await check_rate_limited(client)
+            failures += await check_import_keeps_columns(client)
+    return 1 if failures else 0
+
+async def check_admin_auth(client: httpx.AsyncClient) -> int:
+    """권한 캐시를 비운 뒤 관리자 요청: 토큰 검증 후 사용자 권한 조회 1회 추가 (이후 요청은 캐시 사용)"""
+    label = "관리자 인증 (권한 조회)"
+    principal_cache.clear()
+    try:
+        with assert_query_count(async_engine, 2) as counter:
+            response = await client.get("/api/v1/admin/stats/daily")
+            response.raise_for_status()
+        print(f"✅ {label}: {counter.count}개")
+        return 0
+    except AssertionError as e:
+        print(f"❌ {label}: {e}")
+        return 1
+
+async def check_rate_limited(client: httpx.AsyncClient) -> int:
+    """전화번호별 버킷을 비운 뒤 주문: 세션을 열기 전에 429 (쿼리 0개)"""
+    label = "주문 생성 (요청 제한 초과)"
+    settings.RATE_LIMIT_ENABLED = True
+    limiter = rate_limiters["order_phone"]
+    try:
+        while not limiter.acquire(PICKUP_ORDER["customer_phone"]):
+            pass
+        with assert_query_count(async_engine, 0) as counter:
+            response = await client.post("/api/v1/orders", json=PICKUP_ORDER)
+        assert response.status_code == 429, f"상태 코드 {response.status_code} (429 기대)"
+        print(f"✅ {label}: {counter.count}개")
+        return 0
+    except AssertionError as e:
+        print(f"❌ {label}: {e}")
+        return 1
+    finally:
+        settings.RATE_LIMIT_ENABLED = False
+        limiter.clear()
+
+async def check_import_keeps_columns(client: httpx.AsyncClient) -> int:
+    """설명/판매 여부/이미지가 있는 메뉴를 name,category_id,price 만 있는 CSV 로 다시 등록: 가격만 변경"""
+    label = "메뉴 일괄 등록 (빠진 열 유지)"
+    settings.CATALOG_SNAPSHOT_ENABLED = False
+    image_url = f"{settings.UPLOAD_URL_PREFIX}/images/{'1' * 64}/400.webp"
+    try:
+        menu = (await client.get("/api/v1/menus/10")).json()
+        kept = {"description": "우유", "is_available": False, "image_url": image_url}
+        (await client.put("/api/v1/menus/10", json=kept)).raise_for_status()
+        csv_body = f"name,category_id,price\n{menu['name']},{menu['category_id']},4500\n"
+        response = await client.post(
+            "/api/v1/menus/import", files={"file": ("menus.csv", csv_body.encode(), "text/csv")}
+        )
+        response.raise_for_status()
+        assert response.json()["updated"] == 1, f"결과 {response.json()}"
+        catalog_cache.invalidate()
+        menu = (await client.get("/api/v1/menus/10")).json()
+        changed = {key: menu[key] for key in kept if menu[key] != kept[key]}
+        assert menu["price"] == 4500, f"가격 {menu['price']} (4500 기대)"
+        assert not changed, f"기존 값이 바뀐 열 {changed}"
+        print(f"✅ {label}")
+        return 0
+    except AssertionError as e:
+        print(f"❌ {label}: {e}")
+        return 1
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
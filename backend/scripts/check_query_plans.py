@@ -0,0 +1,211 @@
+"""
+엔드포인트별 실행 계획(EXPLAIN) 점검
+
+임시 DB에 카테고리 20개, 메뉴 5,000개를 만든 뒤 각 엔드포인트가 실행하는
+SELECT/UPDATE/DELETE 문을 기록하고, 같은 파라미터로 실행 계획을 조회해
+인덱스 없이 테이블 전체를 읽거나(full scan) 정렬용 임시 테이블을 쓰는 경우를 검출합니다.
+전체 카탈로그를 읽는 것이 목적인 조회(색인 생성, 일괄 등록 사전 조회 등)는 예외로 표시합니다.
+하나라도 어긋나면 실행 계획을 출력하고 종료 코드 1로 끝납니다.
+
+- SQLite: EXPLAIN QUERY PLAN 의 "SCAN <table>"(인덱스 미사용), "USE TEMP B-TREE"
+- MySQL: EXPLAIN 의 type=ALL, Extra 의 "Using filesort"
+
+실행 (backend 디렉토리에서):
+    python scripts/check_query_plans.py
+    python scripts/check_query_plans.py --database-url mysql+pymysql://user:pw@host/plan_check
+    (--database-url 은 비어 있는 점검 전용 DB를 지정 - 테이블을 다시 만듭니다)
+"""
+import argparse
+import asyncio
+import os
+import sys
+from datetime import date, datetime, timedelta
+from typing import Any, List, Tuple
+
+from bench_utils import prepare_environment
+
+parser = argparse.ArgumentParser(description="엔드포인트 쿼리 실행 계획 점검")
+parser.add_argument("--database-url", help="점검할 DB (기본: 임시 SQLite)")
+args = parser.parse_args()
+
+prepare_environment("check_query_plans")
+if args.database_url:
+    os.environ["DATABASE_URL"] = args.database_url
+
+import httpx
+from sqlalchemy import insert
+
+from app.core.cache import catalog_cache
+from app.core.config import settings
+from app.core.security import create_access_token
+from app.db.base import Base, async_engine
+from app.db.query_counter import count_queries
+from app.main import app, lifespan
+from app.models import Category, Menu, SalesDaily, SalesHourly, User
+
+CATEGORY_COUNT = 20
+MENU_COUNT = 5000
+# 판매 집계: 1년치 일별 행, 최근 3일 시간별 행 (메뉴 SALES_MENU_COUNT개)
+SALES_DAYS = 365
+SALES_MENU_COUNT = 50
+ADMIN_ID = 1
+
+# (설명, HTTP 메서드, 경로, 요청 본문, 전체 스캔 허용 여부)
+# 경로의 {cursor} 는 첫 페이지 응답의 X-Next-Cursor 값으로 치환
+CHECKS = [
+    ("카테고리 목록", "GET", "/api/v1/categories", None, True),  # 작은 테이블 전체 조회
+    ("메뉴 목록 (기본)", "GET", "/api/v1/menus", None, False),
+    ("메뉴 목록 (다음 페이지)", "GET", "/api/v1/menus?cursor={cursor}", None, False),
+    ("메뉴 목록 (skip)", "GET", "/api/v1/menus?skip=100", None, False),
+    ("메뉴 목록 (품절 포함)", "GET", "/api/v1/menus?available_only=false", None, False),
+    ("메뉴 목록 (품절 포함, 다음 페이지)", "GET",
+     "/api/v1/menus?available_only=false&cursor={cursor}", None, False),
+    ("메뉴 목록 (카테고리)", "GET", "/api/v1/menus?category_id=3", None, False),
+    ("메뉴 목록 (카테고리, 품절 포함)", "GET",
+     "/api/v1/menus?category_id=3&available_only=false", None, False),
+    ("메뉴 상세", "GET", "/api/v1/menus/10", None, False),
+    ("검색 색인 생성", "GET", "/api/v1/menus/search?q=메뉴", None, True),
+    ("메뉴 검색", "GET", "/api/v1/menus/search?q=메뉴1", None, False),
+    ("메뉴 생성", "POST", "/api/v1/menus", {"name": "신메뉴", "category_id": 1, "price": 5000}, False),
+    ("메뉴 수정", "PUT", "/api/v1/menus/10", {"price": 5500, "category_id": 2}, False),
+    ("메뉴 삭제", "DELETE", "/api/v1/menus/11", None, False),
+    ("판매 여부 일괄 변경 (ID)", "PATCH", "/api/v1/menus/availability",
+     {"menu_ids": [1, 2, 3], "is_available": False}, False),
+    ("판매 여부 일괄 변경 (카테고리)", "PATCH", "/api/v1/menus/availability",
+     {"category_id": 4, "is_available": False}, False),
+    ("가격 일괄 변경", "PATCH", "/api/v1/menus/price", {"category_id": 5, "amount": -100}, False),
+    ("카테고리 순서 변경 (일부)", "PUT", "/api/v1/categories/order", {"category_ids": [3, 1, 2]}, False),
+    # 전체 카테고리를 나열하면 모든 행이 대상이므로 스캔이 정상
+    ("카테고리 순서 변경 (전체)", "PUT", "/api/v1/categories/order",
+     {"category_ids": list(range(CATEGORY_COUNT, 0, -1))}, True),
+    ("일별 판매 통계", "GET", "/api/v1/admin/stats/daily", None, False),
+    ("시간별 판매 통계", "GET", "/api/v1/admin/stats/hourly", None, False),
+    # 집계 테이블은 기간 범위로만 읽고, 메뉴/카테고리별로 묶은 결과(파생 테이블)를 정렬하므로 정상
+    ("메뉴별 판매 통계", "GET", "/api/v1/admin/stats/menus", None, True),
+    ("카테고리별 판매 통계", "GET", "/api/v1/admin/stats/categories", None, True),
+    ("주문 내보내기", "GET", "/api/v1/admin/exports/orders", None, False),
+    ("주문 항목 내보내기", "GET", "/api/v1/admin/exports/order_items?format=ndjson", None, False),
+    ("일별 판매 내보내기", "GET", "/api/v1/admin/exports/sales_daily", None, False),
+]
+
+async def seed():
+    async with async_engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Category), [
+            {"id": i + 1, "name": f"카테고리{i}", "display_order": i} for i in range(CATEGORY_COUNT)
+        ])
+        await conn.execute(insert(User), [
+            {"id": ADMIN_ID, "username": "admin", "email": "admin@cafe.com", "hashed_password": "", "is_admin": True}
+        ])
+        await conn.execute(insert(Menu), [
+            {
+                "name": f"메뉴{i}",
+                "category_id": i % CATEGORY_COUNT + 1,
+                "price": 3000 + i,
+                "is_available": i % 10 != 0,
+            }
+            for i in range(MENU_COUNT)
+        ])
+        today = date.today()
+        await conn.execute(insert(SalesDaily), [
+            {
+                "bucket_date": today - timedelta(days=day), "menu_id": menu_id,
+                "category_id": menu_id % CATEGORY_COUNT + 1, "quantity": 3, "revenue": 9000, "order_count": 2,
+            }
+            for day in range(SALES_DAYS)
+            for menu_id in range(1, SALES_MENU_COUNT + 1)
+        ])
+        midnight = datetime.combine(today, datetime.min.time())
+        await conn.execute(insert(SalesHourly), [
+            {
+                "bucket_start": midnight - timedelta(hours=hour), "menu_id": menu_id,
+                "category_id": menu_id % CATEGORY_COUNT + 1, "quantity": 1, "revenue": 3000, "order_count": 1,
+            }
+            for hour in range(-12, 72)
+            for menu_id in range(1, SALES_MENU_COUNT + 1)
+        ])
+        # 통계 정보 갱신 (작은 테이블로 오인해 전체 스캔을 고르지 않도록)
+        if settings.is_sqlite:
+            await conn.exec_driver_sql("ANALYZE")
+        else:
+            await conn.exec_driver_sql("ANALYZE TABLE categories, menus, sales_daily, sales_hourly")
+
+async def explain(statement: str, parameters: Any) -> Tuple[List[str], List[str]]:
+    """실행 계획 조회: (계획 설명 줄 목록, 문제 목록)"""
+    plan: List[str] = []
+    problems: List[str] = []
+    async with async_engine.connect() as conn:
+        if settings.is_sqlite:
+            result = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+            for row in result:
+                detail = row[-1]
+                plan.append(detail)
+                if detail.startswith("SCAN ") and " USING " not in detail:
+                    problems.append(f"전체 스캔: {detail}")
+                if "USE TEMP B-TREE" in detail:
+                    problems.append(f"임시 정렬: {detail}")
+        else:
+            result = await conn.exec_driver_sql(f"EXPLAIN {statement}", parameters)
+            for row in result.mappings():
+                plan.append(
+                    f"table={row['table']} type={row['type']} key={row['key']} extra={row['Extra']}"
+                )
+                if row["type"] == "ALL":
+                    problems.append(f"전체 스캔: {row['table']}")
+                if "filesort" in (row["Extra"] or ""):
+                    problems.append(f"임시 정렬: {row['table']}")
+    return plan, problems
+
+async def main() -> int:
+    failures = 0
+    await seed()
+    settings.CATALOG_SNAPSHOT_ENABLED = False
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://check",
+            headers={"Authorization": f"Bearer {create_access_token(ADMIN_ID)}"},
+        ) as client:
+            cursors = {}
+            for available_only in ("true", "false"):
+                response = await client.get(f"/api/v1/menus?available_only={available_only}")
+                cursors[available_only] = response.headers["X-Next-Cursor"]
+
+            for label, method, path, body, allow_full_scan in CHECKS:
+                if "{cursor}" in path:
+                    key = "false" if "available_only=false" in path else "true"
+                    path = path.replace("{cursor}", cursors[key])
+                catalog_cache.invalidate()
+                with count_queries(async_engine) as counter:
+                    response = await client.request(method, path, json=body)
+                    response.raise_for_status()
+
+                report = []
+                check_failed = False
+                for statement, parameters in counter.executions:
+                    if not statement.lstrip().upper().startswith(("SELECT", "UPDATE", "DELETE")):
+                        continue
+                    plan, problems = await explain(statement, parameters)
+                    if problems and not allow_full_scan:
+                        check_failed = True
+                    report.append((statement, plan, problems))
+
+                if check_failed:
+                    failures += 1
+                    print(f"❌ {label}")
+                    for statement, plan, problems in report:
+                        print(f"   SQL: {' '.join(statement.split())}")
+                        for line in plan:
+                            print(f"     - {line}")
+                        for problem in problems:
+                            print(f"     ! {problem}")
+                else:
+                    note = " (전체 조회 허용)" if allow_full_scan else ""
+                    print(f"✅ {label}: 쿼리 {len(report)}개{note}")
+    await async_engine.dispose()
+    return 1 if failures else 0
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,86 @@
+"""
+회계용 주문 내보내기
+
+주문(orders), 주문 항목(order_items), 일별 판매(sales_daily)를 CSV 또는 NDJSON 파일로 내보냅니다.
+서버 측 커서에서 EXPORT_CHUNK_SIZE 행씩 읽어 바로 파일에 쓰므로 한 달치 전체 주문도
+메모리 사용량이 일정하며, 출력 파일명이 .gz 로 끝나면 gzip 으로 압축합니다.
+기간을 지정하지 않으면 지난달 1일 ~ 말일을 내보냅니다 (보관된 주문 포함).
+
+실행 (backend 디렉토리에서, .env 의 데이터베이스 대상):
+    python scripts/export_orders.py --dataset order_items
+    python scripts/export_orders.py --dataset orders --format ndjson --from 2026-09-01 --to 2026-09-30
+    python scripts/export_orders.py --dataset orders --output orders_202609.csv
+"""
+import argparse
+import asyncio
+import gzip
+import sys
+import time
+from datetime import date
+from pathlib import Path
+from typing import Optional
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.db.base import async_engine
+from app.services.order_export import (
+    ExportDataset, ExportFormat, export_chunks, export_filename, export_range
+)
+
+async def write_export(
+    path: Path,
+    dataset: ExportDataset,
+    fmt: ExportFormat,
+    date_from: date,
+    date_to: date,
+    session_factory=None,
+    chunk_size: Optional[int] = None
+) -> int:
+    """내보내기를 파일로 저장 후 쓴 바이트 수 반환 (.gz 이면 압축 전 크기)"""
+    written = 0
+    if path.suffix == ".gz":
+        out = gzip.open(path, "wb", compresslevel=6)  # 기본값 9 는 압축률 차이에 비해 느림
+    else:
+        out = open(path, "wb")
+    with out:
+        async for chunk in export_chunks(dataset, fmt, date_from, date_to, session_factory, chunk_size):
+            out.write(chunk)
+            written += len(chunk)
+    return written
+
+async def main(args) -> int:
+    try:
+        date_from, date_to = export_range(args.date_from, args.date_to)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return 1
+    dataset, fmt = ExportDataset(args.dataset), ExportFormat(args.format)
+
+    output = args.output or Path(export_filename(dataset, fmt, date_from, date_to) + ".gz")
+    started = time.perf_counter()
+    try:
+        written = await write_export(output, dataset, fmt, date_from, date_to)
+    except Exception as e:
+        print(f"❌ 내보내기 실패: {e}")
+        return 1
+    finally:
+        await async_engine.dispose()
+
+    print(
+        f"✅ {dataset.value} {date_from} ~ {date_to} → {output} "
+        f"({written / 1024 / 1024:.1f}MB, {time.perf_counter() - started:.1f}초)"
+    )
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="주문/주문 항목/일별 판매를 CSV 또는 NDJSON 으로 내보내기")
+    parser.add_argument("--dataset", choices=[d.value for d in ExportDataset],
+                        default=ExportDataset.ORDER_ITEMS.value, help="내보낼 데이터")
+    parser.add_argument("--format", choices=[f.value for f in ExportFormat],
+                        default=ExportFormat.CSV.value, help="파일 형식")
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, help="시작일 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, help="종료일 (YYYY-MM-DD, 포함)")
+    parser.add_argument("--output", type=Path, help="출력 파일 (기본: <dataset>_<기간>.<format>.gz)")
+    sys.exit(asyncio.run(main(parser.parse_args())))
@@ -0,0 +1,52 @@
+"""
+업로드 이미지 정리
+
+메뉴 삭제/이미지 교체로 참조 수(image_files.ref_count)가 0 이 된 뒤 IMAGE_GC_GRACE_HOURS 가 지난 이미지의
+행과 변형 디렉토리(UPLOAD_DIRECTORY/images/{해시})를 삭제합니다.
+행 없이 남은 변형 디렉토리(없는 메뉴로 업로드 등)와 임시 업로드 파일도 유예 시간이 지나면 함께 삭제합니다.
+유예 시간 안에 같은 사진을 다시 올리면 변환 없이 그대로 재사용되며, cron 등으로 하루 한 번 실행하는 것을 권장합니다.
+
+실행 (backend 디렉토리에서, .env 의 데이터베이스/업로드 디렉토리 대상):
+    python scripts/gc_images.py
+    python scripts/gc_images.py --grace-hours 1
+"""
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+# 프로젝트 루트를 Python 경로에 추가
+project_root = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.core.config import settings
+from app.db.base import AsyncSessionLocal, Base, async_engine
+from app.models import ImageFile
+from app.services.image_store import collect_garbage
+
+async def main(args) -> int:
+    async with async_engine.begin() as conn:
+        # 이미지 테이블이 없으면 생성 (앱 시작 시와 동일)
+        await conn.run_sync(Base.metadata.create_all, tables=[ImageFile.__table__])
+
+    started = time.perf_counter()
+    try:
+        removed, orphans = await collect_garbage(AsyncSessionLocal, grace_hours=args.grace_hours)
+    except Exception as e:
+        print(f"❌ 이미지 정리 실패: {e}")
+        return 1
+    finally:
+        await async_engine.dispose()
+
+    print(
+        f"✅ 참조 없는 이미지 {removed}개, 고아 파일 {orphans}개 삭제 "
+        f"({time.perf_counter() - started:.1f}초)"
+    )
+    return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="참조가 없어진 업로드 이미지 삭제")
+    parser.add_argument("--grace-hours", type=float, default=settings.IMAGE_GC_GRACE_HOURS,
+                        help="참조가 0 이 된 뒤 삭제까지 기다릴 시간")
+    sys.exit(asyncio.run(main(parser.parse_args())))